@@ -41,8 +41,18 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    """Run migrations with a connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    """Run migrations with a connection.
+
+    Each migration runs in its own transaction. Migrations that build indexes
+    with CREATE INDEX CONCURRENTLY do so inside op.get_context().autocommit_block(),
+    which commits the current transaction first; per-migration transactions keep
+    that commit from also covering earlier migrations in the same upgrade.
+    """
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,75 @@
+"""Add generated per-mode rating columns to users.
+
+Revision ID: 016_add_rating_generated_columns
+Revises: 014_add_active_games
+Create Date: 2026-02-06
+
+Denormalizes rating/games/wins for each rating mode out of the ratings JSONB
+into STORED generated columns. Postgres keeps them in sync on every write, so
+the leaderboard can filter and sort on plain integer columns instead of
+extracting and casting JSONB values per row.
+
+Each mode gets a covering leaderboard index keyed on (rating, id), matching
+the leaderboard's keyset ordering, that INCLUDEs every other selected column
+so the top-100 query can be answered with an index-only scan. The JSONB
+expression indexes from migration 007 are no longer used and are dropped.
+
+Adding STORED generated columns rewrites the users table once.
+
+Index-only scans depend on the visibility map. After deploying, run
+`VACUUM (ANALYZE) users;` and check that
+`EXPLAIN (ANALYZE, BUFFERS)` on the leaderboard query reports `Heap Fetches: 0`.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from clutchchess.db.migration_utils import add_columns, create_index_concurrently, drop_columns
+
+revision: str = "016_add_rating_generated_columns"
+down_revision: str | None = "014_add_active_games"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+MODES = ["2p_standard", "2p_lightning", "4p_standard", "4p_lightning"]
+STATS = ["rating", "games", "wins"]
+
+
+def upgrade() -> None:
+    """Add generated columns and covering leaderboard indexes on them."""
+    # One ALTER TABLE so the table is rewritten once, not once per column
+    add_columns(
+        "users",
+        *(
+            f"{stat}_{mode} INTEGER "
+            f"GENERATED ALWAYS AS (((ratings->'{mode}'->>'{stat}')::int)) STORED"
+            for mode in MODES
+            for stat in STATS
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        for mode in MODES:
+            create_index_concurrently(
+                f"idx_users_lb_{mode}",
+                f"ON users (rating_{mode} DESC NULLS LAST, id DESC) "
+                f"INCLUDE (username, picture_url, games_{mode}, wins_{mode}) "
+                f"WHERE games_{mode} > 0",
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_users_rating_{mode}")
+
+
+def downgrade() -> None:
+    """Restore the JSONB expression indexes and drop the generated columns."""
+    with op.get_context().autocommit_block():
+        for mode in MODES:
+            # Restore migration 007's index before dropping its replacement
+            create_index_concurrently(
+                f"idx_users_rating_{mode}",
+                f"ON users (((ratings->'{mode}'->>'rating')::int) DESC NULLS LAST) "
+                f"WHERE ratings ? '{mode}' "
+                f"AND (ratings->'{mode}'->>'games')::int > 0",
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_users_lb_{mode}")
+
+    drop_columns("users", *(f"{stat}_{mode}" for mode in MODES for stat in STATS))
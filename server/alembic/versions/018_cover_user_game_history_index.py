@@ -0,0 +1,59 @@
+"""Make the user match history index covering.
+
+Revision ID: 018_cover_user_game_history_index
+Revises: 016_add_rating_generated_columns
+Create Date: 2026-02-06
+
+Rebuild the (user_id, game_time DESC) index from migration 006 with
+INCLUDE (id), so queries that page through a user's history by id are
+answered with an index-only scan.
+
+game_info is deliberately not included: it is unbounded JSONB, and INCLUDE
+columns count toward the ~2.7KB btree tuple limit, so one large summary would
+make inserts into user_game_history fail. Rows returned by list_by_user()
+still fetch game_info from the heap.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from clutchchess.db.migration_utils import create_index_concurrently
+
+revision: str = "018_cover_user_game_history_index"
+down_revision: str | None = "016_add_rating_generated_columns"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace the history index with a covering one."""
+    with op.get_context().autocommit_block():
+        # Build the replacement first so history lookups are never unindexed
+        create_index_concurrently(
+            "ix_user_game_history_user_id_game_time_covering",
+            "ON user_game_history (user_id, game_time DESC) "
+            "INCLUDE (id)",
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_user_game_history_user_id_game_time"
+        )
+        op.execute("""
+            ALTER INDEX ix_user_game_history_user_id_game_time_covering
+            RENAME TO ix_user_game_history_user_id_game_time
+        """)
+
+
+def downgrade() -> None:
+    """Restore the non-covering history index."""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_user_game_history_user_id_game_time_plain",
+            "ON user_game_history (user_id, game_time DESC)",
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_user_game_history_user_id_game_time"
+        )
+        op.execute("""
+            ALTER INDEX ix_user_game_history_user_id_game_time_plain
+            RENAME TO ix_user_game_history_user_id_game_time
+        """)
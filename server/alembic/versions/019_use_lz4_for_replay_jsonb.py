@@ -0,0 +1,66 @@
+"""Compress legacy replay JSONB with LZ4.
+
+Revision ID: 019_use_lz4_for_replay_jsonb
+Revises: 018_cover_user_game_history_index
+Create Date: 2026-02-06
+
+Legacy replays in game_history are large, repetitive move logs. LZ4 (PG14+)
+decompresses several times faster than the default pglz, which makes loading
+them cheaper. user_game_history.game_info is switched as well.
+
+SET COMPRESSION only applies to newly written values, so existing rows are
+rewritten in id-range batches, each committed on its own. Round-tripping
+through text builds a fresh JSONB value whatever its type (object, array or
+scalar); `SET replay = replay` would reuse the old pglz-compressed datum as-is.
+
+Verify with: SELECT pg_column_compression(replay) FROM game_history LIMIT 5;
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "019_use_lz4_for_replay_jsonb"
+down_revision: str | None = "018_cover_user_game_history_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column) pairs to switch to LZ4
+COLUMNS = [("game_history", "replay"), ("user_game_history", "game_info")]
+
+BATCH_SIZE = 5000
+BATCH_STATEMENT_TIMEOUT = "20s"
+
+
+def _set_compression(method: str) -> None:
+    """Set the column compression and recompress existing rows in batches."""
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method}")
+
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text(f"SET statement_timeout = '{BATCH_STATEMENT_TIMEOUT}'"))
+        for table, column in COLUMNS:
+            min_id, max_id = conn.execute(
+                sa.text(f"SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM {table}")
+            ).one()
+            recompress = sa.text(f"""
+                UPDATE {table}
+                SET {column} = {column}::text::jsonb
+                WHERE id >= :lo AND id < :hi
+            """)
+            for lo in range(min_id, max_id + 1, BATCH_SIZE):
+                conn.execute(recompress, {"lo": lo, "hi": lo + BATCH_SIZE})
+        conn.execute(sa.text("RESET statement_timeout"))
+
+
+def upgrade() -> None:
+    """Switch replay JSONB columns to LZ4 and recompress existing rows."""
+    _set_compression("lz4")
+
+
+def downgrade() -> None:
+    """Switch replay JSONB columns back to pglz."""
+    _set_compression("pglz")
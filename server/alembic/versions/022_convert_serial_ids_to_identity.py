@@ -0,0 +1,77 @@
+"""Convert BIGSERIAL primary keys to identity columns.
+
+Revision ID: 022_convert_serial_ids_to_identity
+Revises: 019_use_lz4_for_replay_jsonb
+Create Date: 2026-02-06
+
+lobbies, lobby_players, replay_likes and campaign_progress are created by
+migrations 003, 008 and 011 with BIGSERIAL ids (a column default pointing at
+a separately owned sequence). This converts them to
+BIGINT GENERATED ALWAYS AS IDENTITY, so fresh and existing databases both
+reach the identity schema through this revision. Tables whose id is already
+an identity column are skipped.
+
+Each converted identity sequence is restarted after the current MAX(id).
+Downgrade restores the serial default and its owned sequence, continuing
+after the current MAX(id).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "022_convert_serial_ids_to_identity"
+down_revision: str | None = "019_use_lz4_for_replay_jsonb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ["lobbies", "lobby_players", "replay_likes", "campaign_progress"]
+
+
+def upgrade() -> None:
+    """Replace serial defaults with identity columns."""
+    for table in TABLES:
+        op.execute(f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = 'id'
+                      AND is_identity = 'NO'
+                ) THEN
+                    SELECT COALESCE(MAX(id), 0) + 1 INTO next_id FROM {table};
+                    ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+                    DROP SEQUENCE IF EXISTS {table}_id_seq;
+                    ALTER TABLE {table} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY;
+                    EXECUTE format(
+                        'ALTER TABLE {table} ALTER COLUMN id RESTART WITH %s', next_id
+                    );
+                END IF;
+            END $$;
+        """)
+
+
+def downgrade() -> None:
+    """Restore serial defaults in place of the identity columns."""
+    for table in TABLES:
+        op.execute(f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = 'id'
+                      AND is_identity = 'YES'
+                ) THEN
+                    SELECT COALESCE(MAX(id), 0) + 1 INTO next_id FROM {table};
+                    ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY;
+                    CREATE SEQUENCE {table}_id_seq AS bigint OWNED BY {table}.id;
+                    PERFORM setval('{table}_id_seq', next_id, false);
+                    ALTER TABLE {table}
+                        ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq');
+                END IF;
+            END $$;
+        """)
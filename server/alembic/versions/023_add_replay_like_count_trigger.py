@@ -0,0 +1,69 @@
+"""Maintain game_replays.like_count with a trigger on replay_likes.
+
+Revision ID: 023_add_replay_like_count_trigger
+Revises: 022_convert_serial_ids_to_identity
+Create Date: 2026-02-06
+
+Previously every like/unlike was an INSERT/DELETE on replay_likes followed by
+a separate UPDATE of game_replays.like_count from the application. A row
+trigger keeps the counter in step with replay_likes in the same statement,
+so the application writes only to replay_likes and the count also stays
+correct for rows changed outside the app.
+
+Also replaces ix_replay_likes_user_id with (user_id, replay_id) so a user's
+likes can be listed from the index alone.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from clutchchess.db.migration_utils import create_index_concurrently
+
+revision: str = "023_add_replay_like_count_trigger"
+down_revision: str | None = "022_convert_serial_ids_to_identity"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the like_count trigger and the composite user index."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_replay_like_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE game_replays SET like_count = like_count + 1
+                WHERE id = NEW.replay_id;
+            ELSE
+                -- Never let the counter go below zero
+                UPDATE game_replays SET like_count = GREATEST(like_count - 1, 0)
+                WHERE id = OLD.replay_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_replay_likes_count
+        AFTER INSERT OR DELETE ON replay_likes
+        FOR EACH ROW EXECUTE FUNCTION bump_replay_like_count()
+    """)
+
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_replay_likes_user_id_replay_id",
+            "ON replay_likes (user_id, replay_id)",
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_replay_likes_user_id")
+
+
+def downgrade() -> None:
+    """Drop the trigger and restore the single-column user index."""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_replay_likes_user_id",
+            "ON replay_likes (user_id)",
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_replay_likes_user_id_replay_id")
+
+    op.execute("DROP TRIGGER IF EXISTS trg_replay_likes_count ON replay_likes")
+    op.execute("DROP FUNCTION IF EXISTS bump_replay_like_count()")
@@ -0,0 +1,58 @@
+"""Replace public lobby indexes with a partial index.
+
+Revision ID: 024_partial_public_lobbies_index
+Revises: 023_add_replay_like_count_trigger
+Create Date: 2026-02-06
+
+ix_lobbies_is_public (migration 003) indexes a boolean that matches about
+half the table, so the planner never picks it; it only slows down inserts.
+The lobby browser query is "public lobbies still waiting, newest first",
+which a partial index on created_at answers directly with an ordered scan.
+It replaces the (is_public, status, created_at) composite from migration 004.
+
+Check with:
+    EXPLAIN ANALYZE SELECT * FROM lobbies
+    WHERE is_public AND status = 'waiting' ORDER BY created_at DESC LIMIT 20;
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from clutchchess.db.migration_utils import create_index_concurrently
+
+revision: str = "024_partial_public_lobbies_index"
+down_revision: str | None = "023_add_replay_like_count_trigger"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the partial index and drop the ones it replaces."""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_lobbies_public_waiting_partial",
+            "ON lobbies (created_at DESC) "
+            "WHERE is_public AND status = 'waiting'",
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lobbies_public_waiting")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lobbies_is_public")
+        op.execute(
+            "ALTER INDEX ix_lobbies_public_waiting_partial RENAME TO ix_lobbies_public_waiting"
+        )
+
+
+def downgrade() -> None:
+    """Restore the boolean and composite indexes."""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_lobbies_public_waiting_composite",
+            "ON lobbies (is_public, status, created_at)",
+        )
+        create_index_concurrently(
+            "ix_lobbies_is_public",
+            "ON lobbies (is_public)",
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lobbies_public_waiting")
+        op.execute(
+            "ALTER INDEX ix_lobbies_public_waiting_composite RENAME TO ix_lobbies_public_waiting"
+        )
@@ -0,0 +1,74 @@
+"""Convert any remaining legacy-format ratings in batches.
+
+Revision ID: 025_batch_convert_legacy_ratings
+Revises: 024_partial_public_lobbies_index
+Create Date: 2026-02-07
+
+Migration 005 rewrote {"standard": ..., "lightning": ...} ratings to the
+per-mode format with a single UPDATE over the whole users table. Rows can
+still show up in the old format (restored backups, app instances on the old
+release during a rolling deploy), and a single UPDATE holds row locks on
+every matching user until it commits.
+
+This revision does the same conversion in id-range batches, each committed
+on its own and bounded by a statement timeout, so a large table never sits
+behind one long transaction. On a database where 005 already converted
+everything it matches no rows and is a no-op.
+
+Downgrade is a no-op: the converted rows are in the current format, and
+reverting the format is 005's downgrade.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "025_batch_convert_legacy_ratings"
+down_revision: str | None = "024_partial_public_lobbies_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BATCH_SIZE = 5000
+BATCH_STATEMENT_TIMEOUT = "20s"
+
+CONVERT_RATINGS_BATCH = sa.text("""
+    UPDATE users
+    SET ratings = jsonb_build_object(
+        '2p_standard', jsonb_build_object(
+            'rating', COALESCE((ratings->>'standard')::int, 1200),
+            'games', 0,
+            'wins', 0
+        ),
+        '2p_lightning', jsonb_build_object(
+            'rating', COALESCE((ratings->>'lightning')::int, 1200),
+            'games', 0,
+            'wins', 0
+        ),
+        '4p_standard', jsonb_build_object('rating', 1200, 'games', 0, 'wins', 0),
+        '4p_lightning', jsonb_build_object('rating', 1200, 'games', 0, 'wins', 0)
+    )
+    WHERE id >= :lo AND id < :hi
+      AND ratings != '{}'::jsonb
+      AND ratings ? 'standard'
+""")
+
+
+def upgrade() -> None:
+    """Convert legacy-format ratings one committed id range at a time."""
+    conn = op.get_bind()
+    min_id, max_id = conn.execute(
+        sa.text("SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM users")
+    ).one()
+
+    with op.get_context().autocommit_block():
+        # Bound each batch so a stuck one fails the deploy instead of stalling it
+        conn.execute(sa.text(f"SET statement_timeout = '{BATCH_STATEMENT_TIMEOUT}'"))
+        for lo in range(min_id, max_id + 1, BATCH_SIZE):
+            conn.execute(CONVERT_RATINGS_BATCH, {"lo": lo, "hi": lo + BATCH_SIZE})
+        conn.execute(sa.text("RESET statement_timeout"))
+
+
+def downgrade() -> None:
+    """Nothing to undo; 005's downgrade restores the legacy format."""
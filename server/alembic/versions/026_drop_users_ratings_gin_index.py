@@ -0,0 +1,40 @@
+"""Drop the unused GIN index on users.ratings.
+
+Revision ID: 026_drop_users_ratings_gin_index
+Revises: 025_batch_convert_legacy_ratings
+Create Date: 2026-02-07
+
+Migration 005 added idx_users_ratings_gin for JSONB containment queries, but
+nothing queries ratings with @> or ?; leaderboards read the generated rating
+columns from migration 016 and everything else loads ratings by user id.
+Every rating update still has to maintain the GIN entries for the whole
+document.
+
+The drop runs CONCURRENTLY so it does not take an ACCESS EXCLUSIVE lock on
+users, and the downgrade rebuilds the index CONCURRENTLY for the same reason.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from clutchchess.db.migration_utils import create_index_concurrently
+
+revision: str = "026_drop_users_ratings_gin_index"
+down_revision: str | None = "025_batch_convert_legacy_ratings"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Drop the GIN index without blocking writes to users."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_users_ratings_gin")
+
+
+def downgrade() -> None:
+    """Rebuild the GIN index without blocking writes to users."""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "idx_users_ratings_gin",
+            "ON users USING gin(ratings)",
+        )
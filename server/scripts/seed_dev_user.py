@@ -22,7 +22,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from clutchchess.db.models import User
-from clutchchess.db.session import async_session_factory, engine
+from clutchchess.db.session import async_session_factory
 
 
 DEV_USER_ID = 1
@@ -72,12 +72,30 @@ async def seed_dev_user() -> None:
 
 
 async def reset_sequence() -> None:
-    """Reset the user ID sequence to avoid conflicts."""
-    async with engine.begin() as conn:
-        # Ensure the sequence is ahead of any manually inserted IDs
-        await conn.execute(
-            text("SELECT setval('users_id_seq', GREATEST(COALESCE((SELECT MAX(id) FROM users), 0), 1))")
+    """Move the user ID sequence past any manually inserted IDs.
+
+    Only calls setval() when the sequence would otherwise hand out an ID that
+    is already taken, so repeat runs don't write to the sequence.
+    """
+    async with async_session_factory() as session:
+        await session.execute(
+            text("""
+                DO $$
+                DECLARE
+                    max_id bigint;
+                    last_issued bigint;
+                BEGIN
+                    SELECT COALESCE(MAX(id), 0) INTO max_id FROM users;
+                    -- Before the first nextval(), last_value itself is the next ID
+                    SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END
+                    INTO last_issued FROM users_id_seq;
+                    IF last_issued < max_id THEN
+                        PERFORM setval('users_id_seq', max_id);
+                    END IF;
+                END $$;
+            """)
         )
+        await session.commit()
 
 
 async def main() -> None:
@@ -1,7 +1,30 @@
 """AI system."""
 
-from clutchchess.ai.arrival_field import ArrivalData, ArrivalField
-from clutchchess.ai.kungfu_ai import KungFuAI
-from clutchchess.ai.tactics import capture_value, move_safety
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from clutchchess.ai.arrival_field import ArrivalData, ArrivalField
+    from clutchchess.ai.kungfu_ai import KungFuAI
+    from clutchchess.ai.tactics import capture_value, move_safety
+
+# Public name -> defining submodule, resolved on first access (see
+# clutchchess.game) so importing e.g. clutchchess.ai.base stays cheap.
+_EXPORTS = {
+    "ArrivalData": "arrival_field",
+    "ArrivalField": "arrival_field",
+    "KungFuAI": "kungfu_ai",
+    "capture_value": "tactics",
+    "move_safety": "tactics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["ArrivalData", "ArrivalField", "KungFuAI", "capture_value", "move_safety"]
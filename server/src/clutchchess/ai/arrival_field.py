@@ -21,11 +21,13 @@ INF_TICKS = 999_999
 # Reaction time: how long it takes to see an incoming threat and issue
 # a dodge move after cooldown expires. 100ms converted to ticks.
 REACTION_TIME_SECONDS = 1.0
+_REACTION_TICKS = int(REACTION_TIME_SECONDS * TICK_RATE_HZ)
 
 # Direction constants for piece movement
 _ROOK_DIRS = ((0, 1), (0, -1), (1, 0), (-1, 0))
 _BISHOP_DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
 _QUEEN_DIRS = _ROOK_DIRS + _BISHOP_DIRS
+_SLIDER_TYPES = frozenset((PieceType.ROOK, PieceType.BISHOP, PieceType.QUEEN))
 _KNIGHT_OFFSETS = (
     (-2, -1), (-2, 1), (-1, -2), (-1, 2),
     (1, -2), (1, 2), (2, -1), (2, 1),
@@ -62,6 +64,11 @@ class ArrivalData:
     _occupied: set[tuple[int, int]] = field(default_factory=set)
     _enemy_pieces: list[AIPiece] = field(default_factory=list)
     _is_4p: bool = False
+    # (square, excluded piece id) -> best idle enemy arrival on _occupied.
+    # Derived purely from the fields above, so it is safe to share.
+    _idle_time_cache: dict[tuple[tuple[int, int], str | None], int] = field(
+        default_factory=dict, repr=False,
+    )
 
     def get_our_time(self, row: int, col: int) -> int:
         """Get our minimum arrival time at a square."""
@@ -96,17 +103,33 @@ class ArrivalData:
         """Recompute enemy arrival at (row, col) with unblocked_pos removed from occupancy.
 
         This handles the case where our piece vacating its square unblocks
-        an enemy slider ray. Only recomputes for idle enemy sliders that
-        could benefit from the unblocked position.
+        an enemy slider ray. Freeing a square can only shorten arrivals, and
+        only for sliders whose path to (row, col) runs through it, so the
+        result is the best arrival on the unchanged board (memoized per
+        square) improved by re-running just those sliders.
         """
-        modified_occupied = self._occupied - {unblocked_pos}
-        best = INF_TICKS
+        square = (row, col)
+        best = self._idle_enemy_time(square, exclude_piece_id)
+        modified_occupied: set[tuple[int, int]] | None = None
+        idle_ids: set[str] = set()
 
         for ep in self._enemy_pieces:
+            idle_ids.add(ep.piece.id)
             if exclude_piece_id and ep.piece.id == exclude_piece_id:
                 continue
+            if ep.piece.type not in _SLIDER_TYPES:
+                continue
+            # Arrival never beats the piece's own cooldown, so a piece whose
+            # cooldown alone already matches the best time can't improve it
+            if ep.cooldown_remaining >= best:
+                continue
+            pr, pc = ep.piece.grid_position
+            if not _lies_between(pr, pc, row, col, unblocked_pos):
+                continue
+            if modified_occupied is None:
+                modified_occupied = self._occupied - {unblocked_pos}
             t = _piece_arrival_time(
-                ep, (row, col), self.tps, modified_occupied, self._is_4p,
+                ep, square, self.tps, modified_occupied, self._is_4p,
             )
             if t < best:
                 best = t
@@ -116,15 +139,38 @@ class ArrivalData:
         for pid, times in self.enemy_time_by_piece.items():
             if exclude_piece_id and pid == exclude_piece_id:
                 continue
-            # Skip idle pieces — already recomputed above
-            if any(ep.piece.id == pid for ep in self._enemy_pieces):
+            # Skip idle pieces — already covered above
+            if pid in idle_ids:
                 continue
-            t = times.get((row, col), INF_TICKS)
+            t = times.get(square, INF_TICKS)
             if t < best:
                 best = t
 
         return best
 
+    def _idle_enemy_time(
+        self, square: tuple[int, int], exclude_piece_id: str | None,
+    ) -> int:
+        """Best idle enemy arrival at square on the stored occupancy (memoized)."""
+        key = (square, exclude_piece_id)
+        best = self._idle_time_cache.get(key)
+        if best is not None:
+            return best
+
+        best = INF_TICKS
+        for ep in self._enemy_pieces:
+            if exclude_piece_id and ep.piece.id == exclude_piece_id:
+                continue
+            if ep.cooldown_remaining >= best:
+                continue
+            t = _piece_arrival_time(
+                ep, square, self.tps, self._occupied, self._is_4p,
+            )
+            if t < best:
+                best = t
+        self._idle_time_cache[key] = best
+        return best
+
     def post_arrival_safety(
         self, row: int, col: int, travel_ticks: int,
         exclude_piece_id: str | None = None,
@@ -212,46 +258,50 @@ class ArrivalField:
                 (r, c) for r in range(h) for c in range(w)
             ]
 
-        # Build static occupancy for slider blocking
+        # One pass splits pieces into the static occupancy used for slider
+        # blocking, each side's stationary pieces, and traveling enemies
         occupied: set[tuple[int, int]] = set()
+        own_pieces: list[AIPiece] = []
+        enemy_pieces: list[AIPiece] = []
+        traveling_enemies: list[AIPiece] = []
+        ai_player = ai_state.ai_player
         for ap in ai_state.pieces:
-            if ap.status != PieceStatus.TRAVELING and not ap.piece.captured:
-                occupied.add(ap.piece.grid_position)
-
-        own_pieces = [
-            p for p in ai_state.get_own_pieces()
-            if p.status != PieceStatus.TRAVELING and not p.piece.captured
-        ]
-        enemy_pieces = [
-            p for p in ai_state.get_enemy_pieces()
-            if p.status != PieceStatus.TRAVELING and not p.piece.captured
-        ]
+            if ap.piece.captured:
+                continue
+            if ap.status == PieceStatus.TRAVELING:
+                if ap.piece.player != ai_player:
+                    traveling_enemies.append(ap)
+                continue
+            occupied.add(ap.piece.grid_position)
+            if ap.piece.player == ai_player:
+                own_pieces.append(ap)
+            else:
+                enemy_pieces.append(ap)
 
         is_4p = w > 8
 
         our_time = _compute_side_times(own_pieces, squares, tps, occupied, is_4p, h, w)
 
         # Compute per-piece enemy times (for exclusion during capture analysis)
-        # Uses piece-first enumeration for efficiency
-        valid_squares = set(squares)
+        # Uses piece-first enumeration for efficiency. enemy_time is keyed by
+        # exactly the valid squares, so one get() both filters and compares.
         enemy_time_by_piece: dict[str, dict[tuple[int, int], int]] = {}
-        enemy_time: dict[tuple[int, int], int] = {sq: INF_TICKS for sq in squares}
+        enemy_time: dict[tuple[int, int], int] = dict.fromkeys(squares, INF_TICKS)
 
         for ep in enemy_pieces:
             piece_times: dict[tuple[int, int], int] = {}
             for sq, t in _enumerate_piece_arrivals(ep, tps, occupied, is_4p, h, w):
-                if sq in valid_squares:
+                current = enemy_time.get(sq)
+                if current is not None:
                     piece_times[sq] = t
-                    if t < enemy_time[sq]:
+                    if t < current:
                         enemy_time[sq] = t
             enemy_time_by_piece[ep.piece.id] = piece_times
 
         # Account for traveling enemy pieces: they will arrive at squares
         # along their remaining path. These are already committed moves
         # that WILL happen — ignoring them is a critical safety blind spot.
-        for ep in ai_state.get_enemy_pieces():
-            if ep.status != PieceStatus.TRAVELING or ep.piece.captured:
-                continue
+        for ep in traveling_enemies:
             if ep.travel_direction is None:
                 continue
 
@@ -276,15 +326,13 @@ class ArrivalField:
 
             enemy_time_by_piece[ep.piece.id] = piece_times
 
-        reaction_ticks = int(REACTION_TIME_SECONDS * TICK_RATE_HZ)
-
         return ArrivalData(
             our_time=our_time,
             enemy_time=enemy_time,
             enemy_time_by_piece=enemy_time_by_piece,
             tps=tps,
             cd_ticks=cd_ticks,
-            reaction_ticks=reaction_ticks,
+            reaction_ticks=_REACTION_TICKS,
             _occupied=occupied,
             _enemy_pieces=enemy_pieces,
             _is_4p=is_4p,
@@ -306,13 +354,13 @@ def _compute_side_times(
     and update times. This is O(pieces × avg_reachable) instead of
     O(squares × pieces), reducing work from ~1024 to ~150 per side.
     """
-    # Convert to set for O(1) lookup
-    valid_squares = set(squares)
-    times: dict[tuple[int, int], int] = {sq: INF_TICKS for sq in squares}
+    # Keyed by exactly the valid squares, so one get() both filters and compares
+    times: dict[tuple[int, int], int] = dict.fromkeys(squares, INF_TICKS)
 
     for piece in pieces:
         for sq, t in _enumerate_piece_arrivals(piece, tps, occupied, is_4p, board_h, board_w):
-            if sq in valid_squares and t < times[sq]:
+            current = times.get(sq)
+            if current is not None and t < current:
                 times[sq] = t
 
     return times
@@ -535,13 +583,29 @@ def _is_path_clear_diagonal(
     return True
 
 
+def _lies_between(
+    pr: int, pc: int, tr: int, tc: int,
+    square: tuple[int, int],
+) -> bool:
+    """Check if square is strictly between (pr, pc) and (tr, tc) on a rank, file or diagonal."""
+    dr, dc = tr - pr, tc - pc
+    steps = max(abs(dr), abs(dc))
+    if steps < 2 or (dr and dc and abs(dr) != abs(dc)):
+        return False
+    sr, sc = square
+    k = max(abs(sr - pr), abs(sc - pc))
+    if not 0 < k < steps:
+        return False
+    return sr == pr + (dr // steps) * k and sc == pc + (dc // steps) * k
+
+
 def _knight_time(
     pr: int, pc: int, tr: int, tc: int,
     tps: int, base_delay: int,
 ) -> int:
     """Arrival time for a knight (1-hop only, 2-hop is too slow to be tactically relevant)."""
-    dr, dc = abs(tr - pr), abs(tc - pc)
-    if (dr, dc) in ((1, 2), (2, 1)):
+    # |dr| * |dc| == 2 only for (1, 2) and (2, 1): exactly the knight offsets
+    if abs(tr - pr) * abs(tc - pc) == 2:
         return base_delay + 2 * tps  # Knight move takes 2*tps ticks
     return INF_TICKS
 
@@ -597,14 +661,17 @@ def _pawn_time(
     return INF_TICKS
 
 
-# Forward direction per player (indexed by player-1 for 0-based access).
+# Forward direction per player, indexed directly by player number. Index 0
+# is the fallback for unknown players.
 # 2-player: P1 bottom (up), P2 top (down).
 # 4-player: matches FOUR_PLAYER_ORIENTATIONS in moves.py.
 _PAWN_FORWARD_2P: tuple[tuple[int, int], ...] = (
+    (-1, 0),  # Fallback: Up
     (-1, 0),  # Player 1: Up
     (1, 0),   # Player 2: Down
 )
 _PAWN_FORWARD_4P: tuple[tuple[int, int], ...] = (
+    (-1, 0),  # Fallback: Up
     (0, -1),  # Player 1: Left (East player)
     (-1, 0),  # Player 2: Up (South player)
     (0, 1),   # Player 3: Right (West player)
@@ -614,32 +681,30 @@ _PAWN_FORWARD_4P: tuple[tuple[int, int], ...] = (
 
 def _pawn_forward(player: int, is_4p: bool = False) -> tuple[int, int]:
     """Get pawn forward direction for a player."""
-    idx = player - 1
-    if is_4p:
-        return _PAWN_FORWARD_4P[idx] if 0 <= idx < 4 else (-1, 0)
-    return _PAWN_FORWARD_2P[idx] if 0 <= idx < 2 else (-1, 0)
+    table = _PAWN_FORWARD_4P if is_4p else _PAWN_FORWARD_2P
+    return table[player] if 0 < player < len(table) else table[0]
 
 
 def _get_critical_squares(ai_state: AIState) -> list[tuple[int, int]]:
     """Get critical squares for 4-player mode: king zones + center."""
-    squares: set[tuple[int, int]] = set()
     w, h = ai_state.board_width, ai_state.board_height
 
+    def block(r0: int, r1: int, c0: int, c1: int) -> set[tuple[int, int]]:
+        # Clamp the half-open block to the board once instead of per square
+        return {
+            (r, c)
+            for r in range(max(r0, 0), min(r1, h))
+            for c in range(max(c0, 0), min(c1, w))
+        }
+
     # Center region (4x4)
     center_r, center_c = h // 2, w // 2
-    for r in range(center_r - 2, center_r + 2):
-        for c in range(center_c - 2, center_c + 2):
-            if 0 <= r < h and 0 <= c < w:
-                squares.add((r, c))
+    squares = block(center_r - 2, center_r + 2, center_c - 2, center_c + 2)
 
-    # King zones (3x3 around each king)
+    # King zones (5x5 around each king)
     for ap in ai_state.pieces:
         if ap.piece.type == PieceType.KING and not ap.piece.captured:
             kr, kc = ap.piece.grid_position
-            for dr in range(-2, 3):
-                for dc in range(-2, 3):
-                    r, c = kr + dr, kc + dc
-                    if 0 <= r < h and 0 <= c < w:
-                        squares.add((r, c))
+            squares |= block(kr - 2, kr + 3, kc - 2, kc + 3)
 
     return list(squares)
@@ -2,12 +2,13 @@
 
 import random
 
-from clutchchess.ai.arrival_field import ArrivalField
+from clutchchess.ai.arrival_field import ArrivalData, ArrivalField
 from clutchchess.ai.eval import Eval
 from clutchchess.ai.move_gen import MoveGen
 from clutchchess.ai.state_extractor import AIState, StateExtractor
+from clutchchess.game.collision import cooldown_piece_ids
 from clutchchess.game.engine import GameEngine
-from clutchchess.game.state import TICK_RATE_HZ, GameState, Speed
+from clutchchess.game.state import TICK_RATE_HZ, GameState, Speed, SpeedConfig
 
 # Think delay ranges in seconds (min, max) by level and speed
 THINK_DELAYS: dict[int, dict[Speed, tuple[float, float]]] = {
@@ -29,17 +30,66 @@ THINK_DELAYS: dict[int, dict[Speed, tuple[float, float]]] = {
 MAX_PIECES: dict[int, int] = {1: 4, 2: 8, 3: 16}
 MAX_CANDIDATES_PER_PIECE: dict[int, int] = {1: 4, 2: 8, 3: 12}
 
+# Arrival fields kept per controller, keyed by the piece snapshot they were
+# computed from. Quiet positions often repeat across consecutive decisions.
+ARRIVAL_CACHE_MAX_SIZE = 8
+
+
+def _arrival_cache_key(
+    ai_state: AIState, config: SpeedConfig, critical_only: bool,
+) -> tuple:
+    """Everything ArrivalField.compute reads from an AIState.
+
+    Two states with the same key produce identical arrival fields, so the
+    cached ArrivalData (read-only after construction) can be shared.
+    """
+    return (
+        config.ticks_per_square,
+        config.cooldown_ticks,
+        ai_state.ai_player,
+        ai_state.board_width,
+        ai_state.board_height,
+        critical_only,
+        tuple(
+            (
+                ap.piece.id,
+                ap.piece.type,  # Promotion changes type but keeps the id
+                ap.piece.grid_position,
+                ap.piece.moved,
+                ap.status,
+                ap.cooldown_remaining,
+                ap.travel_direction,
+                ap.current_position,
+            )
+            for ap in ai_state.pieces
+        ),
+    )
+
 
 class AIController:
     """Orchestrates AI decision-making pipeline."""
 
-    def __init__(self, level: int = 1, speed: Speed = Speed.STANDARD):
+    def __init__(
+        self,
+        level: int = 1,
+        speed: Speed = Speed.STANDARD,
+        rng: random.Random | None = None,
+    ):
         self.level = min(max(level, 1), 3)
         self.speed = speed
+        self._rng = rng or random.Random()
+        # Per-level tuning, resolved once instead of on every decision
+        self._max_pieces = MAX_PIECES.get(self.level, 2)
+        self._max_candidates = MAX_CANDIDATES_PER_PIECE.get(self.level, 4)
+        min_s, max_s = THINK_DELAYS.get(self.level, {}).get(speed, (0.0, 4.0))
+        # Think delay bounds in ticks (upper bound exclusive, like int(uniform))
+        min_ticks = int(min_s * TICK_RATE_HZ)
+        self._delay_ticks = (min_ticks, max(int(max_s * TICK_RATE_HZ), min_ticks + 1))
         self.last_move_tick: int = -9999  # Tick of last move
         self.think_delay_ticks: int = 0  # Current think delay in ticks
         self._cached_ai_state: AIState | None = None
         self._cached_tick: int = -1
+        self._arrival_cache: dict[tuple, ArrivalData] = {}
         self._roll_think_delay()
 
     def should_move(self, state: GameState, player: int, current_tick: int) -> bool:
@@ -50,11 +100,12 @@ class AIController:
             return False
 
         # Quick check: any idle pieces? Avoids full state extraction.
+        # active_moves and cooldowns are lists of records, so collect the
+        # busy piece ids into a set first.
+        busy = {m.piece_id for m in state.active_moves}
+        busy |= cooldown_piece_ids(state.cooldowns, current_tick)
         has_idle = any(
-            not p.captured
-            and p.player == player
-            and p.id not in state.active_moves
-            and p.id not in state.cooldowns
+            not p.captured and p.player == player and p.id not in busy
             for p in state.board.pieces
         )
         if not has_idle:
@@ -97,8 +148,8 @@ class AIController:
         arrival_data = None
         if ai_state.speed_config is not None:
             critical_only = ai_state.board_width > 8  # 4-player boards
-            arrival_data = ArrivalField.compute(
-                ai_state, ai_state.speed_config, critical_only=critical_only,
+            arrival_data = self._get_arrival_data(
+                ai_state, ai_state.speed_config, critical_only,
             )
 
         # Generate candidates
@@ -106,10 +157,11 @@ class AIController:
             state,
             ai_state,
             player,
-            max_pieces=MAX_PIECES.get(self.level, 2),
-            max_candidates_per_piece=MAX_CANDIDATES_PER_PIECE.get(self.level, 4),
+            max_pieces=self._max_pieces,
+            max_candidates_per_piece=self._max_candidates,
             level=self.level,
             arrival_data=arrival_data,
+            rng=self._rng,
         )
 
         if not candidates:
@@ -118,7 +170,7 @@ class AIController:
         # Score and select
         scored = Eval.score_candidates(
             candidates, ai_state, noise=True,
-            level=self.level, arrival_data=arrival_data,
+            level=self.level, arrival_data=arrival_data, rng=self._rng,
         )
 
         if not scored:
@@ -132,9 +184,22 @@ class AIController:
 
         return (best_move.piece_id, best_move.to_row, best_move.to_col)
 
+    def _get_arrival_data(
+        self, ai_state: AIState, config: SpeedConfig, critical_only: bool,
+    ) -> ArrivalData:
+        """Compute arrival fields, reusing a cached result for an identical snapshot."""
+        key = _arrival_cache_key(ai_state, config, critical_only)
+        cached = self._arrival_cache.get(key)
+        if cached is not None:
+            return cached
+
+        arrival_data = ArrivalField.compute(ai_state, config, critical_only=critical_only)
+        if len(self._arrival_cache) >= ARRIVAL_CACHE_MAX_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._arrival_cache[next(iter(self._arrival_cache))]
+        self._arrival_cache[key] = arrival_data
+        return arrival_data
+
     def _roll_think_delay(self) -> None:
         """Roll a new random think delay."""
-        delays = THINK_DELAYS.get(self.level, {})
-        min_s, max_s = delays.get(self.speed, (0.0, 4.0))
-        delay_seconds = random.uniform(min_s, max_s)
-        self.think_delay_ticks = int(delay_seconds * TICK_RATE_HZ)
+        self.think_delay_ticks = self._rng.randrange(*self._delay_ticks)
@@ -19,21 +19,23 @@ MOVE_INTERVAL_SECONDS = {
 class DummyAI(AIPlayer):
     """AI that makes random valid moves at random intervals."""
 
-    def __init__(self, speed: Speed = Speed.STANDARD):
+    def __init__(self, speed: Speed = Speed.STANDARD, rng: random.Random | None = None):
         """Initialize the dummy AI.
 
         Args:
             speed: Game speed, used to determine move frequency.
                    Standard: ~1 move every 4 seconds
                    Lightning: ~1 move every 2 seconds
+            rng: Random source (a private unseeded instance by default)
         """
         interval = MOVE_INTERVAL_SECONDS.get(speed, 4.0)
         ticks_between_moves = interval * TICK_RATE_HZ
         self.move_probability = 1.0 / ticks_between_moves
+        self._rng = rng or random.Random()
 
     def should_move(self, state: GameState, player: int, current_tick: int) -> bool:
         """Randomly decide whether to move this tick."""
-        return random.random() < self.move_probability
+        return self._rng.random() < self.move_probability
 
     def get_move(self, state: GameState, player: int) -> tuple[str, int, int] | None:
         """Return a random legal move."""
@@ -42,5 +44,5 @@ class DummyAI(AIPlayer):
             return None
 
         # Pick a random move
-        piece_id, to_row, to_col = random.choice(legal_moves)
+        piece_id, to_row, to_col = self._rng.choice(legal_moves)
         return (piece_id, to_row, to_col)
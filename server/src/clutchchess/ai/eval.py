@@ -57,6 +57,7 @@ class Eval:
         noise: bool = True,
         level: int = 1,
         arrival_data: ArrivalData | None = None,
+        rng: random.Random | None = None,
     ) -> list[tuple[CandidateMove, float]]:
         """Score all candidate moves and return sorted (best first).
 
@@ -70,6 +71,7 @@ class Eval:
             noise: Whether to apply weighted selection (imperfection)
             level: AI difficulty level (affects scoring terms)
             arrival_data: Arrival fields for margin-based scoring (L2+)
+            rng: Random source for weighted selection (the global one by default)
 
         Returns:
             List of (move, score) sorted by selection order (best first)
@@ -96,7 +98,7 @@ class Eval:
 
         # Apply weighted selection to reorder
         if noise and len(scored) > 1:
-            scored = _weighted_select(scored, level)
+            scored = _weighted_select(scored, level, rng)
 
         return scored
 
@@ -104,6 +106,7 @@ class Eval:
 def _weighted_select(
     scored: list[tuple[CandidateMove, float]],
     level: int,
+    rng: random.Random | None = None,
 ) -> list[tuple[CandidateMove, float]]:
     """Select a move from the top candidates using rank-based weights.
 
@@ -116,7 +119,8 @@ def _weighted_select(
     top = scored[:max_choices]
 
     w = weights[:len(top)]
-    chosen = random.choices(top, weights=w, k=1)[0]
+    choices = rng.choices if rng is not None else random.choices
+    chosen = choices(top, weights=w, k=1)[0]
 
     # Put chosen first, then the rest in original score order
     result = [chosen]
@@ -1,5 +1,7 @@
 """KungFuAI — heuristic-based AI implementing the AIPlayer interface."""
 
+import random
+
 from clutchchess.ai.base import AIPlayer
 from clutchchess.ai.controller import AIController
 from clutchchess.game.state import GameState, Speed
@@ -14,10 +16,15 @@ class KungFuAI(AIPlayer):
     - Level 3 (Advanced): Dodgeability, recapture positioning
     """
 
-    def __init__(self, level: int = 1, speed: Speed = Speed.STANDARD):
+    def __init__(
+        self,
+        level: int = 1,
+        speed: Speed = Speed.STANDARD,
+        rng: random.Random | None = None,
+    ):
         self.level = level
         self.speed = speed
-        self.controller = AIController(level=level, speed=speed)
+        self.controller = AIController(level=level, speed=speed, rng=rng)
 
     def should_move(self, state: GameState, player: int, current_tick: int) -> bool:
         """Check if AI should attempt a move this tick."""
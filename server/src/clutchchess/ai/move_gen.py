@@ -68,6 +68,7 @@ class MoveGen:
         max_candidates_per_piece: int = 4,
         level: int = 1,
         arrival_data: ArrivalData | None = None,
+        rng: random.Random | None = None,
     ) -> list[CandidateMove]:
         """Generate candidate moves for AI.
 
@@ -82,6 +83,7 @@ class MoveGen:
             max_candidates_per_piece: Max candidates per piece
             level: AI difficulty level (affects pruning/evasion)
             arrival_data: Arrival fields for margin-based decisions (L2+)
+            rng: Random source for piece order (the global one by default)
 
         Returns:
             List of candidate moves
@@ -105,6 +107,7 @@ class MoveGen:
             moves_by_piece.setdefault(piece_id, []).append((to_row, to_col))
 
         # Prioritize threatened pieces for evasion
+        shuffle = rng.shuffle if rng is not None else random.shuffle
         shuffled = list(movable)
         if arrival_data is not None:
             # Sort: threatened pieces first, then shuffle within groups
@@ -116,11 +119,11 @@ class MoveGen:
                     threatened.append(p)
                 else:
                     safe.append(p)
-            random.shuffle(threatened)
-            random.shuffle(safe)
+            shuffle(threatened)
+            shuffle(safe)
             shuffled = threatened + safe
         else:
-            random.shuffle(shuffled)
+            shuffle(shuffled)
 
         candidates: list[CandidateMove] = []
         pieces_used = 0
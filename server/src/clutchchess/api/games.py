@@ -6,16 +6,12 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from clutchchess.db.repositories.active_games import ActiveGameRepository
 from clutchchess.db.repositories.replays import ReplayRepository
 from clutchchess.db.session import async_session_factory
 from clutchchess.game.board import BoardType
-from clutchchess.game.collision import (
-    get_interpolated_position,
-    is_piece_moving,
-    is_piece_on_cooldown,
-)
+from clutchchess.game.collision import cooldown_piece_ids, get_interpolated_position
 from clutchchess.game.state import Speed
+from clutchchess.redis import RedisActiveGameRepository, get_redis
 from clutchchess.services.game_registry import register_game_fire_and_forget
 from clutchchess.services.game_service import get_game_service
 from clutchchess.utils.display_name import resolve_player_info
@@ -175,18 +171,17 @@ async def list_live_games(
 ) -> LiveGamesResponse:
     """List games currently in progress.
 
-    Queries the active_games database registry, which tracks all running games
+    Queries the Redis active games registry, which tracks all running games
     across all server instances and game types (lobby, campaign, quickplay).
     """
     service = get_game_service()
 
-    async with async_session_factory() as session:
-        repo = ActiveGameRepository(session)
-        active_records = await repo.list_active(
-            speed=speed,
-            player_count=player_count,
-            game_type=game_type,
-        )
+    repo = RedisActiveGameRepository(get_redis())
+    active_records = await repo.list_active(
+        speed=speed,
+        player_count=player_count,
+        game_type=game_type,
+    )
 
     games = []
     for record in active_records:
@@ -237,10 +232,16 @@ async def get_game(game_id: str) -> dict[str, Any]:
 
     # Build piece data with interpolated positions
     pieces = []
+    move_by_piece = {m.piece_id: m for m in state.active_moves}
+    cooldown_ids = cooldown_piece_ids(state.cooldowns, state.current_tick)
     for piece in state.board.pieces:
         # Get interpolated position if moving
         pos = get_interpolated_position(
-            piece, state.active_moves, state.current_tick, config.ticks_per_square
+            piece,
+            None,
+            state.current_tick,
+            config.ticks_per_square,
+            move=move_by_piece.get(piece.id),
         )
 
         pieces.append(
@@ -251,8 +252,8 @@ async def get_game(game_id: str) -> dict[str, Any]:
                 "row": pos[0],
                 "col": pos[1],
                 "captured": piece.captured,
-                "moving": is_piece_moving(piece.id, state.active_moves),
-                "on_cooldown": is_piece_on_cooldown(piece.id, state.cooldowns, state.current_tick),
+                "moving": piece.id in move_by_piece,
+                "on_cooldown": piece.id in cooldown_ids,
                 "moved": piece.moved,
             }
         )
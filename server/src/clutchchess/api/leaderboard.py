@@ -1,21 +1,142 @@
 """Leaderboard API endpoints."""
 
+import asyncio
+import time
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from pydantic import BaseModel
-from sqlalchemy import text
+from sqlalchemy import BigInteger, Integer, TextClause, bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from clutchchess.db.session import get_db_session
-from clutchchess.game.elo import get_belt
+from clutchchess.game.elo import BELT_THRESHOLDS
 
 router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
 
 VALID_MODES = {"2p_standard", "2p_lightning", "4p_standard", "4p_lightning"}
 
 
+def _belt_case_sql(column: str) -> str:
+    """Render get_belt() as a SQL CASE expression over a rating column."""
+    whens = " ".join(
+        f"WHEN {column} >= {threshold} THEN '{belt}'" for threshold, belt in BELT_THRESHOLDS
+    )
+    return f"CASE WHEN {column} IS NULL THEN 'none' {whens} ELSE 'white' END"
+
+
+def _build_leaderboard_query(mode: str, *, after_cursor: bool = False) -> TextClause:
+    """Build a leaderboard page query for a mode against its denormalized columns.
+
+    Column names can't be bound parameters, so each mode gets its own static
+    statement. Only called with members of VALID_MODES.
+
+    Pages are ordered by (rating, id) descending so the order is total. With
+    after_cursor, the query resumes strictly after the (after_rating,
+    after_user_id) row (keyset pagination), so later pages are an index range
+    scan instead of an ever-growing OFFSET.
+
+    Postgres assembles the whole response document (including belts), so the
+    handler fetches a single text value and returns it as the body.
+    """
+    params = [bindparam("limit", type_=Integer), bindparam("start_rank", type_=Integer)]
+    cursor_filter = ""
+    if after_cursor:
+        cursor_filter = f"AND (rating_{mode}, id) < (:after_rating, :after_user_id)"
+        params += [
+            bindparam("after_rating", type_=Integer),
+            bindparam("after_user_id", type_=BigInteger),
+        ]
+    return text(f"""
+        SELECT jsonb_build_object(
+            'mode', '{mode}',
+            'entries', COALESCE(
+                jsonb_agg(
+                    jsonb_build_object(
+                        'rank', page.rank,
+                        'user_id', page.id,
+                        'username', page.username,
+                        'picture_url', page.picture_url,
+                        'rating', page.rating,
+                        'belt', {_belt_case_sql("page.rating")},
+                        'games_played', page.games_played,
+                        'wins', page.wins
+                    )
+                    ORDER BY page.rank
+                ),
+                '[]'::jsonb
+            )
+        )::text
+        FROM (
+            SELECT
+                id,
+                username,
+                picture_url,
+                rating_{mode} as rating,
+                games_{mode} as games_played,
+                wins_{mode} as wins,
+                :start_rank - 1 + row_number() OVER (
+                    ORDER BY rating_{mode} DESC NULLS LAST, id DESC
+                ) as rank
+            FROM users
+            WHERE games_{mode} > 0
+              {cursor_filter}
+            ORDER BY rating_{mode} DESC NULLS LAST, id DESC
+            LIMIT :limit
+        ) page
+    """).bindparams(*params)
+
+
+# Generated rating columns avoid JSONB extraction per row, and the covering
+# idx_users_lb_<mode> indexes allow index-only scans (both from migration 016).
+# Statements are built once at import so SQLAlchemy's compiled cache and
+# asyncpg's per-connection prepared statement cache are hit on every request.
+_LEADERBOARD_QUERIES = {mode: _build_leaderboard_query(mode) for mode in VALID_MODES}
+_LEADERBOARD_PAGE_QUERIES = {
+    mode: _build_leaderboard_query(mode, after_cursor=True) for mode in VALID_MODES
+}
+
+PAGE_SIZE = 100
+
+# Server-side cache of rendered leaderboard bodies: mode -> (cached_at, body)
+CACHE_TTL_SECONDS = 60.0
+CACHE_CONTROL = "public, max-age=60"
+_cache: dict[str, tuple[float, bytes]] = {}
+
+# Per-mode locks so only one request refreshes an expired entry
+_cache_locks: dict[str, asyncio.Lock] = {}
+
+
+def _get_cache_lock(mode: str) -> asyncio.Lock:
+    """Get or create the refresh lock for a leaderboard mode."""
+    if mode not in _cache_locks:
+        _cache_locks[mode] = asyncio.Lock()
+    return _cache_locks[mode]
+
+
+def _get_cached_body(mode: str) -> bytes | None:
+    """Return the cached response body for a mode if it has not expired."""
+    entry = _cache.get(mode)
+    if entry is not None and time.monotonic() - entry[0] < CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def clear_leaderboard_cache() -> None:
+    """Drop all cached leaderboard responses."""
+    _cache.clear()
+
+
+def _cached_response(body: bytes) -> Response:
+    """Wrap a rendered leaderboard body in a cacheable JSON response."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_CONTROL},
+    )
+
+
 class LeaderboardEntry(BaseModel):
     """Single entry in the leaderboard."""
 
@@ -39,49 +160,56 @@ class LeaderboardResponse(BaseModel):
 @router.get("", response_model=LeaderboardResponse)
 async def get_leaderboard(
     mode: str = Query(..., pattern="^(2p|4p)_(standard|lightning)$"),
+    after_rating: int | None = Query(None),
+    after_user_id: int | None = Query(None),
+    after_rank: int = Query(0, ge=0),
     db: Annotated[AsyncSession, Depends(get_db_session)] = ...,
-) -> JSONResponse:
-    """Get top 100 leaderboard for a specific rating mode.
+) -> Response:
+    """Get a page of the leaderboard for a specific rating mode.
 
-    Results are cached for 60 seconds to reduce database load.
+    The first page (top 100) is cached in-process for 60 seconds (and by
+    clients via Cache-Control) to reduce database load.
+
+    To fetch the next page, pass the last entry's rating, user_id and rank as
+    after_rating, after_user_id and after_rank.
     """
-    query = text("""
-        SELECT
-            id,
-            username,
-            picture_url,
-            (ratings->:mode->>'rating')::int as rating,
-            (ratings->:mode->>'games')::int as games_played,
-            (ratings->:mode->>'wins')::int as wins
-        FROM users
-        WHERE ratings ? :mode
-          AND (ratings->:mode->>'games')::int > 0
-        ORDER BY (ratings->:mode->>'rating')::int DESC
-        LIMIT 100
-    """)
-
-    result = await db.execute(query, {"mode": mode})
-    rows = result.fetchall()
-
-    entries = [
-        LeaderboardEntry(
-            rank=i + 1,
-            user_id=row.id,
-            username=row.username,
-            picture_url=row.picture_url,
-            rating=row.rating,
-            belt=get_belt(row.rating),
-            games_played=row.games_played,
-            wins=row.wins,
+    if (after_rating is None) != (after_user_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_rating and after_user_id must be provided together",
+        )
+
+    if after_rating is not None:
+        body = await _fetch_leaderboard_body(
+            db,
+            _LEADERBOARD_PAGE_QUERIES[mode],
+            {"after_rating": after_rating, "after_user_id": after_user_id},
+            start_rank=after_rank + 1,
         )
-        for i, row in enumerate(rows)
-    ]
-
-    response = JSONResponse(
-        content=LeaderboardResponse(
-            mode=mode,
-            entries=entries,
-        ).model_dump()
+        return _cached_response(body)
+
+    body = _get_cached_body(mode)
+    if body is not None:
+        return _cached_response(body)
+
+    async with _get_cache_lock(mode):
+        # Another request may have refreshed the entry while we waited
+        body = _get_cached_body(mode)
+        if body is None:
+            body = await _fetch_leaderboard_body(db, _LEADERBOARD_QUERIES[mode])
+            _cache[mode] = (time.monotonic(), body)
+
+    return _cached_response(body)
+
+
+async def _fetch_leaderboard_body(
+    db: AsyncSession,
+    query: TextClause,
+    params: dict[str, int] | None = None,
+    start_rank: int = 1,
+) -> bytes:
+    """Run a leaderboard page query and return the JSON body Postgres built."""
+    result = await db.execute(
+        query, {**(params or {}), "limit": PAGE_SIZE, "start_rank": start_rank}
     )
-    response.headers["Cache-Control"] = "public, max-age=60"
-    return response
+    return result.scalar_one().encode()
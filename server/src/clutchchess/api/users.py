@@ -5,10 +5,14 @@ DEV_MODE authentication bypass for local development.
 """
 
 import asyncio
+import hashlib
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, UploadFile, status
+from fastapi.responses import Response
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -26,14 +30,24 @@ from clutchchess.db.repositories.users import UserRepository
 from clutchchess.db.session import get_db_session
 from clutchchess.services.s3 import (
     ALLOWED_CONTENT_TYPES,
-    MAX_FILE_SIZE,
     S3UploadError,
     upload_profile_picture,
 )
-from clutchchess.utils.display_name import resolve_player_info_batch
+from clutchchess.utils.display_name import PlayerRef, resolve_player_info_batch
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Public profiles change rarely; let browsers reuse them briefly and
+# revalidate with the ETag afterwards
+PROFILE_CACHE_CONTROL = "public, max-age=30"
+
+# Postgres SQLSTATE for unique_violation
+UNIQUE_VIOLATION = "23505"
+
+# Profile picture uploads allowed to run in worker threads at once
+MAX_CONCURRENT_UPLOADS = 8
+_upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
 
 class PublicUserRead(BaseModel):
     """Public user profile data (excludes email and other sensitive fields)."""
@@ -46,6 +60,56 @@ class PublicUserRead(BaseModel):
     last_online: datetime
 
 
+# Users known to exist: user_id -> cached_at. Accounts are not deleted in
+# normal operation, so get_user_replays can skip its existence query while an
+# entry is fresh. Only existence is cached (never profile data such as
+# ratings), and misses are not cached so new accounts show up immediately.
+USER_EXISTS_CACHE_TTL_SECONDS = 60.0
+USER_EXISTS_CACHE_MAX_SIZE = 10_000
+_known_users: dict[int, float] = {}
+
+
+def _is_known_user(user_id: int) -> bool:
+    """Check whether a user was recently seen to exist."""
+    cached_at = _known_users.get(user_id)
+    return (
+        cached_at is not None
+        and time.monotonic() - cached_at < USER_EXISTS_CACHE_TTL_SECONDS
+    )
+
+
+def _remember_user(user_id: int) -> None:
+    """Record that a user exists, evicting the oldest entry when full."""
+    _known_users.pop(user_id, None)
+    if len(_known_users) >= USER_EXISTS_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        del _known_users[next(iter(_known_users))]
+    _known_users[user_id] = time.monotonic()
+
+
+def clear_known_users() -> None:
+    """Drop all cached user existence entries."""
+    _known_users.clear()
+
+
+def _is_username_conflict(e: IntegrityError) -> bool:
+    """Check whether an IntegrityError is a duplicate username.
+
+    On Postgres this reads the SQLSTATE and constraint name instead of the
+    (locale-dependent) message text. Other drivers fall back to the message.
+    """
+    pgcode = getattr(e.orig, "pgcode", None)
+    if pgcode is not None:
+        if pgcode != UNIQUE_VIOLATION:
+            return False
+        # asyncpg keeps the constraint name on the driver exception that
+        # SQLAlchemy's DBAPI adapter wraps
+        constraint = getattr(e.orig.__cause__, "constraint_name", None)
+        return constraint is None or "username" in constraint
+    error_str = str(e).lower()
+    return "username" in error_str or "unique" in error_str
+
+
 @router.get("/me", response_model=UserRead)
 async def get_current_user_info(
     user: Annotated[User, Depends(get_required_user_with_dev_bypass)],
@@ -74,6 +138,7 @@ async def update_current_user(
     update_data: UserUpdate,
     user: Annotated[User, Depends(get_required_user_with_dev_bypass)],
     user_manager: Annotated[UserManager, Depends(get_user_manager_dep)],
+    db: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> User:
     """Update the current user's information.
 
@@ -84,6 +149,7 @@ async def update_current_user(
         update_data: Fields to update
         user: Current authenticated user (or dev user)
         user_manager: User manager for handling updates
+        db: Database session
 
     Returns:
         Updated user data
@@ -91,13 +157,23 @@ async def update_current_user(
     Raises:
         HTTPException: 400 if username is already taken
     """
+    # Catch the common conflict with an indexed lookup instead of a failed
+    # UPDATE and rollback; the IntegrityError handler still covers races
+    if (
+        update_data.username is not None
+        and update_data.username != user.username
+        and await UserRepository(db).username_taken(update_data.username, user.id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username is already taken. Please choose another.",
+        )
+
     try:
         updated_user = await user_manager.update(update_data, user)
         return updated_user
     except IntegrityError as e:
-        # Check if this is a username conflict
-        error_str = str(e).lower()
-        if "username" in error_str or "unique" in error_str:
+        if _is_username_conflict(e):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username is already taken. Please choose another.",
@@ -134,22 +210,11 @@ async def upload_picture(
             detail=f"Invalid file type '{file.content_type}'. Allowed: {', '.join(sorted(ALLOWED_CONTENT_TYPES))}",
         )
 
-    file_bytes = await file.read()
-
-    if not file_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File is empty.",
-        )
-
-    if len(file_bytes) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // 1024}KB.",
-        )
-
+    # Size, magic-byte and S3 work all happen in the worker thread; the slot
+    # limit keeps slow S3 uploads from tying up the whole threadpool
     try:
-        url = await asyncio.to_thread(upload_profile_picture, file_bytes, file.content_type)
+        async with _upload_slots:
+            url = await asyncio.to_thread(upload_profile_picture, file.file, file.content_type)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -170,13 +235,17 @@ async def upload_picture(
 async def get_public_user_profile(
     user_id: int,
     db: Annotated[AsyncSession, Depends(get_db_session)],
-) -> PublicUserRead:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Get public profile for any user.
 
     Returns user info excluding private fields (email, is_verified, etc.)
+    The response carries a weak ETag over the body, so clients revalidating
+    an unchanged profile get an empty 304.
 
     Args:
         user_id: The user ID to look up
+        if_none_match: ETag from the client's cached copy, if any
 
     Returns:
         Public user profile data
@@ -193,7 +262,8 @@ async def get_public_user_profile(
             detail="User not found",
         )
 
-    return PublicUserRead(
+    _remember_user(user.id)
+    profile = PublicUserRead(
         id=user.id,
         username=user.username,
         picture_url=user.picture_url,
@@ -201,6 +271,28 @@ async def get_public_user_profile(
         created_at=user.created_at,
         last_online=user.last_online,
     )
+    body = profile.model_dump_json().encode()
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": PROFILE_CACHE_CONTROL}
+    if if_none_match is not None and etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _user_exists(db: AsyncSession, user_id: int) -> bool:
+    """Check that a user exists, skipping the query if they were recently seen."""
+    if _is_known_user(user_id):
+        return True
+    exists = await UserRepository(db).exists(user_id)
+    if exists:
+        _remember_user(user_id)
+    return exists
+
+
+@lru_cache(maxsize=32)
+def _opponent_slots(max_players: int, player_num: int) -> tuple[int, ...]:
+    """Get the player slots left for opponents, in order, once a player takes one."""
+    return tuple(n for n in range(1, max_players + 1) if n != player_num)
 
 
 @router.get("/{user_id}/replays", response_model=ReplayListResponse)
@@ -225,37 +317,34 @@ async def get_user_replays(
     Raises:
         HTTPException: 404 if user not found
     """
-    # Verify user exists
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
-    if user is None:
+    # Verify user exists before touching their history
+    if not await _user_exists(db, user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # Use fast indexed user_game_history table (O(1) lookup)
+    # One indexed range scan on user_game_history returns the page and total
     history_repo = UserGameHistoryRepository(db)
-    history_entries = await history_repo.list_by_user(user_id, limit=limit, offset=offset)
-    total = await history_repo.count_by_user(user_id)
+    history_entries, total = await history_repo.list_by_user_with_total(
+        user_id, limit=limit, offset=offset
+    )
 
     # Build all player dicts first for batch resolution
-    entry_data: list[tuple[str, dict, datetime | None, dict[int, str]]] = []
-    players_list: list[dict[int, str]] = []
+    entry_data: list[tuple[str, dict, datetime | None, dict[int, PlayerRef]]] = []
+    players_list: list[dict[int, PlayerRef]] = []
     for entry in history_entries:
         info = entry.game_info
         game_id = info.get("gameId") or info.get("historyId")
 
-        # Build players dict: this user + opponents
+        # Build players dict: this user (by bare ID) + opponents
         player_num = info.get("player", 1)
-        players: dict[int, str] = {player_num: f"u:{user_id}"}
+        players: dict[int, PlayerRef] = {player_num: user_id}
         opponents = info.get("opponents", [])
         max_players = 4 if len(opponents) > 1 else 2
-        available_slots = [n for n in range(1, max_players + 1) if n != player_num]
-        for i, opponent in enumerate(opponents):
-            if i < len(available_slots):
-                players[available_slots[i]] = opponent
+        available_slots = _opponent_slots(max_players, player_num)
+        for slot, opponent in zip(available_slots, opponents, strict=False):
+            players[slot] = opponent
 
         entry_data.append((str(game_id) if game_id else "unknown", info, entry.game_time, players))
         players_list.append(players)
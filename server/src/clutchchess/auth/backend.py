@@ -3,7 +3,14 @@
 Sets up cookie-based JWT authentication for the application.
 """
 
+import hashlib
+import time
+
+import jwt
+from fastapi_users import exceptions, models
 from fastapi_users.authentication import AuthenticationBackend, CookieTransport, JWTStrategy
+from fastapi_users.jwt import decode_jwt
+from fastapi_users.manager import BaseUserManager
 
 from clutchchess.settings import get_settings
 
@@ -22,18 +29,88 @@ cookie_transport = CookieTransport(
     cookie_samesite="lax",
 )
 
+# Decoded token cache: sha256(token) -> (subject, monotonic time cached)
+TOKEN_CACHE_TTL_SECONDS = 60.0
+TOKEN_CACHE_MAX_SIZE = 100_000
+_decoded_tokens: dict[bytes, tuple[str, float]] = {}
+
+
+def clear_token_cache() -> None:
+    """Drop all cached decoded tokens."""
+    _decoded_tokens.clear()
+
+
+class CachedJWTStrategy(JWTStrategy[models.UP, models.ID]):
+    """JWT strategy that remembers recently verified tokens.
+
+    Only the signature check is cached; the user is still loaded on every
+    request so deactivated accounts are rejected immediately. Tokens that
+    expire within the cache TTL are never cached.
+    """
+
+    def _read_subject(self, token: str) -> str | None:
+        """Return the token's subject, verifying the signature on a cache miss."""
+        key = hashlib.sha256(token.encode()).digest()
+        cached = _decoded_tokens.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < TOKEN_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+            )
+        except jwt.PyJWTError:
+            return None
+        subject = data.get("sub")
+        if subject is None:
+            return None
+
+        exp = data.get("exp")
+        if exp is None or exp - time.time() >= TOKEN_CACHE_TTL_SECONDS:
+            _decoded_tokens.pop(key, None)
+            if len(_decoded_tokens) >= TOKEN_CACHE_MAX_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del _decoded_tokens[next(iter(_decoded_tokens))]
+            _decoded_tokens[key] = (subject, now)
+        return subject
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[models.UP, models.ID]
+    ) -> models.UP | None:
+        if token is None:
+            return None
+
+        user_id = self._read_subject(token)
+        if user_id is None:
+            return None
+
+        try:
+            parsed_id = user_manager.parse_id(user_id)
+            return await user_manager.get(parsed_id)
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
+
+# Strategy settings are pinned at module load, like the cookie transport above
+_JWT_SECRET = _settings.secret_key
+_JWT_LIFETIME_SECONDS = 3600 * 24 * 30  # 30 days
+_JWT_STRATEGY = CachedJWTStrategy(
+    secret=_JWT_SECRET,
+    lifetime_seconds=_JWT_LIFETIME_SECONDS,
+)
+
 
 def get_jwt_strategy() -> JWTStrategy:
     """Get the JWT strategy for authentication.
 
+    The strategy is stateless apart from the shared token cache, so a single
+    instance serves every request.
+
     Returns:
         JWT strategy configured with secret and lifetime
     """
-    settings = get_settings()
-    return JWTStrategy(
-        secret=settings.secret_key,
-        lifetime_seconds=3600 * 24 * 30,  # 30 days
-    )
+    return _JWT_STRATEGY
 
 
 # The authentication backend combines transport and strategy
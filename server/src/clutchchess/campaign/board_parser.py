@@ -1,5 +1,7 @@
 """Board string parser for campaign levels."""
 
+from functools import lru_cache
+
 from clutchchess.game.board import Board, BoardType
 from clutchchess.game.pieces import Piece, PieceType
 
@@ -12,6 +14,15 @@ PIECE_TYPE_MAP = {
     "K": PieceType.KING,
 }
 
+MAX_PLAYERS = 4
+
+# Every valid 2-char cell -> (piece type, player), or None for an empty square.
+# Decoding a cell is then a single dict lookup instead of per-char parsing.
+CELL_MAP: dict[str, tuple[PieceType, int] | None] = {"00": None}
+for _char, _piece_type in PIECE_TYPE_MAP.items():
+    for _player in range(1, MAX_PLAYERS + 1):
+        CELL_MAP[f"{_char}{_player}"] = (_piece_type, _player)
+
 
 def parse_board_string(board_str: str, board_type: BoardType) -> Board:
     """Parse legacy board string format into a Board object.
@@ -33,6 +44,14 @@ def parse_board_string(board_str: str, board_type: BoardType) -> Board:
     Raises:
         ValueError: If the board string format is invalid
     """
+    # Campaign layouts are static, so each one is only parsed once. The engine
+    # mutates boards in place, so callers always get their own copy.
+    return _parse_board_template(board_str, board_type).copy()
+
+
+@lru_cache(maxsize=64)
+def _parse_board_template(board_str: str, board_type: BoardType) -> Board:
+    """Parse a board string into a shared template board (must not be mutated)."""
     lines = [line.strip() for line in board_str.strip().splitlines() if line.strip()]
 
     if board_type == BoardType.STANDARD:
@@ -45,7 +64,7 @@ def parse_board_string(board_str: str, board_type: BoardType) -> Board:
     if len(lines) != expected_rows:
         raise ValueError(f"Expected {expected_rows} rows, got {len(lines)}")
 
-    board = Board.create_empty(board_type)
+    pieces: list[Piece] = []
 
     for row, line in enumerate(lines):
         if len(line) != expected_cols * 2:
@@ -55,27 +74,19 @@ def parse_board_string(board_str: str, board_type: BoardType) -> Board:
 
         for col in range(expected_cols):
             cell = line[col * 2 : col * 2 + 2]
-            if cell == "00":
-                continue
-
-            piece_type_char = cell[0]
-            player_char = cell[1]
+            try:
+                entry = CELL_MAP[cell]
+            except KeyError:
+                if cell[0] not in PIECE_TYPE_MAP:
+                    raise ValueError(f"Unknown piece type: {cell[0]}") from None
+                raise ValueError(f"Invalid player number: {cell[1]}") from None
 
-            if piece_type_char not in PIECE_TYPE_MAP:
-                raise ValueError(f"Unknown piece type: {piece_type_char}")
+            if entry is None:
+                continue
 
-            try:
-                player = int(player_char)
-            except ValueError:
-                raise ValueError(f"Invalid player number: {player_char}") from None
-
-            board.add_piece(
-                Piece.create(
-                    PIECE_TYPE_MAP[piece_type_char],
-                    player=player,
-                    row=row,
-                    col=col,
-                )
-            )
+            piece_type, player = entry
+            pieces.append(Piece.create(piece_type, player=player, row=row, col=col))
 
+    board = Board.create_empty(board_type)
+    board.add_pieces(pieces)
     return board
@@ -7,7 +7,7 @@ Levels 32+: Future 4-player levels (to be designed)
 from .models import CampaignLevel
 
 # Belt names
-BELT_NAMES = [
+BELT_NAMES = (
     None,  # 0 (unused)
     "White",  # 1: levels 0-7
     "Yellow",  # 2: levels 8-15
@@ -18,12 +18,12 @@ BELT_NAMES = [
     "Brown",  # 7: levels 48-55 (future)
     "Red",  # 8: levels 56-63 (future)
     "Black",  # 9: levels 64-71 (future)
-]
+)
 
 MAX_BELT = 4  # Currently implemented belts
 
 
-LEVELS: list[CampaignLevel] = [
+LEVELS: tuple[CampaignLevel, ...] = (
     # ========== Belt 1: White (Tutorial) ==========
     CampaignLevel(
         level_id=0,
@@ -574,7 +574,7 @@ R1R1B1B1K1B1R1R1
     ),
     # ========== Belt 5+: 4-Player (Future) ==========
     # Levels 32+ will be designed later
-]
+)
 
 
 def get_level(level_id: int) -> CampaignLevel | None:
@@ -584,8 +584,12 @@ def get_level(level_id: int) -> CampaignLevel | None:
     return None
 
 
-def get_belt_levels(belt: int) -> list[CampaignLevel]:
-    """Get all levels for a belt (8 levels per belt)."""
+def get_belt_levels(belt: int) -> tuple[CampaignLevel, ...]:
+    """Get all levels for a belt (8 levels per belt).
+
+    LEVELS is ordered by level_id, so each belt is a contiguous slice.
+    """
+    if belt < 1:
+        return ()
     start = (belt - 1) * 8
-    end = start + 8
-    return [lvl for lvl in LEVELS if start <= lvl.level_id < end]
+    return LEVELS[start : start + 8]
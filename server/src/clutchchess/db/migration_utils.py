@@ -0,0 +1,70 @@
+"""Helpers for writing Alembic migrations.
+
+Kept in the application package (rather than next to the migration scripts)
+so migrations can import them the same way env.py imports the models.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+def add_columns(table: str, *columns: str, if_not_exists: bool = False) -> None:
+    """Add several columns to a table with a single ALTER TABLE.
+
+    Each op.add_column() is its own ALTER TABLE, and every ALTER TABLE takes an
+    ACCESS EXCLUSIVE lock. Batching the columns takes the lock (and rewrites
+    the catalog) once.
+
+    Args:
+        table: Table name
+        columns: Column definitions, e.g. "campaign_level_id INTEGER"
+        if_not_exists: Skip columns that already exist
+    """
+    if not columns:
+        return
+    add = "ADD COLUMN IF NOT EXISTS" if if_not_exists else "ADD COLUMN"
+    clauses = ", ".join(f"{add} {column}" for column in columns)
+    op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def drop_columns(table: str, *columns: str) -> None:
+    """Drop several columns from a table with a single ALTER TABLE.
+
+    Args:
+        table: Table name
+        columns: Column names
+    """
+    if not columns:
+        return
+    clauses = ", ".join(f"DROP COLUMN IF EXISTS {column}" for column in columns)
+    op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def create_index_concurrently(name: str, definition: str) -> None:
+    """Build an index CONCURRENTLY, recovering from an earlier failed build.
+
+    A failed or cancelled CREATE INDEX CONCURRENTLY leaves an INVALID index
+    under the target name, which IF NOT EXISTS would then silently skip. A
+    leftover invalid index is dropped and rebuilt; a valid one is left alone,
+    so re-running a migration is still a no-op.
+
+    Must be called inside op.get_context().autocommit_block().
+
+    Args:
+        name: Index name
+        definition: Everything after the index name, e.g. "ON users (username)"
+    """
+    is_valid = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+            {"name": name},
+        )
+        .scalar_one_or_none()
+    )
+    if is_valid:
+        return
+    if is_valid is not None:
+        op.execute(f"DROP INDEX CONCURRENTLY {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY {name} {definition}")
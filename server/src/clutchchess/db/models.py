@@ -6,14 +6,17 @@ from fastapi_users.db import SQLAlchemyBaseOAuthAccountTable, SQLAlchemyBaseUser
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -49,7 +52,9 @@ class User(SQLAlchemyBaseUserTable[int], Base):
         username: Display name (auto-generated if not provided)
         picture_url: Profile picture URL (from Google or uploaded)
         google_id: Google OAuth identifier for legacy user lookup
-        ratings: Game ratings by mode (e.g. {"standard": 1200})
+        ratings: Game ratings by mode (e.g. {"2p_standard": {"rating": 1200, ...}})
+        rating_<mode>/games_<mode>/wins_<mode>: Generated columns mirroring
+            ratings for each mode, used by leaderboard queries
         created_at: Account creation timestamp
         last_online: Last activity timestamp
     """
@@ -77,8 +82,73 @@ class User(SQLAlchemyBaseUserTable[int], Base):
         DateTime, default=func.now(), nullable=False
     )
 
-    # Relationship to OAuth accounts
-    oauth_accounts: Mapped[list[OAuthAccount]] = relationship("OAuthAccount", lazy="joined")
+    # Denormalized per-mode stats, generated by Postgres from ratings.
+    # Deferred so ordinary user loads don't fetch them.
+    rating_2p_standard: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'2p_standard'->>'rating')::int)", persisted=True),
+        deferred=True,
+    )
+    games_2p_standard: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'2p_standard'->>'games')::int)", persisted=True),
+        deferred=True,
+    )
+    wins_2p_standard: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'2p_standard'->>'wins')::int)", persisted=True),
+        deferred=True,
+    )
+    rating_2p_lightning: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'2p_lightning'->>'rating')::int)", persisted=True),
+        deferred=True,
+    )
+    games_2p_lightning: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'2p_lightning'->>'games')::int)", persisted=True),
+        deferred=True,
+    )
+    wins_2p_lightning: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'2p_lightning'->>'wins')::int)", persisted=True),
+        deferred=True,
+    )
+    rating_4p_standard: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'4p_standard'->>'rating')::int)", persisted=True),
+        deferred=True,
+    )
+    games_4p_standard: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'4p_standard'->>'games')::int)", persisted=True),
+        deferred=True,
+    )
+    wins_4p_standard: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'4p_standard'->>'wins')::int)", persisted=True),
+        deferred=True,
+    )
+    rating_4p_lightning: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'4p_lightning'->>'rating')::int)", persisted=True),
+        deferred=True,
+    )
+    games_4p_lightning: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'4p_lightning'->>'games')::int)", persisted=True),
+        deferred=True,
+    )
+    wins_4p_lightning: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("((ratings->'4p_lightning'->>'wins')::int)", persisted=True),
+        deferred=True,
+    )
+
+    # Relationship to OAuth accounts. Only the OAuth callback touches these and
+    # it queries OAuthAccount directly, so user loads (one per authenticated
+    # request) skip the join; load explicitly with selectinload() if needed.
+    oauth_accounts: Mapped[list[OAuthAccount]] = relationship("OAuthAccount", lazy="raise")
 
 
 class Lobby(Base):
@@ -101,7 +171,7 @@ class Lobby(Base):
 
     __tablename__ = "lobbies"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
     code: Mapped[str] = mapped_column(String(10), unique=True, nullable=False, index=True)
     host_id: Mapped[int | None] = mapped_column(
         BigInteger, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
@@ -122,13 +192,22 @@ class Lobby(Base):
 
     # Relationships
     host: Mapped["User | None"] = relationship("User", foreign_keys=[host_id])
+    # passive_deletes leaves removing players to the FK's ON DELETE CASCADE
+    # instead of loading them first
     players: Mapped[list["LobbyPlayer"]] = relationship(
-        "LobbyPlayer", back_populates="lobby", cascade="all, delete-orphan"
+        "LobbyPlayer",
+        back_populates="lobby",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
-    # Composite index for list_public_waiting() queries
+    # Partial index for list_public_waiting() queries
     __table_args__ = (
-        Index("ix_lobbies_public_waiting", "is_public", "status", "created_at"),
+        Index(
+            "ix_lobbies_public_waiting",
+            text("created_at DESC"),
+            postgresql_where=text("is_public AND status = 'waiting'"),
+        ),
     )
 
 
@@ -150,7 +229,7 @@ class LobbyPlayer(Base):
 
     __tablename__ = "lobby_players"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
     lobby_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("lobbies.id", ondelete="CASCADE"), nullable=False
     )
@@ -226,7 +305,7 @@ class ReplayLike(Base):
 
     __tablename__ = "replay_likes"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
     replay_id: Mapped[str] = mapped_column(
         String, ForeignKey("game_replays.id", ondelete="CASCADE"), nullable=False
     )
@@ -240,7 +319,7 @@ class ReplayLike(Base):
     __table_args__ = (
         UniqueConstraint("replay_id", "user_id", name="uq_replay_likes_replay_user"),
         Index("ix_replay_likes_replay_id", "replay_id"),
-        Index("ix_replay_likes_user_id", "user_id"),
+        Index("ix_replay_likes_user_id_replay_id", "user_id", "replay_id"),
     )
 
 
@@ -285,10 +364,21 @@ class UserGameHistory(Base):
     __tablename__ = "user_game_history"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
+    # No single-column index: the composite index below leads with user_id
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     game_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     game_info: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
+    # Covers id only; game_info is unbounded JSONB and too big for a btree tuple
+    __table_args__ = (
+        Index(
+            "ix_user_game_history_user_id_game_time",
+            "user_id",
+            text("game_time DESC"),
+            postgresql_include=["id"],
+        ),
+    )
+
 
 class CampaignProgress(Base):
     """User's campaign progress.
@@ -306,7 +396,7 @@ class CampaignProgress(Base):
 
     __tablename__ = "campaign_progress"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
     user_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -320,8 +410,10 @@ class CampaignProgress(Base):
 class ActiveGame(Base):
     """Registry of currently running games.
 
-    Transient table tracking all active games across server instances.
-    Games register on creation and deregister on completion.
+    No longer written: the live registry moved to Redis (see
+    clutchchess.redis.active_games), which builds detached instances of this
+    model so callers keep the same shape. The table remains for the
+    deprecated ActiveGameRepository.
     """
 
     __tablename__ = "active_games"
@@ -1,6 +1,7 @@
 """Active games repository for database operations."""
 
 import logging
+import warnings
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import delete, select
@@ -12,9 +13,19 @@ logger = logging.getLogger(__name__)
 
 
 class ActiveGameRepository:
-    """Repository for managing the active games registry."""
+    """Repository for managing the active games registry in Postgres.
+
+    Deprecated: the registry lives in Redis now; use
+    clutchchess.redis.RedisActiveGameRepository. Nothing in the server calls
+    this class, and it will be removed along with the active_games table.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
+        warnings.warn(
+            "ActiveGameRepository is deprecated; use RedisActiveGameRepository",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         self.session = session
 
     async def register(
@@ -73,6 +84,21 @@ class ActiveGameRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def deregister_many(self, game_ids: list[str]) -> int:
+        """Remove several games from the active registry in one DELETE.
+
+        Returns the number of entries removed.
+        """
+        if not game_ids:
+            return 0
+        result = await self.session.execute(
+            delete(ActiveGame).where(ActiveGame.game_id.in_(game_ids))
+        )
+        count = result.rowcount
+        if count > 0:
+            logger.info(f"Deregistered {count} active games")
+        return count
+
     async def cleanup_stale(self, max_age_hours: int = 2) -> int:
         """Remove entries older than max_age_hours (crash recovery)."""
         cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=max_age_hours)
@@ -3,14 +3,22 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from clutchchess.db.models import Lobby as LobbyModel
 from clutchchess.db.models import LobbyPlayer as LobbyPlayerModel
 from clutchchess.lobby.models import Lobby, LobbyPlayer, LobbySettings, LobbyStatus
 
+# Loader options for reads that convert records to domain objects: players
+# come in one extra SELECT, and any other relationship (host, player.user,
+# ...) raises instead of silently lazy-loading once per row.
+_READ_OPTIONS = (
+    selectinload(LobbyModel.players).raiseload("*"),
+    raiseload("*"),
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,7 +115,7 @@ class LobbyRepository:
         result = await self.session.execute(
             select(LobbyModel)
             .where(LobbyModel.id == lobby_id)
-            .options(selectinload(LobbyModel.players))
+            .options(*_READ_OPTIONS)
         )
         record = result.scalar_one_or_none()
 
@@ -128,7 +136,7 @@ class LobbyRepository:
         result = await self.session.execute(
             select(LobbyModel)
             .where(LobbyModel.code == code)
-            .options(selectinload(LobbyModel.players))
+            .options(*_READ_OPTIONS)
         )
         record = result.scalar_one_or_none()
 
@@ -160,20 +168,16 @@ class LobbyRepository:
         Returns:
             True if deleted, False if not found
         """
+        # lobby_players rows go with it via the FK's ON DELETE CASCADE
         result = await self.session.execute(
-            select(LobbyModel)
-            .where(LobbyModel.id == lobby_id)
-            .options(selectinload(LobbyModel.players))
+            delete(LobbyModel).where(LobbyModel.id == lobby_id).returning(LobbyModel.code)
         )
-        record = result.scalar_one_or_none()
+        code = result.scalar_one_or_none()
 
-        if record is None:
+        if code is None:
             return False
 
-        await self.session.delete(record)
-        await self.session.flush()
-
-        logger.info(f"Deleted lobby {record.code} from database")
+        logger.info(f"Deleted lobby {code} from database")
         return True
 
     async def delete_by_code(self, code: str) -> bool:
@@ -185,19 +189,14 @@ class LobbyRepository:
         Returns:
             True if deleted, False if not found
         """
+        # lobby_players rows go with it via the FK's ON DELETE CASCADE
         result = await self.session.execute(
-            select(LobbyModel)
-            .where(LobbyModel.code == code)
-            .options(selectinload(LobbyModel.players))
+            delete(LobbyModel).where(LobbyModel.code == code).returning(LobbyModel.id)
         )
-        record = result.scalar_one_or_none()
 
-        if record is None:
+        if result.scalar_one_or_none() is None:
             return False
 
-        await self.session.delete(record)
-        await self.session.flush()
-
         logger.info(f"Deleted lobby {code} from database")
         return True
 
@@ -219,9 +218,10 @@ class LobbyRepository:
         """
         query = (
             select(LobbyModel)
-            .where(LobbyModel.is_public.is_(True))
+            # Plain boolean predicate so it matches the partial index's WHERE
+            .where(LobbyModel.is_public)
             .where(LobbyModel.status == "waiting")
-            .options(selectinload(LobbyModel.players))
+            .options(*_READ_OPTIONS)
             .order_by(LobbyModel.created_at.desc())
             .limit(limit)
         )
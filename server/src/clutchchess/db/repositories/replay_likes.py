@@ -2,11 +2,11 @@
 
 import logging
 
-from sqlalchemy import case, delete, select, update
+from sqlalchemy import delete, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from clutchchess.db.models import GameReplay, ReplayLike
+from clutchchess.db.models import ReplayLike
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,8 @@ class ReplayLikesRepository:
     async def like(self, replay_id: str, user_id: int) -> bool:
         """Add a like to a replay.
 
-        Uses INSERT ... ON CONFLICT DO NOTHING for idempotency.
+        Uses INSERT ... ON CONFLICT DO NOTHING for idempotency. The
+        game_replays.like_count counter is bumped by a database trigger.
 
         Args:
             replay_id: The replay ID to like
@@ -46,9 +47,6 @@ class ReplayLikesRepository:
         result = await self.session.execute(stmt)
 
         if result.rowcount > 0:
-            # Like was added, increment counter
-            await self._increment_like_count(replay_id, 1)
-            await self.session.flush()
             logger.debug(f"User {user_id} liked replay {replay_id}")
             return True
 
@@ -57,6 +55,8 @@ class ReplayLikesRepository:
     async def unlike(self, replay_id: str, user_id: int) -> bool:
         """Remove a like from a replay.
 
+        The game_replays.like_count counter is decremented by a database trigger.
+
         Args:
             replay_id: The replay ID to unlike
             user_id: The user ID unliking the replay
@@ -72,9 +72,6 @@ class ReplayLikesRepository:
         result = await self.session.execute(stmt)
 
         if result.rowcount > 0:
-            # Like was removed, decrement counter
-            await self._increment_like_count(replay_id, -1)
-            await self.session.flush()
             logger.debug(f"User {user_id} unliked replay {replay_id}")
             return True
 
@@ -122,24 +119,3 @@ class ReplayLikesRepository:
 
         liked_ids = {row[0] for row in result.fetchall()}
         return {rid: rid in liked_ids for rid in replay_ids}
-
-    async def _increment_like_count(self, replay_id: str, delta: int) -> None:
-        """Atomically increment or decrement the like_count on GameReplay.
-
-        Uses atomic SQL UPDATE to avoid race conditions.
-
-        Args:
-            replay_id: The replay ID
-            delta: Amount to change (positive or negative)
-        """
-        # Use case expression to ensure count never goes below 0
-        new_count = case(
-            (GameReplay.like_count + delta < 0, 0),
-            else_=GameReplay.like_count + delta,
-        )
-        stmt = (
-            update(GameReplay)
-            .where(GameReplay.id == replay_id)
-            .values(like_count=new_count)
-        )
-        await self.session.execute(stmt)
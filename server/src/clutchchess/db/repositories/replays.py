@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from clutchchess.db.models import GameReplay
 from clutchchess.game.board import BoardType
@@ -13,6 +14,10 @@ from clutchchess.game.state import ReplayMove, Speed
 
 logger = logging.getLogger(__name__)
 
+# List views only need replay metadata; moves grow with game length and are
+# left in the database (raising if touched) until a replay is played back.
+_SUMMARY_OPTIONS = (defer(GameReplay.moves, raiseload=True),)
+
 
 class ReplayRepository:
     """Repository for managing game replays in the database."""
@@ -134,10 +139,12 @@ class ReplayRepository:
             offset: Number of replays to skip
 
         Returns:
-            List of (game_id, replay) tuples ordered by creation time (newest first)
+            List of (game_id, replay) tuples ordered by creation time (newest first).
+            Moves are not loaded, so each replay's moves list is empty.
         """
         result = await self.session.execute(
             select(GameReplay)
+            .options(*_SUMMARY_OPTIONS)
             .where(GameReplay.is_public.is_(True))
             .order_by(GameReplay.created_at.desc())
             .limit(limit)
@@ -145,7 +152,7 @@ class ReplayRepository:
         )
         records = result.scalars().all()
 
-        return [(r.id, self._record_to_replay(r)) for r in records]
+        return [(r.id, self._record_to_replay(r, include_moves=False)) for r in records]
 
     async def count_public(self) -> int:
         """Count total number of public replays.
@@ -170,10 +177,12 @@ class ReplayRepository:
             offset: Number of replays to skip
 
         Returns:
-            List of (game_id, replay, like_count) tuples ordered by likes (highest first)
+            List of (game_id, replay, like_count) tuples ordered by likes (highest first).
+            Moves are not loaded, so each replay's moves list is empty.
         """
         result = await self.session.execute(
             select(GameReplay)
+            .options(*_SUMMARY_OPTIONS)
             .where(GameReplay.is_public.is_(True))
             .where(GameReplay.like_count > 0)
             .order_by(GameReplay.like_count.desc(), GameReplay.created_at.desc())
@@ -182,7 +191,10 @@ class ReplayRepository:
         )
         records = result.scalars().all()
 
-        return [(r.id, self._record_to_replay(r), r.like_count) for r in records]
+        return [
+            (r.id, self._record_to_replay(r, include_moves=False), r.like_count)
+            for r in records
+        ]
 
     async def get_like_count(self, game_id: str) -> int:
         """Get the like count for a replay.
@@ -243,11 +255,12 @@ class ReplayRepository:
         logger.info(f"Deleted replay for game {game_id}")
         return True
 
-    def _record_to_replay(self, record: GameReplay) -> Replay:
+    def _record_to_replay(self, record: GameReplay, include_moves: bool = True) -> Replay:
         """Convert a database record to a Replay object.
 
         Args:
             record: The database record to convert
+            include_moves: Parse the record's moves; pass False when they were deferred
 
         Returns:
             Replay object
@@ -264,7 +277,7 @@ class ReplayRepository:
 
         # Parse moves with validation
         moves = []
-        for i, m in enumerate(record.moves):
+        for i, m in enumerate(record.moves if include_moves else ()):
             try:
                 moves.append(
                     ReplayMove(
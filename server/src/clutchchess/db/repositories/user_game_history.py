@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from clutchchess.db.models import UserGameHistory
@@ -17,6 +17,11 @@ class UserGameHistoryRepository:
 
     This provides O(1) access to a user's match history via the
     indexed user_game_history table, rather than scanning all replays.
+
+    The read queries are lambda statements: SQLAlchemy builds each one once
+    and afterwards only swaps in the user_id/limit/offset parameters, which
+    skips statement construction and cache-key generation on the profile
+    page's hot path.
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -65,6 +70,32 @@ class UserGameHistoryRepository:
         logger.info(f"Added game history for user {user_id}: {game_info.get('gameId')}")
         return record
 
+    async def add_many(self, entries: list[tuple[int, datetime, dict[str, Any]]]) -> None:
+        """Add one game to several users' match histories in a single INSERT.
+
+        Used when a game finishes, where every registered player gets a row.
+
+        Args:
+            entries: (user_id, game_time, game_info) tuples, as for add()
+        """
+        if not entries:
+            return
+
+        rows = [
+            {
+                "user_id": user_id,
+                # Convert timezone-aware datetime to naive UTC for database
+                "game_time": game_time.replace(tzinfo=None),
+                "game_info": game_info,
+            }
+            for user_id, game_time, game_info in entries
+        ]
+        await self.session.execute(insert(UserGameHistory), rows)
+
+        logger.info(
+            f"Added game history for {len(rows)} users: {entries[0][2].get('gameId')}"
+        )
+
     async def list_by_user(
         self,
         user_id: int,
@@ -84,11 +115,13 @@ class UserGameHistoryRepository:
             List of UserGameHistory records ordered by game_time DESC
         """
         result = await self.session.execute(
-            select(UserGameHistory)
-            .where(UserGameHistory.user_id == user_id)
-            .order_by(UserGameHistory.game_time.desc())
-            .limit(limit)
-            .offset(offset)
+            lambda_stmt(
+                lambda: select(UserGameHistory)
+                .where(UserGameHistory.user_id == user_id)
+                .order_by(UserGameHistory.game_time.desc())
+                .limit(limit)
+                .offset(offset)
+            )
         )
         return list(result.scalars().all())
 
@@ -102,8 +135,47 @@ class UserGameHistoryRepository:
             Total count of games for this user
         """
         result = await self.session.execute(
-            select(func.count())
-            .select_from(UserGameHistory)
-            .where(UserGameHistory.user_id == user_id)
+            lambda_stmt(
+                lambda: select(func.count())
+                .select_from(UserGameHistory)
+                .where(UserGameHistory.user_id == user_id)
+            )
         )
         return result.scalar_one()
+
+    async def list_by_user_with_total(
+        self,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[UserGameHistory], int]:
+        """List a page of a user's match history along with their total game count.
+
+        The total is computed with a COUNT(*) OVER () window in the same
+        statement, saving a round trip over list_by_user + count_by_user.
+
+        Args:
+            user_id: The user's ID
+            limit: Maximum number of entries to return
+            offset: Number of entries to skip
+
+        Returns:
+            Tuple of (records ordered by game_time DESC, total count of games)
+        """
+        result = await self.session.execute(
+            lambda_stmt(
+                lambda: select(UserGameHistory, func.count().over().label("total"))
+                .where(UserGameHistory.user_id == user_id)
+                .order_by(UserGameHistory.game_time.desc())
+                .limit(limit)
+                .offset(offset)
+            )
+        )
+        rows = result.all()
+
+        if not rows:
+            # An offset past the end returns no rows to carry the window total
+            total = await self.count_by_user(user_id) if offset > 0 else 0
+            return [], total
+
+        return [row[0] for row in rows], rows[0].total
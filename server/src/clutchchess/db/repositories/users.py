@@ -37,6 +37,21 @@ class UserRepository:
         result = await self.session.execute(select(User).where(User.id == user_id))
         return result.unique().scalar_one_or_none()
 
+    async def exists(self, user_id: int) -> bool:
+        """Check if a user exists.
+
+        Cheaper than get_by_id since it skips loading the row and its
+        eagerly joined OAuth accounts.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            True if the user exists
+        """
+        result = await self.session.execute(select(User.id).where(User.id == user_id))
+        return result.scalar_one_or_none() is not None
+
     async def get_by_username(self, username: str) -> User | None:
         """Get a user by username.
 
@@ -76,3 +91,18 @@ class UserRepository:
             select(User.id).where(User.username == username).limit(1)
         )
         return result.scalar_one_or_none() is None
+
+    async def username_taken(self, username: str, exclude_id: int) -> bool:
+        """Check if another user already has a username.
+
+        Args:
+            username: The username to check
+            exclude_id: ID of the user making the change, whose own row is ignored
+
+        Returns:
+            True if a different user has the username
+        """
+        result = await self.session.execute(
+            select(User.id).where(User.username == username, User.id != exclude_id).limit(1)
+        )
+        return result.scalar_one_or_none() is not None
@@ -6,11 +6,17 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from clutchchess.settings import get_settings
 
+# Number of prepared statements asyncpg keeps per connection. Hot queries with
+# static SQL text (e.g. the leaderboard) are parsed and planned once per
+# connection and reused from this cache afterwards.
+PREPARED_STATEMENT_CACHE_SIZE = 200
+
 # Create async engine
 _engine = create_async_engine(
     get_settings().database_url,
     echo=False,
     pool_pre_ping=True,
+    connect_args={"prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE},
 )
 
 # Create session factory
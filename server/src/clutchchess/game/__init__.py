@@ -1,25 +1,69 @@
 """Game engine module for Clutch Chess."""
 
-from clutchchess.game.board import Board, BoardType
-from clutchchess.game.collision import (
-    CAPTURE_DISTANCE,
-    Capture,
-    detect_collisions,
-    get_interpolated_position,
-    is_piece_moving,
-    is_piece_on_cooldown,
-)
-from clutchchess.game.engine import GameEngine, GameEvent, GameEventType
-from clutchchess.game.moves import Cooldown, Move, check_castling, compute_move_path
-from clutchchess.game.pieces import Piece, PieceType
-from clutchchess.game.state import (
-    SPEED_CONFIGS,
-    GameState,
-    GameStatus,
-    ReplayMove,
-    Speed,
-    SpeedConfig,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from clutchchess.game.board import Board, BoardType
+    from clutchchess.game.collision import (
+        CAPTURE_DISTANCE,
+        Capture,
+        cooldown_piece_ids,
+        detect_collisions,
+        get_interpolated_position,
+        is_piece_moving,
+        is_piece_on_cooldown,
+    )
+    from clutchchess.game.engine import GameEngine, GameEvent, GameEventType
+    from clutchchess.game.moves import Cooldown, Move, check_castling, compute_move_path
+    from clutchchess.game.pieces import Piece, PieceType
+    from clutchchess.game.state import (
+        SPEED_CONFIGS,
+        GameState,
+        GameStatus,
+        ReplayMove,
+        Speed,
+        SpeedConfig,
+    )
+
+# Public name -> defining submodule. Re-exports resolve on first access, so
+# importing one submodule (e.g. clutchchess.game.board from the replay
+# repository) does not pull in the engine, move generation and collision code.
+_EXPORTS = {
+    "Piece": "pieces",
+    "PieceType": "pieces",
+    "Board": "board",
+    "BoardType": "board",
+    "Move": "moves",
+    "Cooldown": "moves",
+    "compute_move_path": "moves",
+    "check_castling": "moves",
+    "detect_collisions": "collision",
+    "get_interpolated_position": "collision",
+    "is_piece_moving": "collision",
+    "is_piece_on_cooldown": "collision",
+    "cooldown_piece_ids": "collision",
+    "Capture": "collision",
+    "CAPTURE_DISTANCE": "collision",
+    "GameState": "state",
+    "GameStatus": "state",
+    "Speed": "state",
+    "SpeedConfig": "state",
+    "SPEED_CONFIGS": "state",
+    "ReplayMove": "state",
+    "GameEngine": "engine",
+    "GameEvent": "engine",
+    "GameEventType": "engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Pieces
@@ -38,6 +82,7 @@ __all__ = [
     "get_interpolated_position",
     "is_piece_moving",
     "is_piece_on_cooldown",
+    "cooldown_piece_ids",
     "Capture",
     "CAPTURE_DISTANCE",
     # State
@@ -1,5 +1,6 @@
 """Board representation for Clutch Chess."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -244,6 +245,10 @@ class Board:
         """Add a piece to the board."""
         self.pieces.append(piece)
 
+    def add_pieces(self, pieces: Iterable[Piece]) -> None:
+        """Add several pieces to the board in one pass."""
+        self.pieces.extend(pieces)
+
     def remove_piece(self, piece_id: str) -> bool:
         """Remove a piece from the board. Returns True if found and removed."""
         for i, piece in enumerate(self.pieces):
@@ -11,16 +11,32 @@ Special rules:
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
-from clutchchess.game.moves import Cooldown, Move
+from clutchchess.game.moves import Cooldown, Move, PathPoint
 from clutchchess.game.pieces import Piece, PieceType
 
 # Capture distance threshold (in board squares)
 # Two pieces within this distance will result in a capture
 CAPTURE_DISTANCE = 0.4
+# Squared threshold, so distance checks can skip the sqrt
+CAPTURE_DISTANCE_SQ = CAPTURE_DISTANCE * CAPTURE_DISTANCE
 
+# Fraction of a knight's move spent airborne (unable to collide or capture)
+KNIGHT_AIRBORNE_FRACTION = 0.85
 
-@dataclass
+
+@lru_cache(maxsize=16)
+def _knight_airborne_ticks(ticks_per_square: int) -> int:
+    """Ticks a knight stays airborne, as a whole tick count.
+
+    Elapsed ticks are integers, so comparing against the rounded-up threshold
+    gives the same result as comparing progress against the fraction.
+    """
+    return math.ceil(2 * ticks_per_square * KNIGHT_AIRBORNE_FRACTION)
+
+
+@dataclass(slots=True, frozen=True)
 class Capture:
     """Represents a capture event.
 
@@ -73,7 +89,18 @@ def get_interpolated_position(
     if ticks_elapsed < 0:
         return (piece.row, piece.col)
 
-    path = active_move.path
+    cached = active_move._position_cache
+    if cached is not None and cached[0] == current_tick and cached[1] == ticks_per_square:
+        return cached[2]
+    pos = _path_position(active_move.path, ticks_elapsed, ticks_per_square)
+    active_move._position_cache = (current_tick, ticks_per_square, pos)
+    return pos
+
+
+def _path_position(
+    path: list[PathPoint], ticks_elapsed: int, ticks_per_square: int
+) -> tuple[float, float]:
+    """Interpolate a position ticks_elapsed ticks along a move's path."""
     total_squares = len(path) - 1
 
     if total_squares == 0:
@@ -147,7 +174,7 @@ def get_knight_position(
 
     # Knights are airborne (invisible) for first 85% of move
     # This matches the capture threshold so visibility and capture ability are symmetric
-    if ticks_elapsed < total_ticks * 0.85:
+    if ticks_elapsed < _knight_airborne_ticks(ticks_per_square):
         return None
 
     # Last 15%: visible, interpolating toward destination
@@ -174,10 +201,7 @@ def can_knight_capture(
 
     Knights can only capture when 85%+ through their move.
     """
-    ticks_elapsed = current_tick - move.start_tick
-    total_ticks = 2 * ticks_per_square
-    progress = ticks_elapsed / total_ticks
-    return progress >= 0.85
+    return current_tick - move.start_tick >= _knight_airborne_ticks(ticks_per_square)
 
 
 def detect_collisions(
@@ -197,46 +221,24 @@ def detect_collisions(
     Returns:
         List of Capture events that occurred
     """
+    # Two stationary pieces can't collide, so with nothing moving (the
+    # common case between moves) there is nothing to check
+    if not active_moves:
+        return []
+
     captures: list[Capture] = []
 
     # Build lookup for active moves by piece ID (do this first to avoid O(n) scans)
     move_by_piece: dict[str, Move] = {m.piece_id: m for m in active_moves}
 
-    # Separate moving and stationary pieces
-    # Key insight: two stationary pieces can't collide - at least one must be moving
-    moving: list[tuple[Piece, tuple[float, float]]] = []
-    stationary: list[tuple[Piece, tuple[float, float]]] = []
-
-    for piece in pieces:
-        if piece.captured:
-            continue
-
-        piece_move = move_by_piece.get(piece.id)
-        if piece.type == PieceType.KNIGHT:
-            pos = get_knight_position(piece, None, current_tick, ticks_per_square, move=piece_move)
-        else:
-            pos = get_interpolated_position(piece, None, current_tick, ticks_per_square, move=piece_move)
-
-        if pos is not None:  # Skip airborne knights
-            if piece_move is not None:
-                moving.append((piece, pos))
-            else:
-                stationary.append((piece, pos))
-
-    # Helper to check a pair and append captures if collision detected
+    # Helper to check a candidate pair and append captures if collision detected.
+    # Callers have already rejected same-player pairs and pairs that are at least
+    # CAPTURE_DISTANCE apart on either axis.
     def check_pair(piece_a: Piece, pos_a: tuple[float, float],
                    piece_b: Piece, pos_b: tuple[float, float]) -> None:
-        # Same player pieces don't capture each other
-        if piece_a.player == piece_b.player:
-            return
-
-        # Check distance - early exit if either axis exceeds threshold (avoids sqrt)
         dr = pos_a[0] - pos_b[0]
         dc = pos_a[1] - pos_b[1]
-        if abs(dr) >= CAPTURE_DISTANCE or abs(dc) >= CAPTURE_DISTANCE:
-            return
-        dist = math.sqrt(dr * dr + dc * dc)
-        if dist >= CAPTURE_DISTANCE:
+        if dr * dr + dc * dc >= CAPTURE_DISTANCE_SQ:
             return
 
         # Check if knights can capture (must be 85%+ through their move)
@@ -265,31 +267,74 @@ def detect_collisions(
                 )
             )
         elif winner is None and loser is None:
-            # Mutual destruction - both pieces are captured
-            captures.append(
-                Capture(
-                    capturing_piece_id="",  # No winner
-                    captured_piece_id=piece_a.id,
-                    position=collision_pos,
-                )
-            )
-            captures.append(
-                Capture(
-                    capturing_piece_id="",  # No winner
-                    captured_piece_id=piece_b.id,
-                    position=collision_pos,
+            # Mutual destruction - both pieces are captured at the shared midpoint
+            captures.extend(
+                (
+                    Capture(
+                        capturing_piece_id="",  # No winner
+                        captured_piece_id=piece_a.id,
+                        position=collision_pos,
+                    ),
+                    Capture(
+                        capturing_piece_id="",  # No winner
+                        captured_piece_id=piece_b.id,
+                        position=collision_pos,
+                    ),
                 )
             )
 
-    # Check moving vs moving pairs
-    for i, (piece_a, pos_a) in enumerate(moving):
-        for piece_b, pos_b in moving[i + 1 :]:
-            check_pair(piece_a, pos_a, piece_b, pos_b)
+    # Single pass: each piece is checked against the pieces already seen, so
+    # positions are never collected into a separate list first.
+    # Key insight: two stationary pieces can't collide - at least one must be moving.
+    # Stationary pieces are bucketed by player so a moving piece only scans its
+    # opponents' buckets and same-player pairs are never visited. Almost every
+    # other pair is same-player or far apart on an axis, so those cheap
+    # rejections run inline and check_pair is only called for the few candidates.
+    moving: list[tuple[Piece, tuple[float, float]]] = []
+    stationary_by_player: dict[int, list[tuple[Piece, tuple[float, float]]]] = {}
+
+    for piece in pieces:
+        if piece.captured:
+            continue
+
+        piece_move = move_by_piece.get(piece.id)
+        if piece.type == PieceType.KNIGHT:
+            pos = get_knight_position(piece, None, current_tick, ticks_per_square, move=piece_move)
+        else:
+            pos = get_interpolated_position(piece, None, current_tick, ticks_per_square, move=piece_move)
 
-    # Check moving vs stationary pairs
-    for piece_a, pos_a in moving:
-        for piece_b, pos_b in stationary:
-            check_pair(piece_a, pos_a, piece_b, pos_b)
+        if pos is None:  # Skip airborne knights
+            continue
+
+        player = piece.player
+        row, col = pos
+
+        # Moving pieces seen so far can hit this piece whether or not it moves
+        for other, other_pos in moving:
+            if (
+                other.player == player
+                or abs(other_pos[0] - row) >= CAPTURE_DISTANCE
+                or abs(other_pos[1] - col) >= CAPTURE_DISTANCE
+            ):
+                continue
+            check_pair(other, other_pos, piece, pos)
+
+        if piece_move is None:
+            stationary_by_player.setdefault(player, []).append((piece, pos))
+            continue
+
+        for other_player, stationary in stationary_by_player.items():
+            if other_player == player:
+                continue
+            for other, other_pos in stationary:
+                if (
+                    abs(other_pos[0] - row) >= CAPTURE_DISTANCE
+                    or abs(other_pos[1] - col) >= CAPTURE_DISTANCE
+                ):
+                    continue
+                check_pair(piece, pos, other, other_pos)
+
+        moving.append((piece, pos))
 
     return captures
 
@@ -314,9 +359,16 @@ def _determine_capture_winner(
     move_a = move_by_piece.get(piece_a.id)
     move_b = move_by_piece.get(piece_b.id)
 
-    # Check pawn moving straight (can't capture)
-    a_can_capture = _can_piece_capture(piece_a, move_a)
-    b_can_capture = _can_piece_capture(piece_b, move_b)
+    # Only pawns can be unable to capture, so other pairs go straight to timing
+    a_is_pawn = piece_a.type is PieceType.PAWN
+    b_is_pawn = piece_b.type is PieceType.PAWN
+    if not a_is_pawn and not b_is_pawn:
+        return _capture_winner_by_timing(piece_a, move_a, piece_b, move_b)
+
+    # Pawns moving straight (forward) can't capture; only diagonal pawn moves
+    # can. Stationary pawns capture opponents that run into them.
+    a_can_capture = not (a_is_pawn and move_a is not None and move_a.keeps_column)
+    b_can_capture = not (b_is_pawn and move_b is not None and move_b.keeps_column)
 
     # Special case: two pawns moving straight - earlier one survives
     # (neither "captures", but the later one dies from the collision)
@@ -337,7 +389,16 @@ def _determine_capture_winner(
     if b_can_capture and not a_can_capture:
         return (piece_b, piece_a)
 
-    # Both can capture - use timing rules
+    return _capture_winner_by_timing(piece_a, move_a, piece_b, move_b)
+
+
+def _capture_winner_by_timing(
+    piece_a: Piece,
+    move_a: Move | None,
+    piece_b: Piece,
+    move_b: Move | None,
+) -> tuple[Piece | None, Piece | None]:
+    """Apply the timing rules to a collision where both pieces can capture."""
     a_moving = move_a is not None
     b_moving = move_b is not None
 
@@ -362,47 +423,12 @@ def _determine_capture_winner(
     return (None, None)
 
 
-def _is_pawn_moving_straight(piece: Piece, move: Move | None) -> bool:
-    """Check if a pawn is moving straight (forward, not diagonally).
-
-    Returns True only for pawns that are actively moving in a straight line.
-    Returns False for:
-    - Non-pawn pieces
-    - Stationary pawns
-    - Pawns moving diagonally
-    """
-    if piece.type != PieceType.PAWN:
-        return False
-
-    if move is None:
-        return False
-
-    if len(move.path) < 2:
-        return False
-
-    start_col = move.path[0][1]
-    end_col = move.path[-1][1]
-
-    # Straight move = same column
-    return start_col == end_col
-
-
-def _can_piece_capture(piece: Piece, move: Move | None) -> bool:
-    """Check if a piece can make a capture given its current movement.
+def is_piece_moving(piece_id: str, active_moves: list[Move]) -> bool:
+    """Check if a piece is currently moving.
 
-    Most pieces can always capture. The exception is pawns moving straight
-    (forward) - they cannot capture, only pawns moving diagonally can capture.
-    Stationary pieces can capture if an opponent runs into them.
+    When checking every piece, build {m.piece_id: m for m in active_moves}
+    once and test membership instead.
     """
-    # Pawns moving straight cannot capture
-    if _is_pawn_moving_straight(piece, move):
-        return False
-
-    return True
-
-
-def is_piece_moving(piece_id: str, active_moves: list[Move]) -> bool:
-    """Check if a piece is currently moving."""
     return any(m.piece_id == piece_id for m in active_moves)
 
 
@@ -417,3 +443,12 @@ def is_piece_on_cooldown(
         if cd.piece_id == piece_id and cd.is_active(current_tick):
             return True
     return False
+
+
+def cooldown_piece_ids(cooldowns: list[Cooldown], current_tick: int) -> set[str]:
+    """Get the IDs of all pieces on cooldown.
+
+    Use this instead of is_piece_on_cooldown when checking every piece on the
+    board, so the cooldown list is scanned once rather than once per piece.
+    """
+    return {cd.piece_id for cd in cooldowns if cd.is_active(current_tick)}
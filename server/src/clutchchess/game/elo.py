@@ -5,6 +5,7 @@ along with a belt ranking system based on rating thresholds.
 """
 
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
 
 DEFAULT_RATING = 1200
@@ -13,6 +14,9 @@ K_FACTOR = 32
 K_FACTOR_HIGH = 16  # Used for ratings above HIGH_RATING_THRESHOLD
 HIGH_RATING_THRESHOLD = 2000
 
+# 10 ** (d / 400) == exp(d * ln(10) / 400); exp avoids the generic pow path
+_LN10_OVER_400 = math.log(10) / 400.0
+
 # Belt thresholds (rating, belt_name) - ordered highest to lowest
 BELT_THRESHOLDS = [
     (2300, "black"),
@@ -26,8 +30,12 @@ BELT_THRESHOLDS = [
     (0, "white"),
 ]
 
+# Ascending views of BELT_THRESHOLDS for bisecting in get_belt
+_BELT_FLOORS = tuple(threshold for threshold, _ in reversed(BELT_THRESHOLDS))
+_BELT_NAMES = tuple(belt for _, belt in reversed(BELT_THRESHOLDS))
+
 
-@dataclass
+@dataclass(slots=True)
 class RatingChange:
     """Result of a rating update for a single player."""
 
@@ -41,7 +49,7 @@ class RatingChange:
         self.belt_changed = self.old_belt != self.new_belt
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserRatingStats:
     """User's rating stats for a specific mode."""
 
@@ -58,10 +66,8 @@ def get_belt(rating: int | None) -> str:
     """Get belt name for a given rating. Returns 'none' for unranked."""
     if rating is None:
         return "none"
-    for threshold, belt in BELT_THRESHOLDS:
-        if rating >= threshold:
-            return belt
-    return "white"
+    # Index of the highest floor <= rating; ratings below every floor are white
+    return _BELT_NAMES[max(bisect_right(_BELT_FLOORS, rating) - 1, 0)]
 
 
 def get_k_factor(rating: int) -> int:
@@ -76,7 +82,7 @@ def clamp_rating(rating: int) -> int:
 
 def calculate_expected_score(rating_a: int, rating_b: int) -> float:
     """Calculate expected score for player A against player B."""
-    return 1.0 / (1 + math.pow(10, (rating_b - rating_a) / 400.0))
+    return 1.0 / (1.0 + math.exp((rating_b - rating_a) * _LN10_OVER_400))
 
 
 def update_ratings_2p(
@@ -136,36 +142,39 @@ def update_ratings_4p(
     Returns:
         Dict mapping player_num to new rating
     """
-    new_ratings = {}
-    players = list(ratings.keys())
+    # Player numbers are a tiny range, so work on parallel lists by index and
+    # only build the result dict at the end
+    players = list(ratings)
+    current = [ratings[player] for player in players]
+    count = len(players)
+    winner_index = players.index(winner) if winner in ratings else -1
 
-    for player in players:
+    new_ratings = {}
+    for i in range(count):
         total_change = 0.0
-        my_rating = ratings[player]
+        my_rating = current[i]
         k = get_k_factor(my_rating)
 
-        for opponent in players:
-            if opponent == player:
+        for j in range(count):
+            if j == i:
                 continue
 
-            opp_rating = ratings[opponent]
-            expected = calculate_expected_score(my_rating, opp_rating)
+            expected = calculate_expected_score(my_rating, current[j])
 
-            # Determine actual score against this opponent
-            if winner == 0:  # Draw
-                actual = 0.5
-            elif winner == player:  # I won
+            # Determine actual score against this opponent. A draw (winner 0)
+            # matches no index, so it falls through to 0.5 like a third-party win.
+            if winner_index == i:  # I won
                 actual = 1.0
-            elif winner == opponent:  # This opponent won
+            elif winner_index == j:  # This opponent won
                 actual = 0.0
-            else:  # Neither of us won - treated as draw
+            else:  # Draw, or neither of us won - treated as draw
                 actual = 0.5
 
             total_change += k * (actual - expected)
 
         # Average the change across all opponents
-        avg_change = total_change / (len(players) - 1)
-        new_ratings[player] = clamp_rating(int(round(my_rating + avg_change)))
+        avg_change = total_change / (count - 1)
+        new_ratings[players[i]] = clamp_rating(int(round(my_rating + avg_change)))
 
     return new_ratings
 
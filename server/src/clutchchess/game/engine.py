@@ -13,6 +13,7 @@ from enum import Enum
 
 from clutchchess.game.board import Board, BoardType
 from clutchchess.game.collision import (
+    cooldown_piece_ids,
     detect_collisions,
     get_interpolated_position,
     is_piece_moving,
@@ -594,12 +595,12 @@ class GameEngine:
         if king is None or king.captured:
             return legal_moves
 
+        moving_ids = {m.piece_id for m in state.active_moves}
+        cooldown_ids = cooldown_piece_ids(state.cooldowns, state.current_tick)
         for piece in state.board.get_pieces_for_player(player):
             if piece.captured:
                 continue
-            if is_piece_moving(piece.id, state.active_moves):
-                continue
-            if is_piece_on_cooldown(piece.id, state.cooldowns, state.current_tick):
+            if piece.id in moving_ids or piece.id in cooldown_ids:
                 continue
 
             candidates = _get_piece_candidates(piece, state.board, state.active_moves)
@@ -1,7 +1,7 @@
 """Move definitions and validation for Clutch Chess."""
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from clutchchess.game.board import Board, BoardType
 from clutchchess.game.pieces import Piece, PieceType
@@ -52,7 +52,7 @@ FOUR_PLAYER_ORIENTATIONS: dict[int, PlayerOrientation] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Move:
     """Represents an active piece movement.
 
@@ -62,6 +62,8 @@ class Move:
               Usually integers, but knights use float midpoints.
         start_tick: Game tick when the move started
         extra_move: Optional secondary move (e.g., rook in castling)
+        keeps_column: Whether the path starts and ends in the same column
+              (set from the path; a pawn doing this is moving straight)
     """
 
     piece_id: str
@@ -69,6 +71,18 @@ class Move:
     start_tick: int
     extra_move: "Move | None" = None
 
+    # Cache for get_interpolated_position: (tick, ticks_per_square, position).
+    # Collision detection and the state broadcast ask for the same tick.
+    _position_cache: tuple[int, int, tuple[float, float]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    keeps_column: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Collision checks consult this for every pawn collision, and a
+        # move's path is fixed once it is created
+        self.keeps_column = len(self.path) >= 2 and self.path[0][1] == self.path[-1][1]
+
     @property
     def start_position(self) -> PathPoint:
         """Get the starting position of the move."""
@@ -12,6 +12,7 @@ from slowapi.errors import RateLimitExceeded
 
 from clutchchess.api.router import api_router
 from clutchchess.auth.rate_limit import limiter
+from clutchchess.redis import RedisActiveGameRepository, close_redis, get_redis
 from clutchchess.settings import get_settings
 from clutchchess.ws.handler import handle_websocket
 from clutchchess.ws.lobby_handler import handle_lobby_websocket
@@ -57,18 +58,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Clean up stale active game entries from previous runs
     try:
-        from clutchchess.db.repositories.active_games import ActiveGameRepository
-        from clutchchess.db.session import async_session_factory
-
-        async with async_session_factory() as session:
-            repo = ActiveGameRepository(session)
-            cleaned = await repo.cleanup_by_server(server_id)
-            if cleaned:
-                logger.info(f"Cleaned up {cleaned} stale active game entries from previous run")
-            stale = await repo.cleanup_stale(max_age_hours=2)
-            if stale:
-                logger.info(f"Cleaned up {stale} globally stale active game entries")
-            await session.commit()
+        repo = RedisActiveGameRepository(get_redis())
+        cleaned = await repo.cleanup_by_server(server_id)
+        if cleaned:
+            logger.info(f"Cleaned up {cleaned} stale active game entries from previous run")
+        stale = await repo.cleanup_stale(max_age_hours=2)
+        if stale:
+            logger.info(f"Cleaned up {stale} globally stale active game entries")
     except Exception:
         logger.exception("Failed to clean up stale active games on startup")
 
@@ -77,15 +73,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Clutch Chess server")
     try:
-        from clutchchess.db.repositories.active_games import ActiveGameRepository
-        from clutchchess.db.session import async_session_factory
-
-        async with async_session_factory() as session:
-            repo = ActiveGameRepository(session)
-            await repo.cleanup_by_server(server_id)
-            await session.commit()
+        repo = RedisActiveGameRepository(get_redis())
+        await repo.cleanup_by_server(server_id)
     except Exception:
         logger.exception("Failed to clean up active games on shutdown")
+    await close_redis()
 
 
 app = FastAPI(
@@ -1 +1,10 @@
 """Redis integration."""
+
+from clutchchess.redis.active_games import RedisActiveGameRepository
+from clutchchess.redis.client import close_redis, get_redis
+
+__all__ = [
+    "RedisActiveGameRepository",
+    "close_redis",
+    "get_redis",
+]
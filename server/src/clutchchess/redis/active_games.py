@@ -0,0 +1,235 @@
+"""Active games registry stored in Redis.
+
+The registry is ephemeral and churns with every game start and finish, so it
+lives in Redis rather than Postgres: no WAL, vacuum or index bloat, and
+abandoned entries expire on their own.
+
+Keys:
+    active_games:game:{game_id}       HASH of the game's registry fields (TTL)
+    active_games:by_start             ZSET of game_id scored by start time
+    active_games:by_server:{server}   SET of game_ids hosted by a server
+"""
+
+import json
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+
+from redis.asyncio import Redis
+
+from clutchchess.db.models import ActiveGame
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are dropped even if the game never deregistered
+ACTIVE_GAME_TTL_SECONDS = 2 * 3600
+
+_INDEX_KEY = "active_games:by_start"
+
+# list_active walks the start-time index this many ids at a time (or limit,
+# if larger) and stops as soon as it has enough matching games
+LIST_PAGE_SIZE = 50
+
+# list_active results for live games polling:
+# (speed, player_count, game_type, limit) -> (monotonic time cached, games).
+# Writes through this process clear it; other servers' registrations show up
+# once the entry expires.
+LIST_CACHE_TTL_SECONDS = 2.0
+LIST_CACHE_MAX_SIZE = 64
+_list_cache: dict[tuple[str | None, int | None, str | None, int], tuple[float, list[ActiveGame]]] = {}
+
+
+def clear_list_cache() -> None:
+    """Drop all cached list_active results."""
+    _list_cache.clear()
+
+
+def _game_key(game_id: str) -> str:
+    return f"active_games:game:{game_id}"
+
+
+def _server_key(server_id: str) -> str:
+    return f"active_games:by_server:{server_id}"
+
+
+def _to_model(data: dict[str, str]) -> ActiveGame:
+    """Build a detached ActiveGame from a registry hash."""
+    return ActiveGame(
+        game_id=data["game_id"],
+        game_type=data["game_type"],
+        speed=data["speed"],
+        player_count=int(data["player_count"]),
+        board_type=data["board_type"],
+        players=json.loads(data["players"]),
+        lobby_code=data["lobby_code"] or None,
+        campaign_level_id=int(data["campaign_level_id"]) if data["campaign_level_id"] else None,
+        started_at=datetime.fromisoformat(data["started_at"]),
+        server_id=data["server_id"],
+    )
+
+
+class RedisActiveGameRepository:
+    """Repository for the active games registry, backed by Redis.
+
+    Mirrors ActiveGameRepository's interface; list_active returns detached
+    ActiveGame instances so callers can treat both the same way.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    async def register(
+        self,
+        game_id: str,
+        game_type: str,
+        speed: str,
+        player_count: int,
+        board_type: str,
+        players: list[dict],
+        server_id: str,
+        lobby_code: str | None = None,
+        campaign_level_id: int | None = None,
+    ) -> None:
+        """Register a new active game."""
+        started_at = datetime.now(UTC)
+        key = _game_key(game_id)
+        server_key = _server_key(server_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "game_id": game_id,
+                    "game_type": game_type,
+                    "speed": speed,
+                    "player_count": player_count,
+                    "board_type": board_type,
+                    "players": json.dumps(players),
+                    "lobby_code": lobby_code or "",
+                    "campaign_level_id": "" if campaign_level_id is None else campaign_level_id,
+                    "started_at": started_at.isoformat(),
+                    "server_id": server_id,
+                },
+            )
+            pipe.expire(key, ACTIVE_GAME_TTL_SECONDS)
+            pipe.zadd(_INDEX_KEY, {game_id: started_at.timestamp()})
+            pipe.sadd(server_key, game_id)
+            pipe.expire(server_key, ACTIVE_GAME_TTL_SECONDS)
+            await pipe.execute()
+        clear_list_cache()
+        logger.info(f"Registered active game {game_id} (type={game_type})")
+
+    async def deregister(self, game_id: str) -> bool:
+        """Remove a game from the active registry. Returns True if removed."""
+        removed = await self._remove([game_id]) > 0
+        if removed:
+            logger.info(f"Deregistered active game {game_id}")
+        return removed
+
+    async def deregister_many(self, game_ids: list[str]) -> int:
+        """Remove several games from the active registry.
+
+        Returns the number of entries removed.
+        """
+        count = await self._remove(game_ids)
+        if count > 0:
+            logger.info(f"Deregistered {count} active games")
+        return count
+
+    async def _remove(self, game_ids: list[str]) -> int:
+        """Delete games' hashes, index entries and server set memberships."""
+        if not game_ids:
+            return 0
+
+        # The owning server is needed to prune its set; expired hashes
+        # return None and only need their index entry removed.
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for game_id in game_ids:
+                pipe.hget(_game_key(game_id), "server_id")
+            server_ids = await pipe.execute()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(_INDEX_KEY, *game_ids)
+            pipe.delete(*(_game_key(game_id) for game_id in game_ids))
+            for game_id, server_id in zip(game_ids, server_ids, strict=True):
+                if server_id is not None:
+                    pipe.srem(_server_key(server_id), game_id)
+            results = await pipe.execute()
+        clear_list_cache()
+        return results[0]
+
+    async def list_active(
+        self,
+        speed: str | None = None,
+        player_count: int | None = None,
+        game_type: str | None = None,
+        limit: int = 50,
+    ) -> list[ActiveGame]:
+        """List active games, newest first, with optional filters.
+
+        Results are cached for LIST_CACHE_TTL_SECONDS, so a game registered
+        on another server may take that long to appear.
+        """
+        key = (speed, player_count, game_type, limit)
+        cached = _list_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < LIST_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
+        page_size = max(limit, LIST_PAGE_SIZE)
+        games: list[ActiveGame] = []
+        expired: list[str] = []
+        start = 0
+        while len(games) < limit:
+            game_ids = await self.redis.zrevrange(_INDEX_KEY, start, start + page_size - 1)
+            if not game_ids:
+                break
+            start += page_size
+
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for game_id in game_ids:
+                    pipe.hgetall(_game_key(game_id))
+                entries = await pipe.execute()
+
+            for game_id, data in zip(game_ids, entries, strict=True):
+                if not data:
+                    expired.append(game_id)
+                    continue
+                if len(games) >= limit:
+                    continue
+                game = _to_model(data)
+                if speed and game.speed != speed:
+                    continue
+                if player_count and game.player_count != player_count:
+                    continue
+                if game_type and game.game_type != game_type:
+                    continue
+                games.append(game)
+
+        if expired:
+            # Hashes that hit their TTL leave index entries behind
+            await self.redis.zrem(_INDEX_KEY, *expired)
+
+        _list_cache.pop(key, None)
+        if len(_list_cache) >= LIST_CACHE_MAX_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _list_cache[next(iter(_list_cache))]
+        _list_cache[key] = (now, games)
+        return list(games)
+
+    async def cleanup_stale(self, max_age_hours: int = 2) -> int:
+        """Remove entries older than max_age_hours (crash recovery)."""
+        cutoff = datetime.now(UTC) - timedelta(hours=max_age_hours)
+        game_ids = await self.redis.zrangebyscore(_INDEX_KEY, "-inf", cutoff.timestamp())
+        count = await self._remove(game_ids)
+        if count > 0:
+            logger.info(f"Cleaned up {count} stale active game entries")
+        return count
+
+    async def cleanup_by_server(self, server_id: str) -> int:
+        """Remove all entries for a specific server (server restart cleanup)."""
+        game_ids = list(await self.redis.smembers(_server_key(server_id)))
+        count = await self._remove(game_ids)
+        await self.redis.delete(_server_key(server_id))
+        if count > 0:
+            logger.info(f"Cleaned up {count} active game entries for server {server_id}")
+        return count
@@ -0,0 +1,24 @@
+"""Shared Redis client."""
+
+from redis.asyncio import Redis
+
+from clutchchess.settings import get_settings
+
+# Reusable client (lazy singleton); it manages its own connection pool
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Get or create the shared Redis client."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(get_settings().redis_url, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client, if it was created."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
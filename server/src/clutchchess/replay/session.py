@@ -29,11 +29,7 @@ from typing import Any
 
 from fastapi import WebSocket
 
-from clutchchess.game.collision import (
-    get_interpolated_position,
-    is_piece_moving,
-    is_piece_on_cooldown,
-)
+from clutchchess.game.collision import cooldown_piece_ids, get_interpolated_position
 from clutchchess.game.replay import Replay, ReplayEngine
 from clutchchess.game.state import GameState
 
@@ -442,12 +438,18 @@ class ReplaySession:
 
         # Build piece data
         pieces_data = []
+        move_by_piece = {m.piece_id: m for m in state.active_moves}
+        cooldown_ids = cooldown_piece_ids(state.cooldowns, state.current_tick)
         for piece in state.board.pieces:
             if piece.captured:
                 continue
 
             pos = get_interpolated_position(
-                piece, state.active_moves, state.current_tick, config.ticks_per_square
+                piece,
+                None,
+                state.current_tick,
+                config.ticks_per_square,
+                move=move_by_piece.get(piece.id),
             )
             pieces_data.append(
                 {
@@ -457,10 +459,8 @@ class ReplaySession:
                     "row": pos[0],
                     "col": pos[1],
                     "captured": piece.captured,
-                    "moving": is_piece_moving(piece.id, state.active_moves),
-                    "on_cooldown": is_piece_on_cooldown(
-                        piece.id, state.cooldowns, state.current_tick
-                    ),
+                    "moving": piece.id in move_by_piece,
+                    "on_cooldown": piece.id in cooldown_ids,
                     "moved": piece.moved,
                 }
             )
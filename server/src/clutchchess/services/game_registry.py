@@ -3,8 +3,7 @@
 import asyncio
 import logging
 
-from clutchchess.db.repositories.active_games import ActiveGameRepository
-from clutchchess.db.session import async_session_factory
+from clutchchess.redis import RedisActiveGameRepository, get_redis
 from clutchchess.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -13,6 +12,10 @@ logger = logging.getLogger(__name__)
 # See: https://docs.python.org/3/library/asyncio-task.html#creating-tasks
 _background_tasks: set[asyncio.Task] = set()
 
+# Games waiting to be deregistered. Requests made before the flush task
+# first runs (e.g. a cleanup_stale_games sweep) share one Redis round trip.
+_pending_deregistrations: set[str] = set()
+
 
 async def _register_game(
     game_id: str,
@@ -24,36 +27,34 @@ async def _register_game(
     lobby_code: str | None = None,
     campaign_level_id: int | None = None,
 ) -> None:
-    """Register a game in the database (runs in background)."""
+    """Register a game in the active games registry (runs in background)."""
     try:
         server_id = get_settings().effective_server_id
-        async with async_session_factory() as session:
-            repo = ActiveGameRepository(session)
-            await repo.register(
-                game_id=game_id,
-                game_type=game_type,
-                speed=speed,
-                player_count=player_count,
-                board_type=board_type,
-                players=players,
-                server_id=server_id,
-                lobby_code=lobby_code,
-                campaign_level_id=campaign_level_id,
-            )
-            await session.commit()
+        repo = RedisActiveGameRepository(get_redis())
+        await repo.register(
+            game_id=game_id,
+            game_type=game_type,
+            speed=speed,
+            player_count=player_count,
+            board_type=board_type,
+            players=players,
+            server_id=server_id,
+            lobby_code=lobby_code,
+            campaign_level_id=campaign_level_id,
+        )
     except Exception:
         logger.exception(f"Failed to register active game {game_id}")
 
 
-async def _deregister_game(game_id: str) -> None:
-    """Deregister a game from the database (runs in background)."""
+async def _deregister_pending_games() -> None:
+    """Deregister every queued game from the registry (runs in background)."""
+    game_ids = list(_pending_deregistrations)
+    _pending_deregistrations.clear()
     try:
-        async with async_session_factory() as session:
-            repo = ActiveGameRepository(session)
-            await repo.deregister(game_id)
-            await session.commit()
+        repo = RedisActiveGameRepository(get_redis())
+        await repo.deregister_many(game_ids)
     except Exception:
-        logger.exception(f"Failed to deregister active game {game_id}")
+        logger.exception(f"Failed to deregister active games {game_ids}")
 
 
 def register_game_fire_and_forget(
@@ -85,6 +86,10 @@ def register_game_fire_and_forget(
 
 def deregister_game_fire_and_forget(game_id: str) -> None:
     """Schedule game deregistration as a fire-and-forget task."""
-    task = asyncio.create_task(_deregister_game(game_id))
+    flush_scheduled = bool(_pending_deregistrations)
+    _pending_deregistrations.add(game_id)
+    if flush_scheduled:
+        return
+    task = asyncio.create_task(_deregister_pending_games())
     _background_tasks.add(task)
     task.add_done_callback(_background_tasks.discard)
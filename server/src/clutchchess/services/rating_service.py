@@ -10,7 +10,6 @@ import logging
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import noload
 
 from clutchchess.db.models import User
 from clutchchess.game.elo import (
@@ -115,11 +114,8 @@ class RatingService:
 
         # Lock user rows to prevent concurrent rating updates
         # ORDER BY id prevents deadlocks when multiple games finish
-        # Use noload to avoid LEFT OUTER JOIN with oauth_accounts (FOR UPDATE
-        # doesn't work with nullable outer joins in PostgreSQL)
         stmt = (
             select(User)
-            .options(noload(User.oauth_accounts))
             .where(User.id.in_(user_ids))
             .order_by(User.id)
             .with_for_update()
@@ -1,9 +1,12 @@
 """S3 service for profile picture uploads."""
 
 import logging
+import os
 import uuid
+from typing import BinaryIO
 
 import boto3
+from botocore.config import Config
 
 from clutchchess.settings import get_settings
 
@@ -22,7 +25,18 @@ _MAGIC_BYTES = {
     b"RIFF": "image/webp",  # WebP starts with RIFF....WEBP
 }
 
-# Reusable boto3 client (lazy singleton)
+# Bytes needed to identify any allowed type (WebP's signature ends at offset 12)
+_MAGIC_HEADER_SIZE = 12
+
+# Reusable boto3 client (lazy singleton). Its connection pool is shared by
+# all upload threads, so keep enough kept-alive connections that concurrent
+# uploads don't queue for a connection or pay a fresh TLS handshake.
+S3_MAX_POOL_CONNECTIONS = 50
+_S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
 _s3_client = None
 
 
@@ -51,15 +65,19 @@ def _get_s3_client():
             aws_access_key_id=settings.aws_access_key_id,
             aws_secret_access_key=settings.aws_secret_access_key,
             region_name=settings.aws_region,
+            config=_S3_CLIENT_CONFIG,
         )
     return _s3_client
 
 
-def upload_profile_picture(file_bytes: bytes, content_type: str) -> str:
+def upload_profile_picture(file_obj: BinaryIO, content_type: str) -> str:
     """Upload a profile picture to S3.
 
+    The file is streamed to S3 from its current storage (e.g. the upload's
+    spooled temp file) rather than being read into memory first.
+
     Args:
-        file_bytes: Raw image bytes (max 1MB).
+        file_obj: Seekable binary file with the raw image (max 1MB).
         content_type: MIME type (must be image/jpeg, image/png, image/gif, or image/webp).
 
     Returns:
@@ -70,11 +88,14 @@ def upload_profile_picture(file_bytes: bytes, content_type: str) -> str:
             or file bytes don't match declared content type.
         S3UploadError: If the upload to S3 fails.
     """
-    if len(file_bytes) < MIN_FILE_SIZE:
+    size = file_obj.seek(0, os.SEEK_END)
+    file_obj.seek(0)
+
+    if size < MIN_FILE_SIZE:
         raise ValueError("File is empty")
 
-    if len(file_bytes) > MAX_FILE_SIZE:
-        raise ValueError(f"File size {len(file_bytes)} exceeds maximum of {MAX_FILE_SIZE} bytes")
+    if size > MAX_FILE_SIZE:
+        raise ValueError(f"File too large: {size} bytes exceeds maximum of {MAX_FILE_SIZE} bytes")
 
     if content_type not in ALLOWED_CONTENT_TYPES:
         raise ValueError(
@@ -82,7 +103,9 @@ def upload_profile_picture(file_bytes: bytes, content_type: str) -> str:
             f"Must be one of: {', '.join(sorted(ALLOWED_CONTENT_TYPES))}"
         )
 
-    detected_type = _detect_content_type(file_bytes)
+    header = file_obj.read(_MAGIC_HEADER_SIZE)
+    file_obj.seek(0)
+    detected_type = _detect_content_type(header)
     if detected_type != content_type:
         raise ValueError("File content does not match declared content type")
 
@@ -94,10 +117,12 @@ def upload_profile_picture(file_bytes: bytes, content_type: str) -> str:
 
     try:
         client = _get_s3_client()
+        # put_object streams from the file object; upload_fileobj would spin
+        # up a transfer manager thread pool for a file of at most 1MB
         client.put_object(
             Bucket=settings.aws_bucket,
             Key=key,
-            Body=file_bytes,
+            Body=file_obj,
             ContentType=content_type,
             ACL="public-read",
         )
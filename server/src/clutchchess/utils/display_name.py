@@ -5,14 +5,24 @@ display names. Player IDs have the format:
 - u:{user_id} - Registered user (resolve username from database)
 - guest:{uuid} - Anonymous guest player
 - bot:{type} - AI player (e.g., bot:novice)
+
+The resolvers also accept a bare int as a registered user's ID, so callers
+that already know the ID don't have to format "u:{id}" only for it to be
+parsed again.
 """
 
+from collections.abc import Iterable
+
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import BigInteger, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from clutchchess.db.models import User
 
+# A player ID string, or an int for an already-parsed registered user ID
+PlayerRef = int | str
+
 
 class PlayerDisplay(BaseModel):
     """Resolved player display info for API responses."""
@@ -58,18 +68,20 @@ def format_player_id(player_id: str, username_map: dict[int, str] | None = None)
     return player_id
 
 
-def extract_user_ids(player_ids: list[str]) -> list[int]:
+def extract_user_ids(player_ids: Iterable[PlayerRef]) -> list[int]:
     """Extract user IDs from a list of player IDs.
 
     Args:
-        player_ids: List of player IDs to extract user IDs from
+        player_ids: Player IDs (or bare user IDs) to extract user IDs from
 
     Returns:
         List of user IDs (integers) for players that are registered users
     """
     user_ids = []
     for player_id in player_ids:
-        if player_id.startswith("u:"):
+        if isinstance(player_id, int):
+            user_ids.append(player_id)
+        elif player_id.startswith("u:"):
             try:
                 user_id = int(player_id[2:])
                 user_ids.append(user_id)
@@ -78,6 +90,14 @@ def extract_user_ids(player_ids: list[str]) -> list[int]:
     return user_ids
 
 
+# Binding the IDs as one array parameter (= ANY) instead of an expanding IN
+# list keeps the SQL text identical for any number of users, so the statement
+# is prepared once per connection instead of once per distinct list length.
+_USER_INFO_QUERY = select(User.id, User.username, User.picture_url).where(
+    User.id == any_(bindparam("user_ids", type_=ARRAY(BigInteger)))
+)
+
+
 class _UserInfo:
     """Internal user info from DB query."""
 
@@ -103,23 +123,29 @@ async def _fetch_user_info(
     if not user_ids:
         return {}
 
-    result = await session.execute(
-        select(User.id, User.username, User.picture_url).where(User.id.in_(user_ids))
-    )
+    result = await session.execute(_USER_INFO_QUERY, {"user_ids": user_ids})
     return {
         row.id: _UserInfo(username=row.username, picture_url=row.picture_url)
         for row in result.all()
     }
 
 
+def _user_display(uid: int, user_info_map: dict[int, _UserInfo]) -> PlayerDisplay:
+    """Build the PlayerDisplay for a registered user."""
+    info = user_info_map.get(uid)
+    if info:
+        return PlayerDisplay(name=info.username, picture_url=info.picture_url, user_id=uid)
+    return PlayerDisplay(name=f"User {uid}", picture_url=None, user_id=uid)
+
+
 def _resolve_from_info(
-    players: dict[int, str],
+    players: dict[int, PlayerRef],
     user_info_map: dict[int, _UserInfo],
 ) -> dict[int, PlayerDisplay]:
     """Resolve player IDs to PlayerDisplay using a pre-fetched user info map.
 
     Args:
-        players: Dict mapping player number to player ID
+        players: Dict mapping player number to player ID (or bare user ID)
         user_info_map: Pre-fetched user info from _fetch_user_info()
 
     Returns:
@@ -127,28 +153,19 @@ def _resolve_from_info(
     """
     result: dict[int, PlayerDisplay] = {}
     for num, player_id in players.items():
-        if player_id.startswith("u:"):
+        if isinstance(player_id, int):
+            result[num] = _user_display(player_id, user_info_map)
+        elif player_id.startswith("u:"):
             try:
                 uid = int(player_id[2:])
-                info = user_info_map.get(uid)
-                if info:
-                    result[num] = PlayerDisplay(
-                        name=info.username,
-                        picture_url=info.picture_url,
-                        user_id=uid,
-                    )
-                else:
-                    result[num] = PlayerDisplay(
-                        name=f"User {uid}",
-                        picture_url=None,
-                        user_id=uid,
-                    )
             except ValueError:
                 result[num] = PlayerDisplay(
                     name=player_id,
                     picture_url=None,
                     user_id=None,
                 )
+            else:
+                result[num] = _user_display(uid, user_info_map)
         else:
             result[num] = PlayerDisplay(
                 name=format_player_id(player_id),
@@ -160,25 +177,25 @@ def _resolve_from_info(
 
 
 async def resolve_player_info(
-    session: AsyncSession, players: dict[int, str]
+    session: AsyncSession, players: dict[int, PlayerRef]
 ) -> dict[int, PlayerDisplay]:
     """Resolve a dict of player IDs to PlayerDisplay objects with picture URLs.
 
     Args:
         session: Database session
-        players: Dict mapping player number to player ID
+        players: Dict mapping player number to player ID (or bare user ID)
 
     Returns:
         Dict mapping player number to PlayerDisplay
     """
-    user_ids = extract_user_ids(list(players.values()))
+    user_ids = extract_user_ids(players.values())
     user_info_map = await _fetch_user_info(session, user_ids)
     return _resolve_from_info(players, user_info_map)
 
 
 async def resolve_player_info_batch(
     session: AsyncSession,
-    players_list: list[dict[int, str]],
+    players_list: list[dict[int, PlayerRef]],
 ) -> list[dict[int, PlayerDisplay]]:
     """Resolve multiple player dicts in a single DB query.
 
@@ -190,7 +207,7 @@ async def resolve_player_info_batch(
         List of resolved PlayerDisplay dicts, in the same order as input
     """
     # Collect all user IDs across all player dicts
-    all_player_ids: list[str] = []
+    all_player_ids: list[PlayerRef] = []
     for players in players_list:
         all_player_ids.extend(players.values())
 
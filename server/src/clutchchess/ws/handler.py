@@ -13,11 +13,7 @@ from clutchchess.campaign.levels import get_level
 from clutchchess.db.repositories.replays import ReplayRepository
 from clutchchess.db.repositories.user_game_history import UserGameHistoryRepository
 from clutchchess.db.session import async_session_factory
-from clutchchess.game.collision import (
-    get_interpolated_position,
-    is_piece_moving,
-    is_piece_on_cooldown,
-)
+from clutchchess.game.collision import cooldown_piece_ids, get_interpolated_position
 from clutchchess.game.state import TICK_RATE_HZ, GameStatus
 from clutchchess.lobby.manager import get_lobby_manager
 from clutchchess.services.game_registry import deregister_game_fire_and_forget
@@ -245,12 +241,18 @@ async def _send_initial_state(websocket: WebSocket, game_id: str, service: Any)
 
     # Build piece data
     pieces_data = []
+    move_by_piece = {m.piece_id: m for m in state.active_moves}
+    cooldown_ids = cooldown_piece_ids(state.cooldowns, state.current_tick)
     for piece in state.board.pieces:
         if piece.captured:
             continue
 
         pos = get_interpolated_position(
-            piece, state.active_moves, state.current_tick, config.ticks_per_square
+            piece,
+            None,
+            state.current_tick,
+            config.ticks_per_square,
+            move=move_by_piece.get(piece.id),
         )
         pieces_data.append(
             {
@@ -260,8 +262,8 @@ async def _send_initial_state(websocket: WebSocket, game_id: str, service: Any)
                 "row": pos[0],
                 "col": pos[1],
                 "captured": piece.captured,
-                "moving": is_piece_moving(piece.id, state.active_moves),
-                "on_cooldown": is_piece_on_cooldown(piece.id, state.cooldowns, state.current_tick),
+                "moving": piece.id in move_by_piece,
+                "on_cooldown": piece.id in cooldown_ids,
                 "moved": piece.moved,
             }
         )
@@ -623,6 +625,7 @@ async def _save_replay(game_id: str, service: Any) -> None:
                 # Save to user_game_history for each human player
                 history_repo = UserGameHistoryRepository(session)
                 game_time = replay.created_at or datetime.now(UTC)
+                history_entries: list[tuple[int, datetime, dict]] = []
 
                 for player_num, player_id in replay.players.items():
                     # Only save history for registered users (u:123 format)
@@ -653,7 +656,10 @@ async def _save_replay(game_id: str, service: Any) -> None:
                         "campaignLevelId": replay.campaign_level_id,
                     }
 
-                    await history_repo.add(user_id, game_time, game_info)
+                    history_entries.append((user_id, game_time, game_info))
+
+                # One multi-row INSERT for all players instead of one per player
+                await history_repo.add_many(history_entries)
 
                 await session.commit()
                 logger.info(f"Saved replay for game {game_id} ({len(replay.moves)} moves)")
@@ -917,9 +923,15 @@ async def _run_game_loop(game_id: str) -> None:
                 # so clients see the king marked as captured
                 config = state.config
                 final_pieces = []
+                move_by_piece = {m.piece_id: m for m in state.active_moves}
+                cooldown_ids = cooldown_piece_ids(state.cooldowns, state.current_tick)
                 for piece in state.board.pieces:
                     pos = get_interpolated_position(
-                        piece, state.active_moves, state.current_tick, config.ticks_per_square
+                        piece,
+                        None,
+                        state.current_tick,
+                        config.ticks_per_square,
+                        move=move_by_piece.get(piece.id),
                     )
                     final_pieces.append(
                         {
@@ -929,10 +941,8 @@ async def _run_game_loop(game_id: str) -> None:
                             "row": pos[0],
                             "col": pos[1],
                             "captured": piece.captured,
-                            "moving": is_piece_moving(piece.id, state.active_moves),
-                            "on_cooldown": is_piece_on_cooldown(
-                                piece.id, state.cooldowns, state.current_tick
-                            ),
+                            "moving": piece.id in move_by_piece,
+                            "on_cooldown": piece.id in cooldown_ids,
                             "moved": piece.moved,
                         }
                     )
@@ -1007,6 +1017,8 @@ async def _run_game_loop(game_id: str) -> None:
             if state_changed:
                 # Build state update message
                 pieces_data = []
+                move_by_piece = {m.piece_id: m for m in state.active_moves}
+                cooldown_ids = cooldown_piece_ids(state.cooldowns, state.current_tick)
                 for piece in state.board.pieces:
                     if piece.captured:
                         # Include captured pieces only if just captured via
@@ -1018,8 +1030,13 @@ async def _run_game_loop(game_id: str) -> None:
                         if not was_just_captured:
                             continue
 
+                    # Moving pieces reuse the position cached by this tick's collision pass
                     pos = get_interpolated_position(
-                        piece, state.active_moves, state.current_tick, config.ticks_per_square
+                        piece,
+                        None,
+                        state.current_tick,
+                        config.ticks_per_square,
+                        move=move_by_piece.get(piece.id),
                     )
                     pieces_data.append(
                         {
@@ -1029,10 +1046,8 @@ async def _run_game_loop(game_id: str) -> None:
                             "row": pos[0],
                             "col": pos[1],
                             "captured": piece.captured,
-                            "moving": is_piece_moving(piece.id, state.active_moves),
-                            "on_cooldown": is_piece_on_cooldown(
-                                piece.id, state.cooldowns, state.current_tick
-                            ),
+                            "moving": piece.id in move_by_piece,
+                            "on_cooldown": piece.id in cooldown_ids,
                             "moved": piece.moved,
                         }
                     )
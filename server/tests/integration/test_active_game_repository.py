@@ -203,6 +203,30 @@ class TestDeregister:
         await db_session.commit()
         assert await repo.deregister(game_id) is False
 
+    @pytest.mark.asyncio
+    async def test_deregister_many(self, db_session: AsyncSession):
+        """Several games are removed by one call; unknown IDs are ignored."""
+        game_ids = [generate_test_id(), generate_test_id()]
+        repo = ActiveGameRepository(db_session)
+        for game_id in game_ids:
+            await repo.register(
+                game_id=game_id,
+                game_type="quickplay",
+                speed="standard",
+                player_count=2,
+                board_type="standard",
+                players=_make_players(),
+                server_id="test-server",
+            )
+        await db_session.commit()
+
+        removed = await repo.deregister_many([*game_ids, "nonexistent-game-id"])
+        await db_session.commit()
+
+        assert removed == 2
+        remaining = {g.game_id for g in await repo.list_active()}
+        assert remaining.isdisjoint(game_ids)
+
 
 class TestListActive:
     """Tests for listing active games with filters."""
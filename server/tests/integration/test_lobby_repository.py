@@ -10,9 +10,13 @@ Run with: uv run pytest tests/integration/test_lobby_repository.py -v
 """
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from clutchchess.db.repositories.lobbies import LobbyRepository
+from clutchchess.db.models import Lobby as LobbyModel
+from clutchchess.db.models import LobbyPlayer as LobbyPlayerModel
+from clutchchess.db.repositories.lobbies import _READ_OPTIONS, LobbyRepository
 from clutchchess.lobby.models import Lobby, LobbyPlayer, LobbySettings, LobbyStatus
 
 from .conftest import generate_test_id
@@ -266,6 +270,31 @@ class TestLobbyRepositoryList:
             await repository.delete_by_code(code2)
             await db_session.commit()
 
+    @pytest.mark.asyncio
+    async def test_read_options_raise_on_unloaded_relationships(self, db_session: AsyncSession):
+        """Reads load players eagerly and refuse to lazy-load anything else."""
+        code = generate_test_id()
+
+        try:
+            repository = LobbyRepository(db_session)
+            await repository.save(create_test_lobby(code=code))
+            await db_session.commit()
+            db_session.expunge_all()
+
+            result = await db_session.execute(
+                select(LobbyModel).where(LobbyModel.code == code).options(*_READ_OPTIONS)
+            )
+            record = result.scalar_one()
+
+            assert len(record.players) == 1
+            with pytest.raises(InvalidRequestError):
+                _ = record.host
+            with pytest.raises(InvalidRequestError):
+                _ = record.players[0].user
+        finally:
+            await repository.delete_by_code(code)
+            await db_session.commit()
+
     @pytest.mark.asyncio
     async def test_list_public_waiting_filter_by_speed(self, db_session: AsyncSession):
         """Test filtering lobbies by speed."""
@@ -333,6 +362,25 @@ class TestLobbyRepositoryDelete:
         assert deleted is True
         assert await repository.get_by_code(code) is None
 
+    @pytest.mark.asyncio
+    async def test_delete_cascades_to_players(self, db_session: AsyncSession):
+        """Test that the database cascade removes the lobby's players."""
+        code = generate_test_id()
+        lobby = create_test_lobby(code=code)
+
+        repository = LobbyRepository(db_session)
+        record = await repository.save(lobby)
+        await db_session.commit()
+        lobby_id = record.id
+
+        await repository.delete_by_code(code)
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(LobbyPlayerModel.id).where(LobbyPlayerModel.lobby_id == lobby_id)
+        )
+        assert result.scalars().all() == []
+
     @pytest.mark.asyncio
     async def test_delete_not_found(self, db_session: AsyncSession):
         """Test deleting a nonexistent lobby."""
@@ -92,6 +92,24 @@ class TestUserGameHistoryRepositoryAdd:
         entries = await repository.list_by_user(TEST_USER_ID, limit=1, offset=0)
         assert len(entries) == 1
 
+    @pytest.mark.asyncio
+    async def test_add_many_creates_entries(
+        self, db_session: AsyncSession, cleanup_test_data
+    ):
+        """Test that add_many inserts every row in one call."""
+        repository = UserGameHistoryRepository(db_session)
+        game_time = datetime.now(UTC)
+
+        await repository.add_many(
+            [
+                (TEST_USER_ID, game_time, {"gameId": generate_test_id(), "player": 1}),
+                (TEST_USER_ID, game_time, {"gameId": generate_test_id(), "player": 2}),
+            ]
+        )
+        await db_session.commit()
+
+        assert await repository.count_by_user(TEST_USER_ID) == 2
+
 
 class TestUserGameHistoryRepositoryList:
     """Integration tests for listing game history."""
@@ -240,6 +258,56 @@ class TestUserGameHistoryRepositoryCount:
         assert count == 0
 
 
+class TestUserGameHistoryRepositoryListWithTotal:
+    """Integration tests for listing history with the total in one query."""
+
+    @pytest.mark.asyncio
+    async def test_list_by_user_with_total_returns_page_and_total(
+        self, db_session: AsyncSession, cleanup_test_data
+    ):
+        """Test that the window total counts all entries, not just the page."""
+        repository = UserGameHistoryRepository(db_session)
+
+        base_time = datetime.now(UTC)
+        for i in range(5):
+            await repository.add(
+                TEST_USER_ID,
+                base_time - timedelta(hours=i),
+                {"gameId": f"GAME{i}"},
+            )
+        await db_session.commit()
+
+        entries, total = await repository.list_by_user_with_total(
+            TEST_USER_ID, limit=2, offset=1
+        )
+
+        assert total == 5
+        assert [e.game_info["gameId"] for e in entries] == ["GAME1", "GAME2"]
+
+    @pytest.mark.asyncio
+    async def test_list_by_user_with_total_offset_past_end(
+        self, db_session: AsyncSession, cleanup_test_data
+    ):
+        """Test that a page past the end still reports the total."""
+        repository = UserGameHistoryRepository(db_session)
+
+        base_time = datetime.now(UTC)
+        for i in range(3):
+            await repository.add(
+                TEST_USER_ID,
+                base_time - timedelta(hours=i),
+                {"gameId": f"GAME{i}"},
+            )
+        await db_session.commit()
+
+        entries, total = await repository.list_by_user_with_total(
+            TEST_USER_ID, limit=10, offset=10
+        )
+
+        assert entries == []
+        assert total == 3
+
+
 class TestUserGameHistoryRepositoryIndex:
     """Integration tests to verify index usage."""
 
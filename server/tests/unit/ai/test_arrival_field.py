@@ -1,6 +1,6 @@
 """Tests for arrival time field computation."""
 
-from clutchchess.ai.arrival_field import ArrivalField
+from clutchchess.ai.arrival_field import ArrivalField, _lies_between
 from clutchchess.ai.state_extractor import PieceStatus, StateExtractor
 from clutchchess.game.board import BoardType
 from clutchchess.game.engine import GameEngine
@@ -452,3 +452,22 @@ class TestSelfBlockingFix:
         assert safety_fixed > 0, (
             f"Double blocker should keep destination safe, got {safety_fixed}"
         )
+
+
+class TestLiesBetween:
+    def test_rank_file_and_diagonal(self):
+        assert _lies_between(0, 3, 5, 3, (2, 3))
+        assert _lies_between(4, 0, 4, 6, (4, 5))
+        assert _lies_between(7, 7, 2, 2, (4, 4))
+
+    def test_endpoints_excluded(self):
+        assert not _lies_between(0, 3, 5, 3, (0, 3))
+        assert not _lies_between(0, 3, 5, 3, (5, 3))
+
+    def test_off_line(self):
+        assert not _lies_between(0, 3, 5, 3, (2, 4))
+        assert not _lies_between(7, 7, 2, 2, (4, 5))
+        # Beyond the target on the same line
+        assert not _lies_between(0, 3, 5, 3, (6, 3))
+        # Not a rank, file or diagonal at all
+        assert not _lies_between(0, 0, 2, 1, (1, 0))
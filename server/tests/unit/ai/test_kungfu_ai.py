@@ -1,5 +1,6 @@
 """Tests for KungFuAI integration."""
 
+import random
 import time
 
 from clutchchess.ai.kungfu_ai import KungFuAI
@@ -19,6 +20,25 @@ def _make_game(speed: Speed = Speed.STANDARD) -> GameState:
     return state
 
 
+def _play_moves(seed: int, ticks: int = 400) -> list[tuple[str, int, int]]:
+    """Let a seeded KungFuAI play player 1 for a while and record its moves."""
+    state = _make_game()
+    ai = KungFuAI(level=2, speed=Speed.STANDARD, rng=random.Random(seed))
+    moves = []
+    for _ in range(ticks):
+        GameEngine.tick(state)
+        if not ai.should_move(state, 1, state.current_tick):
+            continue
+        move = ai.get_move(state, 1)
+        if move is None:
+            continue
+        validated = GameEngine.validate_move(state, 1, *move)
+        assert validated is not None
+        GameEngine.apply_move(state, validated)
+        moves.append(move)
+    return moves
+
+
 class TestKungFuAI:
     def test_implements_ai_player_interface(self):
         """KungFuAI should implement the AIPlayer interface."""
@@ -74,6 +94,30 @@ class TestKungFuAI:
 
         assert ai.should_move(state, 1, 0) is False
 
+    def test_should_move_skips_extraction_when_all_busy(self, monkeypatch):
+        """Busy pieces are rejected by the quick check, before state extraction."""
+        from clutchchess.ai import controller
+        from clutchchess.game.moves import Cooldown
+
+        state = _make_game()
+        ai = KungFuAI(level=1, speed=Speed.STANDARD)
+        ai.controller.think_delay_ticks = 0
+        for piece in state.board.get_pieces_for_player(1):
+            state.cooldowns.append(
+                Cooldown(piece_id=piece.id, start_tick=0, duration=300)
+            )
+
+        def fail_extract(*args, **kwargs):
+            raise AssertionError("state extracted although no piece is idle")
+
+        monkeypatch.setattr(controller.StateExtractor, "extract", fail_extract)
+
+        assert ai.should_move(state, 1, 0) is False
+        # Once the cooldowns expire the quick check lets the AI through
+        monkeypatch.undo()
+        state.current_tick = 300
+        assert ai.should_move(state, 1, 300) is True
+
     def test_get_move_within_budget(self):
         """get_move should complete within 0.5ms budget (generous margin)."""
         state = _make_game()
@@ -143,3 +187,34 @@ class TestKungFuAI:
 
         move = ai.get_move(state, 1)
         assert move is not None
+
+    def test_arrival_field_reused_for_identical_position(self, monkeypatch):
+        """An unchanged position reuses the cached arrival fields."""
+        from clutchchess.ai import controller
+
+        calls = []
+        compute = controller.ArrivalField.compute
+
+        def counting_compute(*args, **kwargs):
+            calls.append(args)
+            return compute(*args, **kwargs)
+
+        monkeypatch.setattr(controller.ArrivalField, "compute", counting_compute)
+        state = _make_game()
+        ai = KungFuAI(level=3, speed=Speed.STANDARD)
+
+        ai.get_move(state, 1)
+        ai.get_move(state, 1)
+        assert len(calls) == 1
+
+        state.board.pieces[0].moved = True
+        ai.get_move(state, 1)
+        assert len(calls) == 2
+
+    def test_seeded_rng_makes_play_reproducible(self):
+        """Identically seeded AIs on the same game make the same moves."""
+        first = _play_moves(seed=1234)
+        second = _play_moves(seed=1234)
+
+        assert len(first) > 1
+        assert first == second
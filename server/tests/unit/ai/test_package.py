@@ -0,0 +1,16 @@
+"""Tests for the clutchchess.ai package's lazy re-exports."""
+
+import pytest
+
+import clutchchess.ai as ai
+
+
+@pytest.mark.parametrize("name", ai.__all__)
+def test_public_names_resolve(name: str) -> None:
+    """Every name in __all__ is importable from the package."""
+    assert getattr(ai, name) is not None
+
+
+def test_unknown_name_raises() -> None:
+    with pytest.raises(AttributeError):
+        _ = ai.NotAThing
@@ -1,10 +1,23 @@
 """Unit tests for leaderboard API endpoints."""
 
+import json
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
 from clutchchess.api.leaderboard import (
+    CACHE_TTL_SECONDS,
     VALID_MODES,
     LeaderboardEntry,
     LeaderboardResponse,
+    _belt_case_sql,
+    clear_leaderboard_cache,
 )
+from clutchchess.db.session import get_db_session
+from clutchchess.game.elo import get_belt
+from clutchchess.main import app
 
 
 class TestLeaderboardModels:
@@ -66,3 +79,169 @@ class TestLeaderboardModeValidation:
     def test_valid_4p_lightning_mode(self):
         """4p_lightning should be a valid mode."""
         assert "4p_lightning" in VALID_MODES
+
+
+def _entry(rank: int, user_id: int, rating: int, belt: str) -> dict:
+    return {
+        "rank": rank,
+        "user_id": user_id,
+        "username": f"user{user_id}",
+        "picture_url": None,
+        "rating": rating,
+        "belt": belt,
+        "games_played": 10,
+        "wins": 5,
+    }
+
+
+def _body(mode: str, entries: list[dict]) -> str:
+    """JSON document as the leaderboard query would return it."""
+    return json.dumps({"mode": mode, "entries": entries})
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    """Override the DB session with a mock returning an empty leaderboard."""
+    db = MagicMock()
+    result = MagicMock()
+    result.scalar_one.return_value = _body("2p_standard", [])
+    db.execute = AsyncMock(return_value=result)
+
+    async def override() -> MagicMock:
+        return db
+
+    app.dependency_overrides[get_db_session] = override
+    clear_leaderboard_cache()
+    yield db
+    clear_leaderboard_cache()
+    app.dependency_overrides.pop(get_db_session, None)
+
+
+class TestBeltCaseSql:
+    """Tests for the SQL rendering of get_belt()."""
+
+    def test_matches_get_belt(self) -> None:
+        """The CASE expression should agree with get_belt at every threshold."""
+        conn = sqlite3.connect(":memory:")
+        for rating in [None, 0, 899, 900, 1299, 1500, 2099, 2299, 2300, 3000]:
+            (belt,) = conn.execute(
+                f"SELECT {_belt_case_sql('r')} FROM (SELECT ? AS r)", (rating,)
+            ).fetchone()
+            assert belt == get_belt(rating), rating
+
+
+class TestGetLeaderboard:
+    """Tests for GET /api/leaderboard."""
+
+    def test_returns_document_built_by_database(self, mock_db: MagicMock) -> None:
+        """The JSON document from the query should be returned as the body."""
+        body = _body(
+            "2p_standard",
+            [_entry(1, 1, 2400, "black"), _entry(2, 2, 1500, "orange")],
+        )
+        mock_db.execute.return_value.scalar_one.return_value = body
+
+        response = TestClient(app).get("/api/leaderboard?mode=2p_standard")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["Cache-Control"] == "public, max-age=60"
+        assert response.text == body
+        # Response must still match the documented schema
+        LeaderboardResponse.model_validate(response.json())
+
+    def test_invalid_mode_rejected(self, mock_db: MagicMock) -> None:
+        """Unknown modes should fail validation."""
+        response = TestClient(app).get("/api/leaderboard?mode=3p_standard")
+
+        assert response.status_code == 422
+        mock_db.execute.assert_not_called()
+
+    def test_repeat_requests_served_from_cache(self, mock_db: MagicMock) -> None:
+        """A second request for the same mode should not hit the database."""
+        client = TestClient(app)
+
+        first = client.get("/api/leaderboard?mode=2p_standard")
+        second = client.get("/api/leaderboard?mode=2p_standard")
+
+        assert first.json() == second.json()
+        assert second.headers["Cache-Control"] == "public, max-age=60"
+        assert mock_db.execute.await_count == 1
+
+    def test_cache_is_per_mode(self, mock_db: MagicMock) -> None:
+        """Different modes should be cached independently."""
+        client = TestClient(app)
+
+        client.get("/api/leaderboard?mode=2p_standard")
+        client.get("/api/leaderboard?mode=4p_lightning")
+
+        assert mock_db.execute.await_count == 2
+
+    def test_expired_entry_is_refreshed(self, mock_db: MagicMock) -> None:
+        """Entries older than the TTL should be re-queried."""
+        client = TestClient(app)
+
+        with patch("clutchchess.api.leaderboard.time.monotonic", return_value=1000.0):
+            client.get("/api/leaderboard?mode=2p_standard")
+        with patch(
+            "clutchchess.api.leaderboard.time.monotonic",
+            return_value=1000.0 + CACHE_TTL_SECONDS,
+        ):
+            client.get("/api/leaderboard?mode=2p_standard")
+
+        assert mock_db.execute.await_count == 2
+
+    def test_queries_mode_specific_columns(self, mock_db: MagicMock) -> None:
+        """Each mode should sort on its own generated rating column."""
+        TestClient(app).get("/api/leaderboard?mode=4p_lightning")
+
+        statement = str(mock_db.execute.await_args.args[0])
+        assert "'mode', '4p_lightning'" in statement
+        assert "ORDER BY rating_4p_lightning DESC NULLS LAST, id DESC" in statement
+        assert "games_4p_lightning > 0" in statement
+
+    def test_first_page_has_no_cursor_filter(self, mock_db: MagicMock) -> None:
+        """The top page should not filter on a cursor and ranks start at 1."""
+        TestClient(app).get("/api/leaderboard?mode=2p_standard")
+
+        statement, params = mock_db.execute.await_args.args
+        assert ":after_rating" not in str(statement)
+        assert params == {"limit": 100, "start_rank": 1}
+
+    def test_cursor_resumes_after_last_row(self, mock_db: MagicMock) -> None:
+        """Passing a cursor should use keyset pagination and continue ranks."""
+        response = TestClient(app).get(
+            "/api/leaderboard?mode=2p_standard"
+            "&after_rating=1450&after_user_id=9&after_rank=100"
+        )
+
+        assert response.status_code == 200
+        statement, params = mock_db.execute.await_args.args
+        assert "(rating_2p_standard, id) < (:after_rating, :after_user_id)" in str(
+            statement
+        )
+        assert params == {
+            "after_rating": 1450,
+            "after_user_id": 9,
+            "limit": 100,
+            "start_rank": 101,
+        }
+
+    def test_cursor_pages_are_not_cached(self, mock_db: MagicMock) -> None:
+        """Only the top page is cached in-process."""
+        client = TestClient(app)
+        url = "/api/leaderboard?mode=2p_standard&after_rating=1450&after_user_id=9"
+
+        client.get(url)
+        client.get(url)
+
+        assert mock_db.execute.await_count == 2
+
+    def test_partial_cursor_rejected(self, mock_db: MagicMock) -> None:
+        """after_rating without after_user_id is not a valid cursor."""
+        response = TestClient(app).get(
+            "/api/leaderboard?mode=2p_standard&after_rating=1450"
+        )
+
+        assert response.status_code == 400
+        mock_db.execute.assert_not_called()
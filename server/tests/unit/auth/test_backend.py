@@ -0,0 +1,84 @@
+"""Tests for the JWT authentication backend."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from clutchchess.auth import backend
+from clutchchess.auth.backend import CachedJWTStrategy, get_jwt_strategy
+
+SECRET = "test-secret-key-long-enough-for-hs256"
+OTHER_SECRET = "other-secret-key-long-enough-for-hs256"
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty token cache."""
+    backend.clear_token_cache()
+    yield
+    backend.clear_token_cache()
+
+
+def _make_user_manager(user: object) -> MagicMock:
+    manager = MagicMock()
+    manager.parse_id = MagicMock(side_effect=int)
+    manager.get = AsyncMock(return_value=user)
+    return manager
+
+
+class TestCachedJWTStrategy:
+    """Tests for CachedJWTStrategy."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, mock_user):
+        strategy = CachedJWTStrategy(secret=SECRET, lifetime_seconds=3600)
+        token = await strategy.write_token(mock_user)
+
+        result = await strategy.read_token(token, _make_user_manager(mock_user))
+
+        assert result is mock_user
+
+    @pytest.mark.asyncio
+    async def test_second_read_skips_decode(self, mock_user):
+        strategy = CachedJWTStrategy(secret=SECRET, lifetime_seconds=3600)
+        token = await strategy.write_token(mock_user)
+        manager = _make_user_manager(mock_user)
+
+        await strategy.read_token(token, manager)
+        with patch("clutchchess.auth.backend.decode_jwt") as mock_decode:
+            result = await strategy.read_token(token, manager)
+
+        mock_decode.assert_not_called()
+        assert result is mock_user
+        # The user is still loaded on every request
+        assert manager.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_short_lived_token_not_cached(self, mock_user):
+        strategy = CachedJWTStrategy(secret=SECRET, lifetime_seconds=10)
+        token = await strategy.write_token(mock_user)
+
+        await strategy.read_token(token, _make_user_manager(mock_user))
+
+        assert backend._decoded_tokens == {}
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_returns_none(self, mock_user):
+        strategy = CachedJWTStrategy(secret=SECRET, lifetime_seconds=3600)
+        manager = _make_user_manager(mock_user)
+
+        assert await strategy.read_token("not-a-jwt", manager) is None
+        assert await strategy.read_token(None, manager) is None
+        manager.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret_rejected(self, mock_user):
+        writer = CachedJWTStrategy(secret=OTHER_SECRET, lifetime_seconds=3600)
+        reader = CachedJWTStrategy(secret=SECRET, lifetime_seconds=3600)
+        token = await writer.write_token(mock_user)
+
+        assert await reader.read_token(token, _make_user_manager(mock_user)) is None
+
+
+def test_get_jwt_strategy_is_memoized():
+    assert get_jwt_strategy() is get_jwt_strategy()
@@ -150,6 +150,21 @@ R1N1B1Q1K1B1N1R1
 0000000000000000
 0000000000000000
 00000000K1000000
+"""
+        with pytest.raises(ValueError, match="Invalid player number"):
+            parse_board_string(board_str, BoardType.STANDARD)
+
+    def test_parse_out_of_range_player_raises(self) -> None:
+        """Test that a player number above 4 raises ValueError."""
+        board_str = """
+00000000K5000000
+0000000000000000
+0000000000000000
+0000000000000000
+0000000000000000
+0000000000000000
+0000000000000000
+00000000K1000000
 """
         with pytest.raises(ValueError, match="Invalid player number"):
             parse_board_string(board_str, BoardType.STANDARD)
@@ -193,3 +208,28 @@ K30000000000000000000000
         for player in [1, 2, 3, 4]:
             king = board.get_king(player)
             assert king is not None, f"King for player {player} not found"
+
+    def test_repeated_parses_return_independent_boards(self) -> None:
+        """Test that mutating a parsed board doesn't affect later parses."""
+        board_str = """
+00000000K2000000
+0000000000000000
+0000000000000000
+0000000000000000
+0000000000000000
+0000000000000000
+0000000000000000
+00000000K1000000
+"""
+        first = parse_board_string(board_str, BoardType.STANDARD)
+        king = first.get_king(1)
+        assert king is not None
+        king.row = 5.0
+        king.captured = True
+
+        second = parse_board_string(board_str, BoardType.STANDARD)
+        assert second is not first
+        second_king = second.get_king(1)
+        assert second_king is not None
+        assert second_king.grid_position == (7, 4)
+        assert not second_king.captured
@@ -141,10 +141,20 @@ class TestGetBeltLevels:
             assert level.belt == 4
 
     def test_get_nonexistent_belt_returns_empty(self) -> None:
-        """Test getting a belt with no levels returns empty list."""
+        """Test getting a belt with no levels returns empty tuple."""
         # Belt 5+ not implemented yet
         levels = get_belt_levels(5)
-        assert levels == []
+        assert levels == ()
+
+    def test_get_invalid_belt_returns_empty(self) -> None:
+        """Test that belt 0 and negative belts don't wrap around LEVELS."""
+        assert get_belt_levels(0) == ()
+        assert get_belt_levels(-1) == ()
+
+    def test_levels_ordered_by_id(self) -> None:
+        """Belt slicing relies on LEVELS[i].level_id == i."""
+        for index, level in enumerate(LEVELS):
+            assert level.level_id == index
 
 
 class TestConstants:
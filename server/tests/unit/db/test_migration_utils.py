@@ -0,0 +1,80 @@
+"""Tests for Alembic migration helpers."""
+
+from unittest.mock import patch
+
+from clutchchess.db.migration_utils import (
+    add_columns,
+    create_index_concurrently,
+    drop_columns,
+)
+
+
+class TestAddColumns:
+    """Tests for add_columns."""
+
+    def test_single_alter_table(self) -> None:
+        """All columns should be added in one statement."""
+        with patch("clutchchess.db.migration_utils.op") as mock_op:
+            add_columns("game_replays", "campaign_level_id INTEGER", "initial_board_str TEXT")
+
+        mock_op.execute.assert_called_once_with(
+            "ALTER TABLE game_replays "
+            "ADD COLUMN campaign_level_id INTEGER, ADD COLUMN initial_board_str TEXT"
+        )
+
+    def test_if_not_exists(self) -> None:
+        """if_not_exists should guard every column."""
+        with patch("clutchchess.db.migration_utils.op") as mock_op:
+            add_columns("game_replays", "is_ranked BOOLEAN", if_not_exists=True)
+
+        mock_op.execute.assert_called_once_with(
+            "ALTER TABLE game_replays ADD COLUMN IF NOT EXISTS is_ranked BOOLEAN"
+        )
+
+    def test_no_columns_is_noop(self) -> None:
+        """Nothing should be executed without columns."""
+        with patch("clutchchess.db.migration_utils.op") as mock_op:
+            add_columns("game_replays")
+
+        mock_op.execute.assert_not_called()
+
+
+class TestDropColumns:
+    """Tests for drop_columns."""
+
+    def test_single_alter_table(self) -> None:
+        """All columns should be dropped in one statement."""
+        with patch("clutchchess.db.migration_utils.op") as mock_op:
+            drop_columns("game_replays", "campaign_level_id", "initial_board_str")
+
+        mock_op.execute.assert_called_once_with(
+            "ALTER TABLE game_replays "
+            "DROP COLUMN IF EXISTS campaign_level_id, DROP COLUMN IF EXISTS initial_board_str"
+        )
+
+
+class TestCreateIndexConcurrently:
+    """Tests for create_index_concurrently."""
+
+    def _run(self, is_valid: bool | None) -> list[str]:
+        """Run the helper against a catalog reporting is_valid for the index."""
+        with patch("clutchchess.db.migration_utils.op") as mock_op:
+            result = mock_op.get_bind.return_value.execute.return_value
+            result.scalar_one_or_none.return_value = is_valid
+            create_index_concurrently("ix_test", "ON users (username)")
+        return [call.args[0] for call in mock_op.execute.call_args_list]
+
+    def test_builds_missing_index(self) -> None:
+        """A missing index should be built without IF NOT EXISTS."""
+        assert self._run(None) == ["CREATE INDEX CONCURRENTLY ix_test ON users (username)"]
+
+    def test_skips_valid_index(self) -> None:
+        """An existing valid index should be left alone."""
+        assert self._run(True) == []
+
+    def test_rebuilds_invalid_index(self) -> None:
+        """A leftover invalid index should be dropped and rebuilt."""
+        assert self._run(False) == [
+            "DROP INDEX CONCURRENTLY ix_test",
+            "CREATE INDEX CONCURRENTLY ix_test ON users (username)",
+        ]
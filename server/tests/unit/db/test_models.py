@@ -0,0 +1,42 @@
+"""Tests for ORM model loading behaviour."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import selectinload
+
+from clutchchess.db.models import User, UserGameHistory
+
+
+def _compile(statement) -> str:
+    """Render a statement as Postgres SQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestUserOAuthAccounts:
+    """User loads must not join oauth_accounts unless asked to."""
+
+    def test_select_user_does_not_join_oauth_accounts(self) -> None:
+        """A plain user select should only read the users table."""
+        assert "oauth_accounts" not in _compile(select(User))
+
+    def test_select_user_for_update_is_single_table(self) -> None:
+        """Row locks (rating updates) need no noload() workaround."""
+        sql = _compile(select(User).where(User.id.in_([1, 2])).with_for_update())
+        assert "JOIN" not in sql
+        assert "FOR UPDATE" in sql
+
+    def test_selectinload_is_a_separate_query(self) -> None:
+        """Explicit loading adds a second query instead of a join."""
+        sql = _compile(select(User).options(selectinload(User.oauth_accounts)))
+        assert "oauth_accounts" not in sql
+
+
+class TestUserGameHistoryIndexes:
+    """Match history is served by one (user_id, game_time DESC) index."""
+
+    def test_only_composite_user_index(self) -> None:
+        """user_id must not carry a redundant single-column index."""
+        indexes = {index.name: index for index in UserGameHistory.__table__.indexes}
+        assert set(indexes) == {"ix_user_game_history_user_id_game_time"}
+        columns = [col.name for col in indexes["ix_user_game_history_user_id_game_time"].columns]
+        assert columns[0] == "user_id"
@@ -179,6 +179,17 @@ class TestBoard:
         assert len(board.pieces) == 1
         assert board.get_piece_at(4, 4) == piece
 
+    def test_add_pieces(self):
+        """Test adding several pieces at once."""
+        board = Board.create_empty()
+        queen = Piece.create(PieceType.QUEEN, player=1, row=4, col=4)
+        rook = Piece.create(PieceType.ROOK, player=2, row=0, col=0)
+
+        board.add_pieces(p for p in (queen, rook))
+
+        assert board.pieces == [queen, rook]
+        assert board.get_piece_at(0, 0) == rook
+
     def test_remove_piece(self):
         """Test removing a piece from the board."""
         board = Board.create_standard()
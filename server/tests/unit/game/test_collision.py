@@ -0,0 +1,107 @@
+"""Tests for collision helpers."""
+
+from clutchchess.game.collision import (
+    can_knight_capture,
+    cooldown_piece_ids,
+    detect_collisions,
+    get_interpolated_position,
+    get_knight_position,
+    is_piece_on_cooldown,
+)
+from clutchchess.game.moves import Cooldown, Move
+from clutchchess.game.pieces import Piece, PieceType
+
+
+def _rook_move(start_tick: int = 0) -> tuple[Piece, Move]:
+    piece = Piece.create(PieceType.ROOK, 1, 7, 0)
+    move = Move(piece_id=piece.id, path=[(7, 0), (6, 0), (5, 0)], start_tick=start_tick)
+    return piece, move
+
+
+class TestGetInterpolatedPosition:
+    """Tests for get_interpolated_position."""
+
+    def test_interpolates_along_path(self):
+        piece, move = _rook_move()
+
+        assert get_interpolated_position(piece, [move], 15, 10) == (5.5, 0.0)
+        assert get_interpolated_position(piece, [move], 40, 10) == (5.0, 0.0)
+
+    def test_not_started_uses_piece_position(self):
+        piece, move = _rook_move(start_tick=10)
+
+        assert get_interpolated_position(piece, None, 5, 10, move=move) == (7, 0)
+
+    def test_same_tick_is_cached(self):
+        piece, move = _rook_move()
+
+        first = get_interpolated_position(piece, None, 5, 10, move=move)
+        # Corrupting the path shows the second call did not recompute
+        move.path = [(0, 0), (0, 0)]
+        second = get_interpolated_position(piece, None, 5, 10, move=move)
+
+        assert second == first == (6.5, 0.0)
+
+    def test_new_tick_recomputes(self):
+        piece, move = _rook_move()
+
+        get_interpolated_position(piece, None, 5, 10, move=move)
+
+        assert get_interpolated_position(piece, None, 10, 10, move=move) == (6.0, 0.0)
+        assert get_interpolated_position(piece, None, 10, 5, move=move) == (5.0, 0.0)
+
+
+class TestCooldownPieceIds:
+    """Tests for cooldown_piece_ids."""
+
+    def test_matches_is_piece_on_cooldown(self):
+        cooldowns = [
+            Cooldown(piece_id="a", start_tick=0, duration=10),
+            Cooldown(piece_id="b", start_tick=0, duration=5),
+            Cooldown(piece_id="c", start_tick=8, duration=10),
+        ]
+
+        ids = cooldown_piece_ids(cooldowns, 6)
+
+        assert ids == {"a", "c"}
+        for piece_id in ("a", "b", "c", "d"):
+            assert (piece_id in ids) == is_piece_on_cooldown(piece_id, cooldowns, 6)
+
+
+class TestKnightTiming:
+    """Tests for the knight airborne threshold."""
+
+    def test_capture_starts_at_85_percent(self):
+        for tps in (1, 3, 10, 15, 30):
+            move = Move(piece_id="n", path=[(7, 1), (6, 1), (5, 2)], start_tick=0)
+            for tick in range(2 * tps + 1):
+                expected = tick / (2 * tps) >= 0.85
+                assert can_knight_capture(move, tick, tps) is expected
+
+    def test_airborne_matches_capture(self):
+        knight = Piece.create(PieceType.KNIGHT, 1, 7, 1)
+        move = Move(piece_id=knight.id, path=[(7, 1), (6, 1), (5, 2)], start_tick=0)
+
+        for tick in range(21):
+            airborne = get_knight_position(knight, None, tick, 10, move=move) is None
+            assert airborne is not can_knight_capture(move, tick, 10)
+
+
+class TestDetectCollisions:
+    """Tests for detect_collisions."""
+
+    def test_no_active_moves(self):
+        # Overlapping enemy pieces only collide when one of them is moving
+        rook = Piece.create(PieceType.ROOK, 1, 4, 4)
+        enemy = Piece.create(PieceType.ROOK, 2, 4, 4)
+
+        assert detect_collisions([rook, enemy], [], 0, 10) == []
+
+    def test_moving_piece_captures(self):
+        rook, move = _rook_move()
+        enemy = Piece.create(PieceType.PAWN, 2, 5, 0)
+
+        [capture] = detect_collisions([rook, enemy], [move], 20, 10)
+
+        assert capture.capturing_piece_id == rook.id
+        assert capture.captured_piece_id == enemy.id
@@ -88,6 +88,10 @@ class TestGetBelt:
         assert get_belt(100) == "white"
         assert get_belt(899) == "white"
 
+    def test_negative_rating_is_white(self):
+        """Ratings below every threshold still get the lowest belt."""
+        assert get_belt(-50) == "white"
+
     def test_yellow_belt(self):
         """Ratings 900-1099 should be yellow belt."""
         assert get_belt(900) == "yellow"
@@ -42,6 +42,16 @@ class TestMove:
 
         assert move.num_squares == 1
 
+    def test_keeps_column(self):
+        """Test that keeps_column reflects the path's start and end columns."""
+        straight = Move(piece_id="P:1:6:4", path=[(6, 4), (5, 4)], start_tick=0)
+        diagonal = Move(piece_id="P:1:6:4", path=[(6, 4), (5, 5)], start_tick=0)
+        single = Move(piece_id="P:1:6:4", path=[(6, 4)], start_tick=0)
+
+        assert straight.keeps_column is True
+        assert diagonal.keeps_column is False
+        assert single.keeps_column is False
+
 
 class TestCooldown:
     """Tests for the Cooldown dataclass."""
@@ -0,0 +1,28 @@
+"""Tests for the clutchchess.game package's lazy re-exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import clutchchess.game as game
+
+
+@pytest.mark.parametrize("name", game.__all__)
+def test_public_names_resolve(name: str) -> None:
+    """Every name in __all__ is importable from the package."""
+    assert getattr(game, name) is not None
+
+
+def test_unknown_name_raises() -> None:
+    with pytest.raises(AttributeError):
+        _ = game.NotAThing
+
+
+def test_submodule_import_skips_engine() -> None:
+    """Importing the board alone does not load the game engine."""
+    code = (
+        "import sys, clutchchess.game.board; "
+        "assert 'clutchchess.game.engine' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
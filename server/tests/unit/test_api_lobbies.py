@@ -526,7 +526,7 @@ class TestDeleteLobby:
 
 
 class TestLiveGames:
-    """Tests for GET /api/games/live (DB-backed active games registry)."""
+    """Tests for GET /api/games/live (Redis-backed active games registry)."""
 
     def test_list_live_games_empty(self, client: TestClient) -> None:
         """Test listing live games when none are registered."""
@@ -535,12 +535,11 @@ class TestLiveGames:
         mock_repo = AsyncMock()
         mock_repo.list_active.return_value = []
 
-        with patch("clutchchess.api.games.async_session_factory") as mock_factory:
-            mock_session = AsyncMock()
-            mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-            with patch("clutchchess.api.games.ActiveGameRepository", return_value=mock_repo):
-                response = client.get("/api/games/live")
+        with (
+            patch("clutchchess.api.games.get_redis"),
+            patch("clutchchess.api.games.RedisActiveGameRepository", return_value=mock_repo),
+        ):
+            response = client.get("/api/games/live")
 
         assert response.status_code == 200
         data = response.json()
@@ -567,12 +566,11 @@ class TestLiveGames:
         mock_repo = AsyncMock()
         mock_repo.list_active.return_value = [mock_record]
 
-        with patch("clutchchess.api.games.async_session_factory") as mock_factory:
-            mock_session = AsyncMock()
-            mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-            with patch("clutchchess.api.games.ActiveGameRepository", return_value=mock_repo):
-                response = client.get("/api/games/live")
+        with (
+            patch("clutchchess.api.games.get_redis"),
+            patch("clutchchess.api.games.RedisActiveGameRepository", return_value=mock_repo),
+        ):
+            response = client.get("/api/games/live")
 
         assert response.status_code == 200
         data = response.json()
@@ -589,12 +587,11 @@ class TestLiveGames:
         mock_repo = AsyncMock()
         mock_repo.list_active.return_value = []
 
-        with patch("clutchchess.api.games.async_session_factory") as mock_factory:
-            mock_session = AsyncMock()
-            mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-            with patch("clutchchess.api.games.ActiveGameRepository", return_value=mock_repo):
-                response = client.get("/api/games/live?game_type=campaign")
+        with (
+            patch("clutchchess.api.games.get_redis"),
+            patch("clutchchess.api.games.RedisActiveGameRepository", return_value=mock_repo),
+        ):
+            response = client.get("/api/games/live?game_type=campaign")
 
         assert response.status_code == 200
         mock_repo.list_active.assert_called_once_with(
@@ -610,12 +607,11 @@ class TestLiveGames:
         mock_repo = AsyncMock()
         mock_repo.list_active.return_value = []
 
-        with patch("clutchchess.api.games.async_session_factory") as mock_factory:
-            mock_session = AsyncMock()
-            mock_factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_factory.return_value.__aexit__ = AsyncMock(return_value=None)
-            with patch("clutchchess.api.games.ActiveGameRepository", return_value=mock_repo):
-                response = client.get("/api/games/live?speed=lightning")
+        with (
+            patch("clutchchess.api.games.get_redis"),
+            patch("clutchchess.api.games.RedisActiveGameRepository", return_value=mock_repo),
+        ):
+            response = client.get("/api/games/live?speed=lightning")
 
         assert response.status_code == 200
         mock_repo.list_active.assert_called_once_with(
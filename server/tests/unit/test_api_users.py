@@ -5,7 +5,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-
+from sqlalchemy.exc import IntegrityError
+
+from clutchchess.api.users import (
+    _is_username_conflict,
+    _known_users,
+    _opponent_slots,
+    clear_known_users,
+)
+from clutchchess.auth.dependencies import get_required_user_with_dev_bypass, get_user_manager_dep
 from clutchchess.main import app
 
 
@@ -15,6 +23,26 @@ def client() -> TestClient:
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_user_exists_cache():
+    """Start and end every test with an empty user existence cache."""
+    clear_known_users()
+    yield
+    clear_known_users()
+
+
+def _make_mock_user(user_id: int = 123) -> MagicMock:
+    """Create a mock user with public profile fields."""
+    mock_user = MagicMock()
+    mock_user.id = user_id
+    mock_user.username = "testuser"
+    mock_user.picture_url = None
+    mock_user.ratings = {}
+    mock_user.created_at = datetime.now(UTC)
+    mock_user.last_online = datetime.now(UTC)
+    return mock_user
+
+
 class TestGetPublicUserProfile:
     """Tests for GET /api/users/{user_id}."""
 
@@ -81,26 +109,161 @@ class TestGetPublicUserProfile:
         data = response.json()
         assert data["ratings"] == {}  # Should be empty dict, not null
 
+    def test_get_public_profile_sets_cache_headers(self, client: TestClient) -> None:
+        """Test that profiles are served with an ETag and Cache-Control."""
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.get_by_id = AsyncMock(return_value=_make_mock_user())
+
+            response = client.get("/api/users/123")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "public, max-age=30"
+
+    def test_get_public_profile_not_modified(self, client: TestClient) -> None:
+        """Test that a matching If-None-Match returns an empty 304."""
+        mock_user = _make_mock_user()
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.get_by_id = AsyncMock(return_value=mock_user)
+
+            etag = client.get("/api/users/123").headers["etag"]
+            response = client.get(
+                "/api/users/123", headers={"If-None-Match": f'W/"other", {etag}'}
+            )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_get_public_profile_etag_changes_with_profile(self, client: TestClient) -> None:
+        """Test that a changed profile is sent again instead of a 304."""
+        mock_user = _make_mock_user()
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.get_by_id = AsyncMock(return_value=mock_user)
+
+            etag = client.get("/api/users/123").headers["etag"]
+            mock_user.ratings = {"standard": 1600}
+            response = client.get("/api/users/123", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["ratings"] == {"standard": 1600}
+        assert response.headers["etag"] != etag
+
+
+class TestUserExistsCache:
+    """Tests for the user existence cache."""
+
+    def test_profile_is_never_served_from_cache(self, client: TestClient) -> None:
+        """Test that profile data (e.g. ratings) is always read fresh."""
+        stale_user = _make_mock_user()
+        fresh_user = _make_mock_user()
+        fresh_user.ratings = {"2p_standard": 1300}
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.get_by_id = AsyncMock(side_effect=[stale_user, fresh_user])
+
+            client.get("/api/users/123")
+            response = client.get("/api/users/123")
+
+        assert response.json()["ratings"] == {"2p_standard": 1300}
+        assert mock_repo.get_by_id.call_count == 2
+
+    def test_replays_skip_existence_check_for_known_user(
+        self, client: TestClient
+    ) -> None:
+        """Test that repeat replay pages reuse the cached existence check."""
+        with (
+            patch("clutchchess.api.users.UserRepository") as MockUserRepository,
+            patch(
+                "clutchchess.api.users.UserGameHistoryRepository"
+            ) as MockHistoryRepository,
+        ):
+            mock_repo = MockUserRepository.return_value
+            mock_repo.exists = AsyncMock(return_value=True)
+            mock_history_repo = MockHistoryRepository.return_value
+            mock_history_repo.list_by_user_with_total = AsyncMock(return_value=([], 0))
+
+            client.get("/api/users/123/replays")
+            response = client.get("/api/users/123/replays?offset=10")
+
+        assert response.status_code == 200
+        mock_repo.exists.assert_called_once()
+        assert 123 in _known_users
+
+    def test_profile_view_marks_user_as_known(self, client: TestClient) -> None:
+        """Test that viewing a profile lets the replay list skip its check."""
+        with (
+            patch("clutchchess.api.users.UserRepository") as MockUserRepository,
+            patch(
+                "clutchchess.api.users.UserGameHistoryRepository"
+            ) as MockHistoryRepository,
+        ):
+            mock_repo = MockUserRepository.return_value
+            mock_repo.get_by_id = AsyncMock(return_value=_make_mock_user())
+            mock_repo.exists = AsyncMock(return_value=True)
+            mock_history_repo = MockHistoryRepository.return_value
+            mock_history_repo.list_by_user_with_total = AsyncMock(return_value=([], 0))
+
+            client.get("/api/users/123")
+            response = client.get("/api/users/123/replays")
+
+        assert response.status_code == 200
+        mock_repo.exists.assert_not_called()
+
+    def test_missing_user_is_not_cached(self, client: TestClient) -> None:
+        """Test that misses are looked up again so new users appear immediately."""
+        with (
+            patch("clutchchess.api.users.UserRepository") as MockUserRepository,
+            patch(
+                "clutchchess.api.users.UserGameHistoryRepository"
+            ) as MockHistoryRepository,
+        ):
+            mock_repo = MockUserRepository.return_value
+            mock_repo.exists = AsyncMock(side_effect=[False, True])
+            mock_history_repo = MockHistoryRepository.return_value
+            mock_history_repo.list_by_user_with_total = AsyncMock(return_value=([], 0))
+
+            first = client.get("/api/users/123/replays")
+            second = client.get("/api/users/123/replays")
+
+        assert first.status_code == 404
+        assert second.status_code == 200
+
+
+class TestOpponentSlots:
+    """Tests for _opponent_slots."""
+
+    def test_two_player_slots(self) -> None:
+        assert _opponent_slots(2, 1) == (2,)
+        assert _opponent_slots(2, 2) == (1,)
+
+    def test_four_player_slots_skip_own_slot(self) -> None:
+        assert _opponent_slots(4, 3) == (1, 2, 4)
+
+    def test_unknown_player_number_keeps_all_slots(self) -> None:
+        assert _opponent_slots(2, 7) == (1, 2)
+
 
 class TestGetUserReplays:
     """Tests for GET /api/users/{user_id}/replays."""
 
     def test_get_user_replays_returns_empty_list(self, client: TestClient) -> None:
         """Test getting replays for user with no games."""
-        mock_user = MagicMock()
-        mock_user.id = 123
-
         with patch(
             "clutchchess.api.users.UserRepository"
         ) as MockUserRepository, patch(
             "clutchchess.api.users.UserGameHistoryRepository"
         ) as MockHistoryRepository:
             mock_user_repo = MockUserRepository.return_value
-            mock_user_repo.get_by_id = AsyncMock(return_value=mock_user)
+            mock_user_repo.exists = AsyncMock(return_value=True)
 
             mock_history_repo = MockHistoryRepository.return_value
-            mock_history_repo.list_by_user = AsyncMock(return_value=[])
-            mock_history_repo.count_by_user = AsyncMock(return_value=0)
+            mock_history_repo.list_by_user_with_total = AsyncMock(
+                return_value=([], 0)
+            )
 
             response = client.get("/api/users/123/replays")
 
@@ -111,9 +274,6 @@ class TestGetUserReplays:
 
     def test_get_user_replays_returns_entries(self, client: TestClient) -> None:
         """Test getting replays returns match history entries."""
-        mock_user = MagicMock()
-        mock_user.id = 123
-
         mock_entry = MagicMock()
         mock_entry.game_time = datetime.now(UTC)
         mock_entry.game_info = {
@@ -135,11 +295,12 @@ class TestGetUserReplays:
             "clutchchess.api.users.resolve_player_info_batch"
         ) as mock_resolve:
             mock_user_repo = MockUserRepository.return_value
-            mock_user_repo.get_by_id = AsyncMock(return_value=mock_user)
+            mock_user_repo.exists = AsyncMock(return_value=True)
 
             mock_history_repo = MockHistoryRepository.return_value
-            mock_history_repo.list_by_user = AsyncMock(return_value=[mock_entry])
-            mock_history_repo.count_by_user = AsyncMock(return_value=1)
+            mock_history_repo.list_by_user_with_total = AsyncMock(
+                return_value=([mock_entry], 1)
+            )
 
             from clutchchess.utils.display_name import PlayerDisplay
 
@@ -160,9 +321,6 @@ class TestGetUserReplays:
 
     def test_get_user_replays_four_player_game(self, client: TestClient) -> None:
         """Test getting replays for 4-player games with correct slot assignment."""
-        mock_user = MagicMock()
-        mock_user.id = 123
-
         # User is player 3 in a 4-player game
         mock_entry = MagicMock()
         mock_entry.game_time = datetime.now(UTC)
@@ -185,20 +343,21 @@ class TestGetUserReplays:
             "clutchchess.api.users.resolve_player_info_batch"
         ) as mock_resolve:
             mock_user_repo = MockUserRepository.return_value
-            mock_user_repo.get_by_id = AsyncMock(return_value=mock_user)
+            mock_user_repo.exists = AsyncMock(return_value=True)
 
             mock_history_repo = MockHistoryRepository.return_value
-            mock_history_repo.list_by_user = AsyncMock(return_value=[mock_entry])
-            mock_history_repo.count_by_user = AsyncMock(return_value=1)
+            mock_history_repo.list_by_user_with_total = AsyncMock(
+                return_value=([mock_entry], 1)
+            )
 
             from clutchchess.utils.display_name import PlayerDisplay
 
             # Mock resolve_player_info_batch to verify correct slot assignment
-            # Should be called with: [{3: "u:123", 1: "u:100", 2: "u:200", 4: "u:300"}]
+            # Should be called with: [{3: 123, 1: "u:100", 2: "u:200", 4: "u:300"}]
             def verify_players(db, players_list):
                 players = players_list[0]
                 assert 3 in players  # User's slot
-                assert players[3] == "u:123"
+                assert players[3] == 123
                 # Opponents should be in slots 1, 2, 4 (not 3)
                 assert 1 in players
                 assert 2 in players
@@ -223,51 +382,53 @@ class TestGetUserReplays:
         """Test getting replays for non-existent user."""
         with patch(
             "clutchchess.api.users.UserRepository"
-        ) as MockUserRepository:
+        ) as MockUserRepository, patch(
+            "clutchchess.api.users.UserGameHistoryRepository"
+        ) as MockHistoryRepository:
             mock_user_repo = MockUserRepository.return_value
-            mock_user_repo.get_by_id = AsyncMock(return_value=None)
+            mock_user_repo.exists = AsyncMock(return_value=False)
+
+            mock_history_repo = MockHistoryRepository.return_value
+            mock_history_repo.list_by_user_with_total = AsyncMock(return_value=([], 0))
 
             response = client.get("/api/users/999999/replays")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "User not found"
+        # No history lookup for users that don't exist
+        mock_history_repo.list_by_user_with_total.assert_not_called()
 
     def test_get_user_replays_pagination(self, client: TestClient) -> None:
         """Test pagination parameters are respected."""
-        mock_user = MagicMock()
-        mock_user.id = 123
-
         with patch(
             "clutchchess.api.users.UserRepository"
         ) as MockUserRepository, patch(
             "clutchchess.api.users.UserGameHistoryRepository"
         ) as MockHistoryRepository:
             mock_user_repo = MockUserRepository.return_value
-            mock_user_repo.get_by_id = AsyncMock(return_value=mock_user)
+            mock_user_repo.exists = AsyncMock(return_value=True)
 
             mock_history_repo = MockHistoryRepository.return_value
-            mock_history_repo.list_by_user = AsyncMock(return_value=[])
-            mock_history_repo.count_by_user = AsyncMock(return_value=25)
+            mock_history_repo.list_by_user_with_total = AsyncMock(
+                return_value=([], 25)
+            )
 
             response = client.get("/api/users/123/replays?limit=5&offset=10")
 
         assert response.status_code == 200
-        # Verify list_by_user was called with correct params
-        mock_history_repo.list_by_user.assert_called_once()
-        call_args = mock_history_repo.list_by_user.call_args
+        # Verify list_by_user_with_total was called with correct params
+        mock_history_repo.list_by_user_with_total.assert_called_once()
+        call_args = mock_history_repo.list_by_user_with_total.call_args
         assert call_args[1]["limit"] == 5
         assert call_args[1]["offset"] == 10
 
     def test_get_user_replays_limit_validation(self, client: TestClient) -> None:
         """Test that limit is validated (1-50)."""
-        mock_user = MagicMock()
-        mock_user.id = 123
-
         with patch(
             "clutchchess.api.users.UserRepository"
         ) as MockUserRepository:
             mock_user_repo = MockUserRepository.return_value
-            mock_user_repo.get_by_id = AsyncMock(return_value=mock_user)
+            mock_user_repo.exists = AsyncMock(return_value=True)
 
             # Test limit too high
             response = client.get("/api/users/123/replays?limit=100")
@@ -276,3 +437,103 @@ class TestGetUserReplays:
             # Test limit too low
             response = client.get("/api/users/123/replays?limit=0")
             assert response.status_code == 422  # Validation error
+
+
+class TestUpdateCurrentUser:
+    """Tests for PATCH /api/users/me."""
+
+    @pytest.fixture
+    def user_manager(self):
+        mock_user = _make_mock_user()
+        mock_user.email = "test@example.com"
+        mock_user.is_active = True
+        mock_user.is_superuser = False
+        mock_user.is_verified = True
+        mock_user.google_id = None
+        manager = AsyncMock()
+        manager.update = AsyncMock(return_value=mock_user)
+        app.dependency_overrides[get_required_user_with_dev_bypass] = lambda: mock_user
+        app.dependency_overrides[get_user_manager_dep] = lambda: manager
+        yield manager
+        app.dependency_overrides.clear()
+
+    def test_taken_username_rejected_before_update(
+        self, client: TestClient, user_manager: AsyncMock
+    ) -> None:
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.username_taken = AsyncMock(return_value=True)
+
+            response = client.patch("/api/users/me", json={"username": "TakenName"})
+
+        assert response.status_code == 400
+        assert "already taken" in response.json()["detail"]
+        mock_repo.username_taken.assert_awaited_once_with("TakenName", 123)
+        user_manager.update.assert_not_awaited()
+
+    def test_free_username_updates(
+        self, client: TestClient, user_manager: AsyncMock
+    ) -> None:
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.username_taken = AsyncMock(return_value=False)
+
+            response = client.patch("/api/users/me", json={"username": "FreeName"})
+
+        assert response.status_code == 200
+        user_manager.update.assert_awaited_once()
+
+    def test_no_username_skips_check(
+        self, client: TestClient, user_manager: AsyncMock
+    ) -> None:
+        with patch("clutchchess.api.users.UserRepository") as MockUserRepository:
+            mock_repo = MockUserRepository.return_value
+            mock_repo.username_taken = AsyncMock(return_value=True)
+
+            response = client.patch(
+                "/api/users/me", json={"picture_url": "https://example.com/p.png"}
+            )
+
+        assert response.status_code == 200
+        mock_repo.username_taken.assert_not_awaited()
+
+
+def _make_integrity_error(
+    message: str, pgcode: str | None = None, constraint_name: str | None = None
+) -> IntegrityError:
+    """Build an IntegrityError shaped like SQLAlchemy's asyncpg adapter error."""
+    orig = Exception(message)
+    if pgcode is not None:
+        orig.pgcode = pgcode
+        driver_error = Exception(message)
+        driver_error.constraint_name = constraint_name
+        orig.__cause__ = driver_error
+    return IntegrityError("UPDATE users", {}, orig)
+
+
+class TestIsUsernameConflict:
+    """Tests for _is_username_conflict."""
+
+    def test_unique_violation_on_username_constraint(self) -> None:
+        error = _make_integrity_error("duplicate key", "23505", "uq_users_username")
+        assert _is_username_conflict(error)
+
+    def test_unique_violation_on_other_constraint(self) -> None:
+        error = _make_integrity_error("duplicate key", "23505", "uq_users_email")
+        assert not _is_username_conflict(error)
+
+    def test_unique_violation_without_constraint_name(self) -> None:
+        error = _make_integrity_error("duplicate key", "23505", None)
+        assert _is_username_conflict(error)
+
+    def test_other_sqlstate(self) -> None:
+        error = _make_integrity_error("null value in username", "23502", "username")
+        assert not _is_username_conflict(error)
+
+    def test_falls_back_to_message_without_pgcode(self) -> None:
+        assert _is_username_conflict(
+            _make_integrity_error("UNIQUE constraint failed: users.username")
+        )
+        assert not _is_username_conflict(
+            _make_integrity_error("NOT NULL constraint failed: users.email")
+        )
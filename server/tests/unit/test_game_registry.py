@@ -0,0 +1,49 @@
+"""Tests for the fire-and-forget active game registry helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from clutchchess.services import game_registry
+
+
+@pytest.fixture
+def mock_repo():
+    """Patch the Redis client and repository used by the registry."""
+    repo = MagicMock()
+    repo.deregister_many = AsyncMock(return_value=0)
+    with (
+        patch.object(game_registry, "get_redis"),
+        patch.object(game_registry, "RedisActiveGameRepository", return_value=repo),
+    ):
+        yield repo
+    game_registry._pending_deregistrations.clear()
+
+
+async def _drain_background_tasks() -> None:
+    await asyncio.gather(*game_registry._background_tasks)
+
+
+class TestDeregisterGameFireAndForget:
+    """Tests for deregister_game_fire_and_forget."""
+
+    async def test_burst_shares_one_delete(self, mock_repo) -> None:
+        """Deregistrations queued together are flushed in one call."""
+        for game_id in ("g1", "g2", "g3"):
+            game_registry.deregister_game_fire_and_forget(game_id)
+
+        await _drain_background_tasks()
+
+        mock_repo.deregister_many.assert_awaited_once()
+        assert sorted(mock_repo.deregister_many.call_args[0][0]) == ["g1", "g2", "g3"]
+        assert game_registry._pending_deregistrations == set()
+
+    async def test_later_request_gets_new_flush(self, mock_repo) -> None:
+        """A deregistration after a flush has started is not dropped."""
+        game_registry.deregister_game_fire_and_forget("g1")
+        await _drain_background_tasks()
+        game_registry.deregister_game_fire_and_forget("g2")
+        await _drain_background_tasks()
+
+        assert [c[0][0] for c in mock_repo.deregister_many.call_args_list] == [["g1"], ["g2"]]
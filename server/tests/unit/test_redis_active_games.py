@@ -0,0 +1,231 @@
+"""Unit tests for RedisActiveGameRepository."""
+
+import fakeredis
+import pytest
+
+from clutchchess.redis import active_games
+from clutchchess.redis.active_games import RedisActiveGameRepository
+
+
+def _make_players(count: int = 2) -> list[dict]:
+    """Build a sample players list."""
+    return [{"slot": i, "username": f"player{i}", "is_ai": i > 1} for i in range(1, count + 1)]
+
+
+@pytest.fixture(autouse=True)
+def clear_list_cache():
+    """Start every test with an empty list_active cache."""
+    active_games.clear_list_cache()
+    yield
+    active_games.clear_list_cache()
+
+
+@pytest.fixture
+async def redis():
+    """In-memory Redis with the same decoding as the shared client."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def repo(redis) -> RedisActiveGameRepository:
+    return RedisActiveGameRepository(redis)
+
+
+async def _register(
+    repo: RedisActiveGameRepository,
+    game_id: str,
+    server_id: str = "server-a",
+    **overrides,
+) -> None:
+    fields = {
+        "game_type": "quickplay",
+        "speed": "standard",
+        "player_count": 2,
+        "board_type": "standard",
+        "players": _make_players(),
+    }
+    fields.update(overrides)
+    await repo.register(game_id=game_id, server_id=server_id, **fields)
+
+
+class TestRegister:
+    """Tests for registering active games."""
+
+    async def test_register_round_trips_fields(self, repo) -> None:
+        await _register(
+            repo,
+            "g1",
+            game_type="lobby",
+            speed="lightning",
+            player_count=4,
+            board_type="four_player",
+            players=_make_players(4),
+            lobby_code="ABC123",
+        )
+
+        [game] = await repo.list_active()
+
+        assert game.game_id == "g1"
+        assert game.game_type == "lobby"
+        assert game.speed == "lightning"
+        assert game.player_count == 4
+        assert game.board_type == "four_player"
+        assert game.players == _make_players(4)
+        assert game.lobby_code == "ABC123"
+        assert game.campaign_level_id is None
+        assert game.server_id == "server-a"
+        assert game.started_at.tzinfo is not None
+
+    async def test_register_campaign_level(self, repo) -> None:
+        await _register(repo, "g1", game_type="campaign", campaign_level_id=0)
+
+        [game] = await repo.list_active()
+
+        assert game.campaign_level_id == 0
+        assert game.lobby_code is None
+
+    async def test_entries_expire(self, repo, redis) -> None:
+        await _register(repo, "g1")
+
+        ttl = await redis.ttl("active_games:game:g1")
+
+        assert 0 < ttl <= active_games.ACTIVE_GAME_TTL_SECONDS
+
+
+class TestListActive:
+    """Tests for listing active games."""
+
+    async def test_newest_first(self, repo) -> None:
+        for game_id in ("g1", "g2", "g3"):
+            await _register(repo, game_id)
+
+        games = await repo.list_active()
+
+        assert [g.game_id for g in games] == ["g3", "g2", "g1"]
+
+    async def test_filters(self, repo) -> None:
+        await _register(repo, "g1", speed="lightning")
+        await _register(repo, "g2", game_type="campaign")
+        await _register(repo, "g3", player_count=4, players=_make_players(4))
+
+        assert [g.game_id for g in await repo.list_active(speed="lightning")] == ["g1"]
+        assert [g.game_id for g in await repo.list_active(game_type="campaign")] == ["g2"]
+        assert [g.game_id for g in await repo.list_active(player_count=4)] == ["g3"]
+
+    async def test_limit(self, repo) -> None:
+        for i in range(5):
+            await _register(repo, f"g{i}")
+
+        games = await repo.list_active(limit=2)
+
+        assert [g.game_id for g in games] == ["g4", "g3"]
+
+    async def test_pages_through_index_for_filters(self, repo, monkeypatch) -> None:
+        monkeypatch.setattr(active_games, "LIST_PAGE_SIZE", 2)
+        await _register(repo, "g0", speed="lightning")
+        for i in range(1, 6):
+            await _register(repo, f"g{i}")
+
+        games = await repo.list_active(speed="lightning", limit=1)
+
+        assert [g.game_id for g in games] == ["g0"]
+
+    async def test_stops_paging_at_limit(self, repo, redis, monkeypatch) -> None:
+        monkeypatch.setattr(active_games, "LIST_PAGE_SIZE", 2)
+        for i in range(6):
+            await _register(repo, f"g{i}")
+        await redis.delete("active_games:game:g0")
+
+        games = await repo.list_active(limit=2)
+
+        assert [g.game_id for g in games] == ["g5", "g4"]
+        # The oldest page was never read, so its expired entry is still indexed
+        assert "g0" in await redis.zrange("active_games:by_start", 0, -1)
+
+    async def test_prunes_expired_entries(self, repo, redis) -> None:
+        await _register(repo, "g1")
+        await _register(repo, "g2")
+        await redis.delete("active_games:game:g1")
+
+        games = await repo.list_active()
+
+        assert [g.game_id for g in games] == ["g2"]
+        assert await redis.zrange("active_games:by_start", 0, -1) == ["g2"]
+
+    async def test_cached_between_polls(self, repo, redis) -> None:
+        await _register(repo, "g1")
+        await repo.list_active()
+        # A change made behind the repository's back is not seen until expiry
+        await redis.delete("active_games:game:g1")
+
+        assert [g.game_id for g in await repo.list_active()] == ["g1"]
+        assert await repo.list_active(speed="lightning") == []
+
+    async def test_cache_expires(self, repo, redis, monkeypatch) -> None:
+        await _register(repo, "g1")
+        await repo.list_active()
+        await redis.delete("active_games:game:g1")
+        monkeypatch.setattr(active_games, "LIST_CACHE_TTL_SECONDS", 0.0)
+
+        assert await repo.list_active() == []
+
+    async def test_writes_clear_cache(self, repo) -> None:
+        await _register(repo, "g1")
+        await repo.list_active()
+
+        await _register(repo, "g2")
+        assert [g.game_id for g in await repo.list_active()] == ["g2", "g1"]
+
+        await repo.deregister("g2")
+        assert [g.game_id for g in await repo.list_active()] == ["g1"]
+
+
+class TestDeregister:
+    """Tests for removing active games."""
+
+    async def test_deregister(self, repo, redis) -> None:
+        await _register(repo, "g1")
+
+        assert await repo.deregister("g1") is True
+        assert await repo.deregister("g1") is False
+        assert await repo.list_active() == []
+        assert await redis.smembers("active_games:by_server:server-a") == set()
+
+    async def test_deregister_many(self, repo) -> None:
+        for game_id in ("g1", "g2", "g3"):
+            await _register(repo, game_id)
+
+        removed = await repo.deregister_many(["g1", "g3", "missing"])
+
+        assert removed == 2
+        assert [g.game_id for g in await repo.list_active()] == ["g2"]
+
+    async def test_deregister_many_empty(self, repo) -> None:
+        assert await repo.deregister_many([]) == 0
+
+
+class TestCleanup:
+    """Tests for crash and restart cleanup."""
+
+    async def test_cleanup_stale(self, repo, redis) -> None:
+        await _register(repo, "old")
+        await _register(repo, "new")
+        await redis.zadd("active_games:by_start", {"old": 0})
+
+        removed = await repo.cleanup_stale(max_age_hours=2)
+
+        assert removed == 1
+        assert [g.game_id for g in await repo.list_active()] == ["new"]
+
+    async def test_cleanup_by_server(self, repo, redis) -> None:
+        await _register(repo, "g1", server_id="server-a")
+        await _register(repo, "g2", server_id="server-b")
+        await _register(repo, "g3", server_id="server-a")
+
+        removed = await repo.cleanup_by_server("server-a")
+
+        assert removed == 2
+        assert [g.game_id for g in await repo.list_active()] == ["g2"]
+        assert not await redis.exists("active_games:by_server:server-a")
@@ -1,7 +1,7 @@
 """Tests for the ReplayRepository."""
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 
@@ -112,6 +112,45 @@ class TestReplayRepositoryRecordConversion:
         with pytest.raises(ValueError, match="Invalid speed or board_type"):
             repository._record_to_replay(record)
 
+    def test_summary_conversion_skips_moves(self):
+        """Test that deferred moves are never touched when excluded."""
+        record = MagicMock(spec=GameReplay)
+        record.id = "TESTGAME"
+        record.speed = "standard"
+        record.board_type = "standard"
+        record.players = {"1": "player1", "2": "player2"}
+        type(record).moves = PropertyMock(side_effect=AssertionError("moves loaded"))
+        record.total_ticks = 100
+        record.winner = 1
+        record.win_reason = "king_captured"
+        record.created_at = datetime(2025, 1, 21, 12, 0, 0)
+
+        repository = ReplayRepository(MagicMock())
+        replay = repository._record_to_replay(record, include_moves=False)
+
+        assert replay.moves == []
+        assert replay.total_ticks == 100
+
+
+class TestReplayRepositoryListing:
+    """Tests for the list queries."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["list_recent", "list_top"])
+    async def test_list_queries_do_not_select_moves(self, method):
+        """Test that list views leave the moves column in the database."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = []
+        repository = ReplayRepository(session)
+
+        await getattr(repository, method)()
+
+        stmt = session.execute.call_args[0][0]
+        selected = stmt.compile(compile_kwargs={"literal_binds": True}).string
+        assert "game_replays.moves" not in selected
+        assert "game_replays.players" in selected
+
 
 class TestReplayRepositorySave:
     """Tests for save operations."""
@@ -1,5 +1,6 @@
 """Tests for S3 profile picture upload service."""
 
+from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,8 +8,10 @@ import pytest
 from clutchchess.services.s3 import (
     ALLOWED_CONTENT_TYPES,
     MAX_FILE_SIZE,
+    S3_MAX_POOL_CONNECTIONS,
     S3UploadError,
     _detect_content_type,
+    _get_s3_client,
     upload_profile_picture,
 )
 
@@ -70,26 +73,26 @@ class TestUploadProfilePicture:
 
     def test_rejects_empty_file(self):
         with pytest.raises(ValueError, match="empty"):
-            upload_profile_picture(b"", "image/png")
+            upload_profile_picture(BytesIO(b""), "image/png")
 
     def test_rejects_file_too_large(self):
         data = b"\x89PNG\r\n\x1a\n" + b"x" * MAX_FILE_SIZE
         with pytest.raises(ValueError, match="exceeds maximum"):
-            upload_profile_picture(data, "image/png")
+            upload_profile_picture(BytesIO(data), "image/png")
 
     def test_rejects_invalid_content_type(self):
         with pytest.raises(ValueError, match="not allowed"):
-            upload_profile_picture(b"data", "text/plain")
+            upload_profile_picture(BytesIO(b"data"), "text/plain")
 
     def test_rejects_mismatched_magic_bytes(self):
         # Claim PNG but send JPEG bytes
         with pytest.raises(ValueError, match="does not match"):
-            upload_profile_picture(VALID_JPEG, "image/png")
+            upload_profile_picture(BytesIO(VALID_JPEG), "image/png")
 
     def test_rejects_fake_content_type(self):
         # Claim image/png but send HTML
         with pytest.raises(ValueError, match="does not match"):
-            upload_profile_picture(b"<html>xss</html>", "image/png")
+            upload_profile_picture(BytesIO(b"<html>xss</html>"), "image/png")
 
     @pytest.mark.parametrize("content_type", sorted(ALLOWED_CONTENT_TYPES))
     def test_accepts_valid_content_types(self, content_type):
@@ -99,7 +102,7 @@ class TestUploadProfilePicture:
                 mock_client = MagicMock()
                 mock_get_client.return_value = mock_client
 
-                url = upload_profile_picture(file_bytes, content_type)
+                url = upload_profile_picture(BytesIO(file_bytes), content_type)
 
                 mock_client.put_object.assert_called_once()
                 assert "test-bucket" in url
@@ -109,7 +112,7 @@ class TestUploadProfilePicture:
         with patch("clutchchess.services.s3.get_settings") as mock_settings:
             mock_settings.return_value = MagicMock(s3_enabled=False)
             with pytest.raises(S3UploadError, match="not configured"):
-                upload_profile_picture(VALID_PNG, "image/png")
+                upload_profile_picture(BytesIO(VALID_PNG), "image/png")
 
     def test_returns_correct_url_format(self):
         settings = _mock_s3_settings()
@@ -120,7 +123,7 @@ class TestUploadProfilePicture:
             with patch("clutchchess.services.s3._get_s3_client") as mock_get_client:
                 mock_get_client.return_value = MagicMock()
 
-                url = upload_profile_picture(VALID_JPEG, "image/jpeg")
+                url = upload_profile_picture(BytesIO(VALID_JPEG), "image/jpeg")
 
                 assert url.startswith("https://s3-us-west-2.amazonaws.com/my-bucket/profile-pics/")
 
@@ -132,7 +135,7 @@ class TestUploadProfilePicture:
                 mock_get_client.return_value = mock_client
 
                 with pytest.raises(S3UploadError, match="Failed to upload"):
-                    upload_profile_picture(VALID_PNG, "image/png")
+                    upload_profile_picture(BytesIO(VALID_PNG), "image/png")
 
     def test_uploads_with_public_read_acl(self):
         with patch("clutchchess.services.s3.get_settings", return_value=_mock_s3_settings()):
@@ -140,12 +143,14 @@ class TestUploadProfilePicture:
                 mock_client = MagicMock()
                 mock_get_client.return_value = mock_client
 
-                upload_profile_picture(VALID_PNG, "image/png")
+                upload_profile_picture(BytesIO(VALID_PNG), "image/png")
 
                 call_kwargs = mock_client.put_object.call_args[1]
                 assert call_kwargs["ACL"] == "public-read"
                 assert call_kwargs["ContentType"] == "image/png"
-                assert call_kwargs["Body"] == VALID_PNG
+                assert call_kwargs["Bucket"] == "test-bucket"
+                # The file is handed over rewound, after the magic byte check
+                assert call_kwargs["Body"].read() == VALID_PNG
 
     def test_exactly_max_size_succeeds(self):
         # PNG header + padding to exactly MAX_FILE_SIZE
@@ -156,5 +161,24 @@ class TestUploadProfilePicture:
             with patch("clutchchess.services.s3._get_s3_client") as mock_get_client:
                 mock_get_client.return_value = MagicMock()
 
-                url = upload_profile_picture(file_bytes, "image/png")
+                url = upload_profile_picture(BytesIO(file_bytes), "image/png")
                 assert "profile-pics/" in url
+
+
+class TestGetS3Client:
+    """Tests for the shared boto3 client."""
+
+    def test_client_is_created_once_with_pool_config(self):
+        with (
+            patch("clutchchess.services.s3.get_settings", return_value=_mock_s3_settings()),
+            patch("clutchchess.services.s3._s3_client", None),
+            patch("clutchchess.services.s3.boto3.client") as mock_boto_client,
+        ):
+            first = _get_s3_client()
+            second = _get_s3_client()
+
+        assert first is second
+        mock_boto_client.assert_called_once()
+        config = mock_boto_client.call_args[1]["config"]
+        assert config.max_pool_connections == S3_MAX_POOL_CONNECTIONS
+        assert config.tcp_keepalive is True
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
+from clutchchess.api import users as users_api
 from clutchchess.auth.dependencies import get_required_user_with_dev_bypass, get_user_manager_dep
 from clutchchess.main import app
 from clutchchess.services.s3 import MAX_FILE_SIZE, S3UploadError
@@ -146,3 +147,38 @@ class TestUploadPicture:
             )
 
         assert response.status_code == 200
+
+    def test_upload_passes_rewound_file_not_bytes(self, client: TestClient) -> None:
+        updated_user = _make_user(picture_url="https://example.com/pic.png")
+
+        mock_um = app.dependency_overrides[get_user_manager_dep]()
+        mock_um.update = AsyncMock(return_value=updated_user)
+
+        received = {}
+
+        def fake_upload(file_obj, content_type):
+            received["data"] = file_obj.read()
+            return "https://example.com/pic.png"
+
+        data = b"\x89PNG\r\n\x1a\n" + b"\x00" * 40_000
+        with patch("clutchchess.api.users.upload_profile_picture", side_effect=fake_upload):
+            response = client.post(
+                "/api/users/me/picture",
+                files={"file": ("avatar.png", BytesIO(data), "image/png")},
+            )
+
+        assert response.status_code == 200
+        assert received["data"] == data
+
+    def test_upload_slot_released_after_failure(self, client: TestClient) -> None:
+        with patch(
+            "clutchchess.api.users.upload_profile_picture",
+            side_effect=ValueError("File content does not match declared content type"),
+        ):
+            response = client.post(
+                "/api/users/me/picture",
+                files={"file": ("img.png", BytesIO(b"data"), "image/png")},
+            )
+
+        assert response.status_code == 400
+        assert users_api._upload_slots._value == users_api.MAX_CONCURRENT_UPLOADS
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from clutchchess.db.repositories.user_game_history import UserGameHistoryRepository
 
@@ -65,6 +66,32 @@ class TestAdd(TestUserGameHistoryRepository):
         mock_session.flush.assert_called_once()
 
 
+class TestAddMany(TestUserGameHistoryRepository):
+    """Tests for add_many method."""
+
+    async def test_add_many_single_insert(self, repository, mock_session, sample_game_info):
+        """Test that all rows go to the database in one statement."""
+        game_time = datetime.now(UTC)
+
+        await repository.add_many(
+            [(123, game_time, sample_game_info), (456, game_time, sample_game_info)]
+        )
+
+        mock_session.execute.assert_awaited_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert [row["user_id"] for row in rows] == [123, 456]
+        # Timezone is stripped for database storage
+        assert rows[0]["game_time"] == game_time.replace(tzinfo=None)
+        assert rows[0]["game_info"] == sample_game_info
+        mock_session.add.assert_not_called()
+
+    async def test_add_many_empty_is_noop(self, repository, mock_session):
+        """Test that no statement is issued when there is nothing to add."""
+        await repository.add_many([])
+
+        mock_session.execute.assert_not_called()
+
+
 class TestListByUser(TestUserGameHistoryRepository):
     """Tests for list_by_user method."""
 
@@ -107,6 +134,22 @@ class TestListByUser(TestUserGameHistoryRepository):
         # Verify execute was called (query includes offset)
         mock_session.execute.assert_called_once()
 
+    async def test_list_by_user_reuses_statement(self, repository, mock_session):
+        """Test that repeated calls share SQL and only change parameters."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.list_by_user(123, limit=10, offset=0)
+        await repository.list_by_user(456, limit=5, offset=20)
+
+        first, second = (
+            c[0][0].compile(dialect=postgresql.dialect())
+            for c in mock_session.execute.call_args_list
+        )
+        assert first.string == second.string
+        assert second.params == {"user_id_1": 456, "limit_1": 5, "offset_1": 20}
+
 
 class TestCountByUser(TestUserGameHistoryRepository):
     """Tests for count_by_user method."""
@@ -132,3 +175,50 @@ class TestCountByUser(TestUserGameHistoryRepository):
         count = await repository.count_by_user(999)
 
         assert count == 0
+
+
+class TestListByUserWithTotal(TestUserGameHistoryRepository):
+    """Tests for list_by_user_with_total method."""
+
+    async def test_returns_entries_and_window_total(self, repository, mock_session):
+        """Test that the total comes from the same query as the entries."""
+        mock_entry = MagicMock()
+        row = MagicMock()
+        row.__getitem__.return_value = mock_entry
+        row.total = 42
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [row]
+        mock_session.execute.return_value = mock_result
+
+        entries, total = await repository.list_by_user_with_total(123, limit=10, offset=0)
+
+        assert entries == [mock_entry]
+        assert total == 42
+        mock_session.execute.assert_called_once()
+
+    async def test_empty_first_page_skips_count(self, repository, mock_session):
+        """Test that a user with no games costs a single query."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        entries, total = await repository.list_by_user_with_total(999)
+
+        assert entries == []
+        assert total == 0
+        mock_session.execute.assert_called_once()
+
+    async def test_offset_past_end_falls_back_to_count(self, repository, mock_session):
+        """Test that an empty page past the end still reports the real total."""
+        empty_result = MagicMock()
+        empty_result.all.return_value = []
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 25
+        mock_session.execute.side_effect = [empty_result, count_result]
+
+        entries, total = await repository.list_by_user_with_total(123, limit=10, offset=30)
+
+        assert entries == []
+        assert total == 25
+        assert mock_session.execute.call_count == 2
@@ -1,11 +1,14 @@
 """Tests for display name utilities."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from clutchchess.utils.display_name import (
+    _USER_INFO_QUERY,
     PlayerDisplay,
+    _fetch_user_info,
     _resolve_from_info,
     _UserInfo,
     extract_user_ids,
@@ -94,6 +97,11 @@ class TestExtractUserIds:
         result = extract_user_ids(["guest:abc", "bot:dummy"])
         assert result == []
 
+    def test_bare_user_ids(self) -> None:
+        """Should pass bare int user IDs through without parsing."""
+        result = extract_user_ids([7, "u:8", "guest:abc"])
+        assert result == [7, 8]
+
 
 class TestResolveFromInfo:
     """Tests for _resolve_from_info function."""
@@ -149,6 +157,14 @@ class TestResolveFromInfo:
         result = _resolve_from_info({}, {})
         assert result == {}
 
+    def test_bare_user_id(self) -> None:
+        """Should resolve a bare int the same way as its u: form."""
+        info_map = {42: _UserInfo("alice", "https://pic.com/a.jpg")}
+        result = _resolve_from_info({1: 42, 2: "u:42", 3: 99}, info_map)
+        assert result[1] == result[2]
+        assert result[1].user_id == 42
+        assert result[3].name == "User 99"
+
 
 class TestResolvePlayerInfo:
     """Tests for resolve_player_info async function."""
@@ -207,3 +223,36 @@ class TestResolvePlayerInfoBatch:
         with patch("clutchchess.utils.display_name._fetch_user_info", return_value={}):
             result = await resolve_player_info_batch(mock_session, [])
         assert result == []
+
+
+class TestFetchUserInfo:
+    """Tests for _fetch_user_info."""
+
+    @pytest.mark.asyncio
+    async def test_skips_query_for_no_ids(self) -> None:
+        """Should not hit the database when there are no user IDs."""
+        mock_session = AsyncMock()
+        assert await _fetch_user_info(mock_session, []) == {}
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_binds_ids_as_single_array(self) -> None:
+        """Should run the same statement with the IDs as one array parameter."""
+        mock_session = AsyncMock()
+        row = MagicMock(id=1, username="alice", picture_url=None)
+        mock_result = MagicMock()
+        mock_result.all.return_value = [row]
+        mock_session.execute.return_value = mock_result
+
+        result = await _fetch_user_info(mock_session, [1, 2, 3])
+
+        statement, params = mock_session.execute.call_args[0]
+        assert statement is _USER_INFO_QUERY
+        assert params == {"user_ids": [1, 2, 3]}
+        assert result[1].username == "alice"
+
+    def test_query_uses_any_not_in(self) -> None:
+        """The compiled SQL should not depend on the number of IDs."""
+        sql = str(_USER_INFO_QUERY.compile(dialect=postgresql.dialect()))
+        assert "= ANY (" in sql
+        assert " IN " not in sql